@@ -0,0 +1,333 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CBatchBuilder.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the batch mode: the documentations of several repositories are built in one process.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, sys, time, json
+import colorama as col
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from GenPackageDoc.CBuildDaemon import _InitBuildWorker, _BuildInWorker
+
+from PythonExtensionsCollection.String.CString import CString
+from PythonExtensionsCollection.File.CFile import CFile
+
+col.init(autoreset=True)
+COLBR = col.Style.BRIGHT + col.Fore.RED
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+COLBG = col.Style.BRIGHT + col.Fore.GREEN
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CBatchBuilder():
+   """
+The ``CBatchBuilder`` class implements the batch mode of **GenPackageDoc** (command line parameter ``--batch``).
+
+The batch contains repository folders and batch manifest files. A batch manifest is a JSON file (lines starting with '#' are comments;
+the reference for relative paths is the position of the manifest file) with the keys:
+
+* ``REPOSITORIES`` (required): list of repository folders. Instead of a folder a dictionary can be given, containing the
+  folder (``REPOSITORY``) and additional command line arguments for this repository (``ARGUMENTS``).
+* ``ARGUMENTS`` (optional): command line arguments for all repositories of the manifest.
+* ``CACHEFOLDER`` (optional): cache folder shared by all repositories of the manifest (see command line parameter ``--cachefolder``).
+
+All builds are scheduled across one pool of worker processes (command line parameter ``--workers``). Conversion engines and
+PlantUML services are kept alive within the worker processes over all builds. The console output of every build is printed
+as soon as the build is completed; at the end a summary of all builds is printed.
+   """
+
+   def __init__(self, CRepositoryConfigClass=None, listBatchItems=[], listCmdLineArgs=[], nWorkers=2):
+      """
+Constructor of class ``CBatchBuilder``.
+
+**Arguments:**
+
+* ``CRepositoryConfigClass``
+
+  / *Condition*: required / *Type*: class /
+
+  The repository configuration class (``CRepositoryConfig``); an instance is created for every repository.
+
+* ``listBatchItems``
+
+  / *Condition*: required / *Type*: list /
+
+  Repository folders and batch manifest files.
+
+* ``listCmdLineArgs``
+
+  / *Condition*: optional / *Type*: list / *Default*: [] /
+
+  Command line arguments for all repositories.
+
+* ``nWorkers``
+
+  / *Condition*: optional / *Type*: int / *Default*: 2 /
+
+  Number of worker processes (builds executed in parallel).
+      """
+
+      sMethod = "CBatchBuilder.__init__"
+
+      if nWorkers < 1:
+         bSuccess = False
+         sResult  = f"Invalid number of workers: {nWorkers}. Expected is a positive number."
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      self.__CRepositoryConfigClass = CRepositoryConfigClass
+      self.__listBatchItems  = list(listBatchItems)
+      self.__listCmdLineArgs = list(listCmdLineArgs)
+      self.__nWorkers        = nWorkers
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __ReadManifest(self, sManifestFile=None):
+      """Reads a batch manifest file. Returns the list of builds (tuples of repository folder and command line arguments).
+      """
+
+      sMethod = "CBatchBuilder.__ReadManifest"
+
+      oManifestFile = CFile(sManifestFile)
+      listLines, bSuccess, sResult = oManifestFile.ReadLines(bSkipBlankLines=True, sComment='#')
+      del oManifestFile
+      if bSuccess is not True:
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      try:
+         dictManifest = json.loads("\n".join(listLines))
+      except Exception as reason:
+         bSuccess = None
+         sResult  = str(reason) + f" - while parsing JSON content of '{sManifestFile}'"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      if ( (isinstance(dictManifest, dict) is False) or (isinstance(dictManifest.get('REPOSITORIES'), list) is False) ):
+         bSuccess = False
+         sResult  = f"Missing list 'REPOSITORIES' in batch manifest '{sManifestFile}'"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      listUnexpectedKeys = [sKey for sKey in dictManifest if sKey not in ("REPOSITORIES", "ARGUMENTS", "CACHEFOLDER")]
+      if len(listUnexpectedKeys) > 0:
+         bSuccess = False
+         sResult  = f"Unexpected key(s) {listUnexpectedKeys} in batch manifest '{sManifestFile}'. Expected are 'REPOSITORIES', 'ARGUMENTS' and 'CACHEFOLDER'."
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      sReferencePathAbs = os.path.dirname(sManifestFile)
+      listManifestArgs = list(dictManifest.get('ARGUMENTS', []))
+      if dictManifest.get('CACHEFOLDER') is not None:
+         sCacheFolder = CString.NormalizePath(sPath=dictManifest['CACHEFOLDER'], sReferencePathAbs=sReferencePathAbs)
+         listManifestArgs = ["--cachefolder", sCacheFolder] + listManifestArgs
+
+      listBuilds = []
+      for oItem in dictManifest['REPOSITORIES']:
+         if isinstance(oItem, dict) is True:
+            sRepository = oItem.get('REPOSITORY')
+            listItemArgs = list(oItem.get('ARGUMENTS', []))
+         else:
+            sRepository = oItem
+            listItemArgs = []
+         if isinstance(sRepository, str) is False:
+            bSuccess = False
+            sResult  = f"Invalid repository {oItem} in batch manifest '{sManifestFile}'"
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         sRepository = CString.NormalizePath(sPath=sRepository, sReferencePathAbs=sReferencePathAbs)
+         listBuilds.append((sRepository, listManifestArgs + listItemArgs))
+
+      bSuccess = True
+      sResult  = f"{len(listBuilds)} repositories found in '{sManifestFile}'"
+      return listBuilds, bSuccess, sResult
+
+   # eof def __ReadManifest(self, sManifestFile=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetBuilds(self):
+      """Computes the list of builds (tuples of repository folder and command line arguments) out of the batch items.
+      """
+
+      sMethod = "CBatchBuilder.__GetBuilds"
+
+      listBuilds = []
+      for sBatchItem in self.__listBatchItems:
+         sBatchItem = CString.NormalizePath(sPath=sBatchItem, sReferencePathAbs=os.getcwd())
+         if os.path.isfile(sBatchItem) is True:
+            listManifestBuilds, bSuccess, sResult = self.__ReadManifest(sBatchItem)
+            if bSuccess is not True:
+               return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            listBuilds.extend(listManifestBuilds)
+         else:
+            listBuilds.append((sBatchItem, []))
+
+      setRepositories = set()
+      for sRepository, listArguments in listBuilds:
+         if os.path.isfile(f"{sRepository}/config/repository_config.json") is False:
+            bSuccess = False
+            sResult  = f"'{sRepository}' is neither a batch manifest nor a repository (file 'config/repository_config.json' not found)"
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         if sRepository in setRepositories:
+            bSuccess = False
+            sResult  = f"Repository '{sRepository}' is listed twice"
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         setRepositories.add(sRepository)
+
+      bSuccess = True
+      sResult  = f"{len(listBuilds)} repositories"
+      return listBuilds, bSuccess, sResult
+
+   # eof def __GetBuilds(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __PrintSummary(self, listSummary=[], fDuration=0.0, nWorkers=1):
+      """Prints the repository, the state, the duration and the worker process of every build.
+      """
+      nJust = max([len(sRepository) for sRepository, dictResult in listSummary] + [len("Repository")])
+      print()
+      print(COLBY + "Batch summary:")
+      print()
+      print(f"{'Repository'.ljust(nJust)} | {'State':<9} | {'Duration':>10} | Worker")
+      print(f"{'-' * nJust}-+-{'-' * 9}-+-{'-' * 10}-+-------")
+      for sRepository, dictResult in listSummary:
+         if dictResult['SUCCESS'] is True:
+            sState = "done"
+         elif dictResult['SUCCESS'] is False:
+            sState = "error"
+         else:
+            sState = "exception"
+         sLine = f"{sRepository.ljust(nJust)} | {sState:<9} | {dictResult['DURATION']:>8.2f} s | {dictResult['WORKER']}"
+         print(sLine if dictResult['SUCCESS'] is True else COLBR + sLine)
+      print()
+      fTotal = sum([dictResult['DURATION'] for sRepository, dictResult in listSummary])
+      print(f"{len(listSummary)} build(s): {fTotal:.2f} s build time, {fDuration:.2f} s elapsed ({nWorkers} workers)")
+      print()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Build(self):
+      """
+Builds the documentations of all repositories of the batch.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not (``False`` in case of at least one build failed).
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CBatchBuilder.Build"
+
+      listBuilds, bSuccess, sResult = self.__GetBuilds()
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      if len(listBuilds) == 0:
+         bSuccess = False
+         sResult  = "No repositories to build"
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      nWorkers = min(self.__nWorkers, len(listBuilds))
+      print(COLBY + f"Building {len(listBuilds)} repositories with {nWorkers} workers ...")
+      print()
+
+      fStart = time.time()
+      dictResults = {}
+      oExecutor = ProcessPoolExecutor(max_workers=nWorkers, initializer=_InitBuildWorker, initargs=(self.__CRepositoryConfigClass,))
+      try:
+         dictFutures = {}
+         for sRepository, listArguments in listBuilds:
+            dictRequest = {}
+            dictRequest['REPOSITORY']  = sRepository
+            dictRequest['ARGUMENTS']   = self.__listCmdLineArgs + listArguments
+            dictRequest['ENVIRONMENT'] = dict(os.environ)
+            dictFutures[oExecutor.submit(_BuildInWorker, dictRequest)] = sRepository
+         for oFuture in as_completed(dictFutures):
+            sRepository = dictFutures[oFuture]
+            dictResult  = oFuture.result()
+            dictResults[sRepository] = dictResult
+            print(COLBY + f"==== {sRepository} ({len(dictResults)}/{len(listBuilds)}) ====")
+            print()
+            print(dictResult['STDOUT'], end='')
+            sys.stderr.write(dictResult['STDERR'])
+            if dictResult['SUCCESS'] is True:
+               print(COLBY + dictResult['RESULT'])
+            else:
+               print(COLBR + dictResult['RESULT'])
+            print()
+      except KeyboardInterrupt:
+         print()
+         print(COLBY + "Batch interrupted; waiting for running builds ...")
+         oExecutor.shutdown(wait=True, cancel_futures=True)
+         bSuccess = False
+         sResult  = f"Batch interrupted after {len(dictResults)} of {len(listBuilds)} builds"
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      except Exception as ex:
+         oExecutor.shutdown(wait=True, cancel_futures=True)
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      oExecutor.shutdown(wait=True)
+
+      listSummary = [(sRepository, dictResults[sRepository]) for sRepository, listArguments in listBuilds]
+      self.__PrintSummary(listSummary, time.time() - fStart, nWorkers)
+
+      nFailed = len([sRepository for sRepository, dictResult in listSummary if dictResult['SUCCESS'] is not True])
+      if nFailed > 0:
+         bSuccess = False
+         sResult  = f"{nFailed} of {len(listBuilds)} builds failed"
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"{len(listBuilds)} repositories built"
+      return bSuccess, sResult
+
+   # eof def Build(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CBatchBuilder():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,404 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CBuildDaemon.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the build daemon: a long running process executing the documentation builds of several repositories.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, io, time, json, signal, socket, threading, contextlib, socketserver, http.server, multiprocessing.util
+import colorama as col
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from GenPackageDoc.CPackageDocConfig import CPackageDocConfig
+from GenPackageDoc.CDocBuilder import CDocBuilder
+from GenPackageDoc.CDaemonClient import GetDaemonAddress
+
+from PythonExtensionsCollection.String.CString import CString
+
+col.init(autoreset=True)
+COLBR = col.Style.BRIGHT + col.Fore.RED
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+COLBG = col.Style.BRIGHT + col.Fore.GREEN
+
+# --------------------------------------------------------------------------------------------------------------
+# Worker process functions used by CBuildDaemon and CBatchBuilder. Every worker process executes one build at a time; conversion
+# engines and PlantUML services started by a build are kept alive for the following builds of this worker. The console output
+# of a build is collected and returned to the daemon (and from there to the client) or to the batch builder.
+
+_CWorkerRepositoryConfig = None
+_dictWorkerServices      = None
+
+def _CloseWorkerServices():
+   for oService in _dictWorkerServices.values():
+      oService.Close()
+
+def _InitBuildWorker(CRepositoryConfigClass):
+   global _CWorkerRepositoryConfig, _dictWorkerServices
+   _CWorkerRepositoryConfig = CRepositoryConfigClass
+   _dictWorkerServices      = {}
+   signal.signal(signal.SIGINT, signal.SIG_IGN) # Ctrl+C is handled by the main process (daemon or batch builder)
+   multiprocessing.util.Finalize(None, _CloseWorkerServices, exitpriority=10) # worker processes do not execute 'atexit' handlers
+
+def _StartBuildWorker():
+   return os.getpid()
+
+def _BuildInWorker(dictRequest):
+   oOutput = io.StringIO()
+   oErrors = io.StringIO()
+   dictEnvironmentBefore = dict(os.environ)
+   fStart = time.time()
+   with contextlib.redirect_stdout(oOutput), contextlib.redirect_stderr(oErrors):
+      os.environ.clear()
+      os.environ.update(dictRequest['ENVIRONMENT']) # the build is executed within the environment of the client
+      try:
+         bSuccess, sResult = _BuildDocumentation(dictRequest)
+      finally:
+         os.environ.clear()
+         os.environ.update(dictEnvironmentBefore)
+   dictResult = {}
+   dictResult['SUCCESS']  = bSuccess
+   dictResult['RESULT']   = sResult
+   dictResult['STDOUT']   = oOutput.getvalue()
+   dictResult['STDERR']   = oErrors.getvalue()
+   dictResult['DURATION'] = time.time() - fStart
+   dictResult['WORKER']   = os.getpid()
+   return dictResult
+
+def _BuildDocumentation(dictRequest):
+   sMethod = "_BuildDocumentation"
+   oDocBuilder = None
+   try:
+      oRepositoryConfig = _CWorkerRepositoryConfig(f"{dictRequest['REPOSITORY']}/genpackagedoc.py")
+      oPackageDocConfig = CPackageDocConfig(oRepositoryConfig, dictRequest['ARGUMENTS'])
+      if oPackageDocConfig.Get('bWatch') is True:
+         bSuccess = False
+         sResult  = "The watch mode (--watch) is not supported by the build daemon and the batch mode"
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      oDocBuilder = CDocBuilder(oPackageDocConfig, _dictWorkerServices)
+      return oDocBuilder.Build()
+   except SystemExit:
+      # invalid command line (the usage is printed by argparse)
+      bSuccess = False
+      sResult  = f"Invalid command line arguments: {' '.join(dictRequest['ARGUMENTS'])}"
+      return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+   except Exception as ex:
+      bSuccess = None
+      sResult  = str(ex)
+      return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+   finally:
+      if oDocBuilder is not None:
+         oDocBuilder.Close()
+
+# --------------------------------------------------------------------------------------------------------------
+
+class _CDaemonRequestHandler(http.server.BaseHTTPRequestHandler):
+   """Handles the HTTP requests to the build daemon (``POST /build``, ``GET /status``).
+   """
+
+   def __SendJson(self, nStatus=200, dictContent={}):
+      bytesContent = json.dumps(dictContent).encode("utf-8")
+      self.send_response(nStatus)
+      self.send_header("Content-Type", "application/json")
+      self.send_header("Content-Length", str(len(bytesContent)))
+      self.end_headers()
+      self.wfile.write(bytesContent)
+
+   def do_GET(self):
+      if self.path != "/status":
+         self.__SendJson(404, {'SUCCESS' : False, 'RESULT' : f"Unknown request: GET {self.path}"})
+         return
+      self.__SendJson(200, self.server.oDaemon.GetStatus())
+
+   def do_POST(self):
+      if self.path != "/build":
+         self.__SendJson(404, {'SUCCESS' : False, 'RESULT' : f"Unknown request: POST {self.path}"})
+         return
+      try:
+         dictRequest = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+      except Exception as ex:
+         self.__SendJson(400, {'SUCCESS' : False, 'RESULT' : f"Invalid build request ({ex})"})
+         return
+      dictResult = self.server.oDaemon.ExecuteBuild(dictRequest)
+      self.__SendJson(200 if 'WORKER' in dictResult else 400, dictResult)
+
+   def log_message(self, format, *args):
+      pass # every build is logged by the daemon itself
+
+class _CDaemonTCPServer(http.server.ThreadingHTTPServer):
+   daemon_threads = True
+
+class _CDaemonUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+   daemon_threads = True
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CBuildDaemon():
+   """
+The ``CBuildDaemon`` class implements the daemon mode of **GenPackageDoc** (command line parameter ``--daemon``).
+
+The daemon listens at a loopback port or at a Unix socket and accepts build requests (``POST /build``, see ``CDaemonClient``).
+Every build request contains the repository, the command line arguments and the environment of the client. The builds are executed
+by a fixed number of worker processes (command line parameter ``--workers``); further requests wait for a free worker.
+The worker processes are started once: Python modules, Pandoc version, conversion engines and PlantUML services
+are kept warm over all builds.
+
+The answer to a build request is a JSON object with the keys ``SUCCESS`` (``True``, ``False`` or ``None`` in case of an exception),
+``RESULT``, ``STDOUT`` and ``STDERR`` (the console output of the build), ``DURATION`` (in seconds) and ``WORKER`` (process id).
+``GET /status`` returns the number of workers, the number of pending builds and the number of builds executed so far.
+   """
+
+   def __init__(self, CRepositoryConfigClass=None, sAddress=None, nWorkers=2):
+      """
+Constructor of class ``CBuildDaemon``.
+
+**Arguments:**
+
+* ``CRepositoryConfigClass``
+
+  / *Condition*: required / *Type*: class /
+
+  The repository configuration class (``CRepositoryConfig``); an instance is created for every build request.
+
+* ``sAddress``
+
+  / *Condition*: required / *Type*: str /
+
+  Loopback port or path of the Unix socket the daemon is listening at.
+
+* ``nWorkers``
+
+  / *Condition*: optional / *Type*: int / *Default*: 2 /
+
+  Number of worker processes (builds executed in parallel).
+      """
+
+      sMethod = "CBuildDaemon.__init__"
+
+      self.__sFamily, self.__oAddress = GetDaemonAddress(sAddress)
+      if self.__sFamily is None:
+         bSuccess = False
+         sResult  = self.__oAddress
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+      if nWorkers < 1:
+         bSuccess = False
+         sResult  = f"Invalid number of workers: {nWorkers}. Expected is a positive number."
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      self.__CRepositoryConfigClass = CRepositoryConfigClass
+      self.__nWorkers  = nWorkers
+      self.__oExecutor = None
+      self.__oLock     = threading.Lock() # executor and statistics are accessed by all request threads
+      self.__nPending  = 0
+      self.__nBuilds   = 0
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __StartWorkers(self):
+      """Starts the worker processes (before any request is accepted; worker processes are forked out of the daemon process).
+      """
+      self.__oExecutor = ProcessPoolExecutor(max_workers=self.__nWorkers, initializer=_InitBuildWorker, initargs=(self.__CRepositoryConfigClass,))
+      listFutures = [self.__oExecutor.submit(_StartBuildWorker) for nWorker in range(self.__nWorkers)]
+      for oFuture in listFutures:
+         oFuture.result()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __CreateServer(self):
+      """Creates the server listening at the address of the daemon.
+      """
+      if self.__sFamily == "tcp":
+         return _CDaemonTCPServer(("127.0.0.1", self.__oAddress), _CDaemonRequestHandler)
+      if os.path.exists(self.__oAddress) is True:
+         # socket file of a daemon that has not been stopped properly
+         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as oSocket:
+            try:
+               oSocket.connect(self.__oAddress)
+               raise OSError(f"Another build daemon is listening at '{self.__oAddress}'")
+            except (ConnectionRefusedError, FileNotFoundError):
+               os.remove(self.__oAddress)
+      oServer = _CDaemonUnixServer(self.__oAddress, _CDaemonRequestHandler)
+      os.chmod(self.__oAddress, 0o600) # builds can be requested by the owner of the daemon only
+      return oServer
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetStatus(self):
+      """
+Returns the status of the daemon.
+
+**Returns:**
+
+* ``dictStatus``
+
+  / *Type*: dict /
+
+  Number of worker processes (``WORKERS``), pending builds (``PENDING``; waiting or running) and builds executed so far (``BUILDS``).
+      """
+      with self.__oLock:
+         return {'WORKERS' : self.__nWorkers, 'PENDING' : self.__nPending, 'BUILDS' : self.__nBuilds}
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ExecuteBuild(self, dictRequest={}):
+      """
+Executes a build request by a worker process and waits for the result. Called by the request threads of the server.
+
+**Arguments:**
+
+* ``dictRequest``
+
+  / *Condition*: required / *Type*: dict /
+
+  The build request: ``REPOSITORY`` (path of the repository), ``ARGUMENTS`` (list of command line arguments),
+  ``ENVIRONMENT`` (environment variables).
+
+**Returns:**
+
+* ``dictResult``
+
+  / *Type*: dict /
+
+  The result of the build (see class description). In case of the request is invalid, only ``SUCCESS`` and ``RESULT`` are contained.
+      """
+
+      sMethod = "CBuildDaemon.ExecuteBuild"
+
+      sRepository = dictRequest.get('REPOSITORY') if isinstance(dictRequest, dict) else None
+      if ( (isinstance(sRepository, str) is False) or (os.path.isdir(sRepository) is False) or
+           (isinstance(dictRequest.get('ARGUMENTS'), list) is False) or (isinstance(dictRequest.get('ENVIRONMENT'), dict) is False) ):
+         bSuccess = False
+         sResult  = "Invalid build request. Expected are an existing 'REPOSITORY', a list of 'ARGUMENTS' and a dictionary 'ENVIRONMENT'."
+         return {'SUCCESS' : bSuccess, 'RESULT' : CString.FormatResult(sMethod, bSuccess, sResult)}
+      sArguments = " ".join(dictRequest['ARGUMENTS'])
+
+      with self.__oLock:
+         self.__nPending = self.__nPending + 1
+         oExecutor = self.__oExecutor
+      print(f"Build requested: '{sRepository}' {sArguments}")
+      try:
+         dictResult = oExecutor.submit(_BuildInWorker, dictRequest).result()
+      except BrokenProcessPool as ex:
+         # a worker process died (e.g. killed by the operating system): the workers are started again for the following builds
+         with self.__oLock:
+            if self.__oExecutor is oExecutor:
+               self.__oExecutor.shutdown(wait=False)
+               self.__StartWorkers()
+         bSuccess = None
+         sResult  = f"Worker process of the build daemon died ({ex})"
+         dictResult = {'SUCCESS' : bSuccess, 'RESULT' : CString.FormatResult(sMethod, bSuccess, sResult), 'STDOUT' : "", 'STDERR' : "",
+                       'DURATION' : 0.0, 'WORKER' : None}
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         dictResult = {'SUCCESS' : bSuccess, 'RESULT' : CString.FormatResult(sMethod, bSuccess, sResult), 'STDOUT' : "", 'STDERR' : "",
+                       'DURATION' : 0.0, 'WORKER' : None}
+      finally:
+         with self.__oLock:
+            self.__nPending = self.__nPending - 1
+            self.__nBuilds  = self.__nBuilds + 1
+
+      if dictResult['SUCCESS'] is True:
+         print(COLBG + f"Build done: '{sRepository}' ({dictResult['DURATION']:.2f} s, worker {dictResult['WORKER']})")
+      else:
+         print(COLBR + f"Build failed: '{sRepository}' ({dictResult['DURATION']:.2f} s, worker {dictResult['WORKER']})")
+      return dictResult
+
+   # eof def ExecuteBuild(self, dictRequest={}):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Run(self):
+      """
+Starts the worker processes and accepts build requests until the process is stopped (Ctrl+C). Running builds are completed
+before the daemon stops.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CBuildDaemon.Run"
+
+      oServer = None
+      try:
+         self.__StartWorkers()
+         oServer = self.__CreateServer()
+         oServer.oDaemon = self
+         print(COLBY + f"Build daemon listening at '{self.__oAddress}' ({self.__nWorkers} workers); stop with Ctrl+C")
+         print()
+         oServer.serve_forever()
+      except KeyboardInterrupt:
+         print()
+         print(COLBY + f"Stopping build daemon ({self.GetStatus()['PENDING']} pending builds) ...")
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      finally:
+         if oServer is not None:
+            oServer.server_close()
+            if self.__sFamily == "unix":
+               os.remove(self.__oAddress)
+         if self.__oExecutor is not None:
+            self.__oExecutor.shutdown(wait=True, cancel_futures=True)
+
+      bSuccess = True
+      sResult  = "Build daemon stopped"
+      return bSuccess, sResult
+
+   # eof def Run(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CBuildDaemon():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,286 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CConversionCache.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing a persistent, content addressed cache for rst to tex conversions (and for rendered diagrams).
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, sys, json, hashlib, tempfile
+import colorama as col
+
+from PythonExtensionsCollection.String.CString import CString
+
+col.init(autoreset=True)
+COLBR = col.Style.BRIGHT + col.Fore.RED
+COLBG = col.Style.BRIGHT + col.Fore.GREEN
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+
+# version of the cache layout; to be increased in case of the format of the cache entries changes
+CACHEFORMAT = "1"
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CConversionCache():
+   """
+The ``CConversionCache`` class stores the results of rst to tex conversions on disk. Every entry is addressed by a hash
+computed out of the rst input and the conversion settings (like name and version of the converter). Therefore an unchanged
+input returns the previously converted tex code without calling the converter again.
+
+Besides the tex code the cache is able to store binary content (like diagrams rendered by PlantUML, see ``bBinary``).
+
+The overall size of the cache is limited. In case of the limit is exceeded, the least recently used entries are deleted.
+The access time of an entry is stored in the modification time of the corresponding cache file.
+
+All files are written via a temporary file followed by an atomic replacement. Therefore several processes can share
+the same cache folder.
+   """
+
+   def __init__(self, sCacheFolder=None, nMaxSize=256, sExtension=".tex", bBinary=False):
+      """
+Constructor of class ``CConversionCache``.
+
+**Arguments:**
+
+* ``sCacheFolder``
+
+  / *Condition*: required / *Type*: str /
+
+  Path and name of the folder containing the cache entries. The folder is created in case of it does not exist.
+
+* ``nMaxSize``
+
+  / *Condition*: optional / *Type*: int / *Default*: 256 /
+
+  Maximum size of the cache in MB.
+
+* ``sExtension``
+
+  / *Condition*: optional / *Type*: str / *Default*: ".tex" /
+
+  Extension of the cache entry files.
+
+* ``bBinary``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the content of the cache entries is of type bytes (e.g. rendered pictures), otherwise of type str.
+      """
+
+      sMethod = "CConversionCache.__init__"
+
+      if sCacheFolder is None:
+         bSuccess = None
+         sResult  = "sCacheFolder is None"
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      self.__sCacheFolder = CString.NormalizePath(sCacheFolder)
+      self.__nMaxSize     = int(nMaxSize) * 1024 * 1024
+      self.__nSize        = None # computed on demand
+      self.__sExtension   = sExtension
+      self.__bBinary      = bBinary
+
+      try:
+         os.makedirs(self.__sCacheFolder, exist_ok=True)
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      self.nHits   = 0
+      self.nMisses = 0
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetKey(self, sInput="", dictSettings=None):
+      """
+Computes the key of a cache entry.
+
+**Arguments:**
+
+* ``sInput``
+
+  / *Condition*: required / *Type*: str /
+
+  The input of the conversion (rst code).
+
+* ``dictSettings``
+
+  / *Condition*: optional / *Type*: dict / *Default*: None /
+
+  All settings that have an impact on the result of the conversion (e.g. name and version of the converter).
+  The values have to be serializable in json format.
+
+**Returns:**
+
+* ``sKey``
+
+  / *Type*: str /
+
+  The hash value identifying the cache entry.
+      """
+
+      if dictSettings is None:
+         dictSettings = {}
+      sSettings = json.dumps(dictSettings, sort_keys=True)
+      oHash = hashlib.sha256()
+      oHash.update(CACHEFORMAT.encode('utf-8'))
+      oHash.update(b'\0')
+      oHash.update(sSettings.encode('utf-8'))
+      oHash.update(b'\0')
+      oHash.update(sInput.encode('utf-8'))
+      sKey = oHash.hexdigest()
+      return sKey
+
+   # eof def GetKey(self, sInput="", dictSettings=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Get(self, sKey=None):
+      """
+Returns the content of the cache entry identified by ``sKey``, or ``None`` in case of the entry does not exist.
+A successful access marks the entry as recently used.
+      """
+
+      sEntryFile = f"{self.__sCacheFolder}/{sKey}{self.__sExtension}"
+      sContent = None
+      try:
+         if self.__bBinary is True:
+            with open(sEntryFile, "rb") as hEntryFile:
+               sContent = hEntryFile.read()
+         else:
+            with open(sEntryFile, encoding="utf-8", newline='') as hEntryFile:
+               sContent = hEntryFile.read()
+         os.utime(sEntryFile, None)
+      except Exception:
+         # not existing or removed in the meantime by another process
+         sContent = None
+
+      if sContent is None:
+         self.nMisses = self.nMisses + 1
+      else:
+         self.nHits = self.nHits + 1
+      return sContent
+
+   # eof def Get(self, sKey=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Put(self, sKey=None, sContent=""):
+      """
+Stores ``sContent`` as cache entry identified by ``sKey`` and afterwards removes the least recently used entries
+in case of the cache size limit is exceeded.
+      """
+
+      sMethod = "CConversionCache.Put"
+
+      sEntryFile = f"{self.__sCacheFolder}/{sKey}{self.__sExtension}"
+      try:
+         hTmpFile, sTmpFile = tempfile.mkstemp(dir=self.__sCacheFolder, prefix=f".{sKey}.", suffix=".tmp")
+         if self.__bBinary is True:
+            with os.fdopen(hTmpFile, "wb") as hEntryFile:
+               hEntryFile.write(sContent)
+         else:
+            with os.fdopen(hTmpFile, "w", encoding="utf-8", newline='') as hEntryFile:
+               hEntryFile.write(sContent)
+         os.replace(sTmpFile, sEntryFile)
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      if self.__nSize is not None:
+         self.__nSize = self.__nSize + os.path.getsize(sEntryFile)
+
+      bSuccess, sResult = self.Evict()
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"Cache entry '{sKey}' stored"
+      return bSuccess, sResult
+
+   # eof def Put(self, sKey=None, sContent=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Evict(self):
+      """
+Removes the least recently used cache entries until the size of the cache is below the configured limit.
+      """
+
+      if ( (self.__nSize is not None) and (self.__nSize <= self.__nMaxSize) ):
+         bSuccess = True
+         sResult  = "Cache size below limit; nothing to evict"
+         return bSuccess, sResult
+
+      listEntries = []
+      nSize = 0
+      for sFileName in os.listdir(self.__sCacheFolder):
+         if not sFileName.endswith(self.__sExtension):
+            continue
+         sEntryFile = f"{self.__sCacheFolder}/{sFileName}"
+         try:
+            oStat = os.stat(sEntryFile)
+         except Exception:
+            continue # removed in the meantime by another process
+         listEntries.append((oStat.st_mtime, oStat.st_size, sEntryFile))
+         nSize = nSize + oStat.st_size
+
+      nEvicted = 0
+      if nSize > self.__nMaxSize:
+         listEntries.sort() # oldest first
+         for fMTime, nEntrySize, sEntryFile in listEntries:
+            if nSize <= self.__nMaxSize:
+               break
+            try:
+               os.remove(sEntryFile)
+               nEvicted = nEvicted + 1
+            except Exception:
+               pass # removed in the meantime by another process
+            nSize = nSize - nEntrySize
+
+      self.__nSize = nSize
+
+      bSuccess = True
+      sResult  = f"{nEvicted} cache entries evicted"
+      return bSuccess, sResult
+
+   # eof def Evict(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CConversionCache():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,532 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CConversionEngine.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the engines that convert rst code to tex code.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, sys, time, json, socket, subprocess, atexit, http.client
+import colorama as col
+import pypandoc
+
+from PythonExtensionsCollection.String.CString import CString
+
+from GenPackageDoc.CDocutilsEngine import CDocutilsEngine
+from GenPackageDoc.CProcessRunner import CProcessRunner
+
+col.init(autoreset=True)
+COLBR = col.Style.BRIGHT + col.Fore.RED
+COLBG = col.Style.BRIGHT + col.Fore.GREEN
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+
+# Lua script executed by 'pandoc lua': converts a json encoded list of rst code pieces into a json encoded list of tex code pieces
+BATCHCONVERSIONSCRIPT = """
+local listRSTCodes = pandoc.json.decode(io.read('a'), false)
+local listTEX = {}
+for nIndex, sRSTCode in ipairs(listRSTCodes) do
+   listTEX[nIndex] = pandoc.write(pandoc.read(sRSTCode, 'rst'), 'latex')
+end
+io.write(pandoc.json.encode(listTEX))
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+def GetCommandLineOutput(sTEX=""):
+   """
+The command line version of Pandoc terminates every output with a newline, the Lua interface and the server do not.
+Returns ``sTEX`` like the command line version would do.
+   """
+   if not sTEX.endswith("\n"):
+      sTEX = sTEX + "\n"
+   return sTEX
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPandocEngine():
+   """
+The ``CPandocEngine`` class converts rst code to tex code by calling Pandoc once for every conversion.
+
+This is the reference behavior. All other engines have to produce exactly the same tex code.
+   """
+
+   sName  = "pandoc"
+   bBatch = False # True: the engine benefits from getting many conversions at once
+
+   def __init__(self, oProcessRunner=None):
+      sMethod = "CPandocEngine.__init__"
+      try:
+         # try to access pandoc; if not installed we detect this already here as early as possible
+         self.sPandoc = pypandoc.get_pandoc_path()
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+      self.__dictSettings = None
+      # Pandoc is executed with the limits (timeout, memory, CPU time) of the process runner
+      self.oProcessRunner = oProcessRunner
+      if self.oProcessRunner is None:
+         self.oProcessRunner = CProcessRunner()
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetSettings(self):
+      """
+Returns all settings that have an impact on the result of the conversion (used for the key of the conversion cache).
+All Pandoc based engines produce the same output and therefore share the same settings.
+      """
+
+      if self.__dictSettings is None:
+         self.__dictSettings = {}
+         self.__dictSettings['converter'] = "pandoc"
+         self.__dictSettings['version']   = pypandoc.get_pandoc_version()
+         self.__dictSettings['from']      = "rst"
+         self.__dictSettings['to']        = "tex"
+      return self.__dictSettings
+
+   # eof def GetSettings(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Convert(self, sRSTCode=""):
+      """
+Converts a single piece of rst code to tex code.
+
+**Arguments:**
+
+* ``sRSTCode``
+
+  / *Condition*: required / *Type*: str /
+
+  The rst code to convert.
+
+**Returns:**
+
+* ``sTEX``
+
+  / *Type*: str /
+
+  The tex code.
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CPandocEngine.Convert"
+
+      listCmdLineParts = [self.sPandoc, "--from=rst", "--to=latex"]
+      oProcess, bSuccess, sResult = self.oProcessRunner.Run("PANDOC", listCmdLineParts, bytesInput=sRSTCode.encode("utf-8"))
+      if bSuccess is not True:
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      if oProcess.returncode != 0:
+         bSuccess = None
+         sResult  = f"Pandoc died with exitcode {oProcess.returncode} during conversion: {oProcess.stderr.decode('utf-8', errors='replace')}"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      sTEX = oProcess.stdout.decode("utf-8", errors="replace")
+
+      bSuccess = True
+      sResult  = "Done"
+      return sTEX, bSuccess, sResult
+
+   # eof def Convert(self, sRSTCode=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ConvertList(self, listRSTCodes=[]):
+      """
+Converts a list of rst code pieces to tex code. The result is a list of tex code pieces in the same order.
+
+**Arguments:**
+
+* ``listRSTCodes``
+
+  / *Condition*: required / *Type*: list /
+
+  The rst code pieces to convert.
+
+**Returns:**
+
+* ``listTEX``
+
+  / *Type*: list /
+
+  The tex code pieces.
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CPandocEngine.ConvertList"
+
+      listTEX = []
+      for sRSTCode in listRSTCodes:
+         sTEX, bSuccess, sResult = CPandocEngine.Convert(self, sRSTCode)
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         listTEX.append(sTEX)
+
+      bSuccess = True
+      sResult  = f"{len(listTEX)} conversions done"
+      return listTEX, bSuccess, sResult
+
+   # eof def ConvertList(self, listRSTCodes=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Start(self):
+      """
+Prepares the engine for conversions. Has to be called before copies of the engine are handed over to other processes
+(to enable them to share resources like a server process). Nothing to do for this engine.
+      """
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Close(self):
+      """
+Releases all resources of the engine.
+      """
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPandocEngine():
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPandocBatchEngine(CPandocEngine):
+   """
+The ``CPandocBatchEngine`` class converts many pieces of rst code within a single Pandoc process.
+
+The pieces of rst code are handed over to the Lua interpreter of Pandoc (``pandoc lua``) as one json encoded list. Every piece is
+read and written separately (``pandoc.read``/``pandoc.write`` with default options, like the command line version of Pandoc does),
+therefore section levels, link targets, substitutions and identifiers of one piece do not influence the other pieces.
+Only the startup of the Pandoc process is shared.
+
+In case of Pandoc reports an error (or does not support ``pandoc lua``), the engine falls back to one Pandoc call per piece of rst code.
+   """
+
+   sName  = "pandoc-batch"
+   bBatch = True
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ConvertList(self, listRSTCodes=[]):
+      """
+Converts a list of rst code pieces to tex code within a single Pandoc process (see ``CPandocEngine.ConvertList``).
+      """
+
+      if len(listRSTCodes) <= 1:
+         return CPandocEngine.ConvertList(self, listRSTCodes)
+
+      listTEX = None
+      try:
+         listCmdLineParts = [self.sPandoc, "lua", "-e", BATCHCONVERSIONSCRIPT]
+         oProcess, bSuccess, sResult = self.oProcessRunner.Run("PANDOC", listCmdLineParts, bytesInput=json.dumps(listRSTCodes).encode("utf-8"))
+         if ( (bSuccess is True) and (oProcess.returncode == 0) ):
+            listTEX = json.loads(oProcess.stdout.decode("utf-8"))
+      except Exception:
+         listTEX = None
+
+      if ( (listTEX is None) or (len(listTEX) != len(listRSTCodes)) ):
+         # A conversion per piece identifies the affected piece in case of an error within the rst code
+         # and in all other cases gives the right result anyway.
+         return CPandocEngine.ConvertList(self, listRSTCodes)
+
+      listTEX = [GetCommandLineOutput(sTEX) for sTEX in listTEX]
+
+      bSuccess = True
+      sResult  = f"{len(listTEX)} conversions done"
+      return listTEX, bSuccess, sResult
+
+   # eof def ConvertList(self, listRSTCodes=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPandocBatchEngine(CPandocEngine):
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPandocServerEngine(CPandocBatchEngine):
+   """
+The ``CPandocServerEngine`` class sends the conversions to a long running ``pandoc server`` process listening on a loopback port.
+The server is started with the first conversion and stopped by ``Close()`` (or at the end of the process).
+
+All pieces of rst code are sent within one single ``/batch`` request. Pandoc versions without server support (or a server that
+does not respond) cause a fallback to ``CPandocBatchEngine``.
+
+A copy of this engine in another process (e.g. a worker process) uses the server of the original engine, but does not own it.
+   """
+
+   sName  = "pandoc-server"
+   bBatch = True
+
+   def __init__(self, nPort=0, nTimeout=60, oProcessRunner=None):
+      """
+Constructor of class ``CPandocServerEngine``.
+
+**Arguments:**
+
+* ``nPort``
+
+  / *Condition*: optional / *Type*: int / *Default*: 0 /
+
+  Loopback port of the server. ``0`` means: any free port.
+
+* ``nTimeout``
+
+  / *Condition*: optional / *Type*: int / *Default*: 60 /
+
+  Timeout in seconds for a single request.
+
+* ``oProcessRunner``
+
+  / *Condition*: optional / *Type*: CProcessRunner / *Default*: None /
+
+  Executes Pandoc in case of the server is not available (fallback to ``CPandocBatchEngine``).
+      """
+
+      CPandocBatchEngine.__init__(self, oProcessRunner)
+      self.__nPort       = int(nPort)
+      self.__nTimeout    = int(nTimeout)
+      self.__oProcess    = None
+      self.__oConnection = None
+      self.__bAvailable  = None # None: server not yet started
+
+   def __del__(self):
+      self.Close()
+
+   def __getstate__(self):
+      # the server process and the connection belong to the process that started the server
+      dictState = self.__dict__.copy()
+      dictState['_CPandocServerEngine__oProcess']    = None
+      dictState['_CPandocServerEngine__oConnection'] = None
+      return dictState
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __StartServer(self):
+      """Starts the server and waits until it responds. Returns ``True`` in case of the server is available.
+      """
+
+      if self.__bAvailable is not None:
+         return self.__bAvailable
+
+      self.__bAvailable = False
+
+      nPort = self.__nPort
+      if nPort == 0:
+         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as oSocket:
+            oSocket.bind(("127.0.0.1", 0))
+            nPort = oSocket.getsockname()[1]
+
+      listCmdLineParts = [self.sPandoc, "server", f"--port={nPort}", f"--timeout={self.__nTimeout}"]
+      try:
+         self.__oProcess = subprocess.Popen(listCmdLineParts, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+      except Exception as ex:
+         print(COLBY + f"Pandoc server not available ({ex}); falling back to engine '{CPandocBatchEngine.sName}'")
+         print()
+         self.__oProcess = None
+         return self.__bAvailable
+      atexit.register(self.Close)
+      self.__nPort = nPort
+
+      # health check
+      fTimeout = time.time() + 5
+      while time.time() < fTimeout:
+         if self.__oProcess.poll() is not None:
+            break
+         sVersion = self.__Request("GET", "/version")
+         if sVersion is not None:
+            self.__bAvailable = True
+            break
+         time.sleep(0.1)
+
+      if self.__bAvailable is not True:
+         print(COLBY + f"Pandoc server not available; falling back to engine '{CPandocBatchEngine.sName}'")
+         print()
+         self.Close()
+
+      return self.__bAvailable
+
+   # eof def __StartServer(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __Request(self, sHTTPMethod="GET", sPath="/", oBody=None):
+      """Sends a request to the server (using a persistent connection). Returns the decoded response body,
+or ``None`` in case of an error.
+      """
+
+      dictHeaders = {"Accept" : "application/json"}
+      bytesBody = None
+      if oBody is not None:
+         bytesBody = json.dumps(oBody).encode("utf-8")
+         dictHeaders["Content-Type"] = "application/json"
+
+      for nAttempt in (1, 2): # the server may have closed a kept alive connection
+         try:
+            if self.__oConnection is None:
+               self.__oConnection = http.client.HTTPConnection("127.0.0.1", self.__nPort, timeout=self.__nTimeout)
+            self.__oConnection.request(sHTTPMethod, sPath, body=bytesBody, headers=dictHeaders)
+            oResponse = self.__oConnection.getresponse()
+            sResponse = oResponse.read().decode("utf-8")
+            if oResponse.status != 200:
+               return None
+            return sResponse
+         except Exception:
+            if self.__oConnection is not None:
+               self.__oConnection.close()
+            self.__oConnection = None
+      return None
+
+   # eof def __Request(self, sHTTPMethod="GET", sPath="/", oBody=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ConvertList(self, listRSTCodes=[]):
+      """
+Converts a list of rst code pieces to tex code within a single server request (see ``CPandocEngine.ConvertList``).
+      """
+
+      sMethod = "CPandocServerEngine.ConvertList"
+
+      if len(listRSTCodes) == 0:
+         return CPandocEngine.ConvertList(self, listRSTCodes)
+
+      if self.__StartServer() is not True:
+         return CPandocBatchEngine.ConvertList(self, listRSTCodes)
+
+      listParams = []
+      for sRSTCode in listRSTCodes:
+         listParams.append({"text" : sRSTCode, "from" : "rst", "to" : "latex"})
+
+      listTEX = None
+      sResponse = self.__Request("POST", "/batch", listParams)
+      if sResponse is not None:
+         try:
+            listTEX = []
+            for dictOutput in json.loads(sResponse):
+               listTEX.append(GetCommandLineOutput(dictOutput['output']))
+         except Exception:
+            listTEX = None
+      if ( (listTEX is None) or (len(listTEX) != len(listRSTCodes)) ):
+         # e.g. an error within one of the pieces; the batch engine handles (and identifies) it
+         return CPandocBatchEngine.ConvertList(self, listRSTCodes)
+
+      bSuccess = True
+      sResult  = f"{len(listTEX)} conversions done"
+      return listTEX, bSuccess, sResult
+
+   # eof def ConvertList(self, listRSTCodes=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Start(self):
+      """
+Starts the server (see ``CPandocEngine.Start``).
+      """
+      self.__StartServer()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Convert(self, sRSTCode=""):
+      """
+Converts a single piece of rst code to tex code (see ``CPandocEngine.Convert``).
+      """
+
+      listTEX, bSuccess, sResult = self.ConvertList([sRSTCode])
+      if bSuccess is not True:
+         return None, bSuccess, sResult
+      return listTEX[0], bSuccess, sResult
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Close(self):
+      """
+Stops the server (in case of it has been started by this engine).
+      """
+
+      if self.__oConnection is not None:
+         self.__oConnection.close()
+         self.__oConnection = None
+      if self.__oProcess is not None:
+         self.__oProcess.terminate()
+         try:
+            self.__oProcess.wait(timeout=5)
+         except Exception:
+            self.__oProcess.kill()
+         self.__oProcess = None
+
+   # eof def Close(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPandocServerEngine(CPandocBatchEngine):
+
+# --------------------------------------------------------------------------------------------------------------
+
+# all available engines (key: name of the engine like used in configuration and command line)
+CONVERSIONENGINES = {CPandocEngine.sName       : CPandocEngine,
+                     CPandocBatchEngine.sName  : CPandocBatchEngine,
+                     CPandocServerEngine.sName : CPandocServerEngine,
+                     CDocutilsEngine.sName     : CDocutilsEngine}
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,197 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CDaemonClient.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the client of the build daemon (see ``CBuildDaemon``). The client does not import the documentation builder:
+the startup of a build sent to the daemon is as short as possible.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, socket, json, http.client
+
+from PythonExtensionsCollection.String.CString import CString
+
+# --------------------------------------------------------------------------------------------------------------
+
+def GetDaemonAddress(sAddress=None):
+   """
+Interprets the address of the build daemon: a number is a loopback port (also ``localhost:<port>`` and ``127.0.0.1:<port>``),
+everything else is the path of a Unix socket.
+
+Returns a tuple ``(family, address)``: ``("tcp", port)`` or ``("unix", path)``; ``(None, error message)`` in case of the address is invalid.
+   """
+   if ( (sAddress is None) or (sAddress.strip() == "") ):
+      return None, "Empty address of the build daemon"
+   sAddress = sAddress.strip()
+   for sHost in ("localhost:", "127.0.0.1:"):
+      if sAddress.startswith(sHost) is True:
+         sAddress = sAddress[len(sHost):]
+   if sAddress.isdigit() is True:
+      nPort = int(sAddress)
+      if ( (nPort < 1) or (nPort > 65535) ):
+         return None, f"Invalid port of the build daemon: {nPort}"
+      return "tcp", nPort
+   if hasattr(socket, "AF_UNIX") is False:
+      return None, f"Unix sockets are not supported on this platform; please use a loopback port instead of '{sAddress}'"
+   return "unix", os.path.abspath(sAddress)
+
+# --------------------------------------------------------------------------------------------------------------
+
+class _CUnixHTTPConnection(http.client.HTTPConnection):
+   """HTTP connection via Unix socket.
+   """
+
+   def __init__(self, sSocket=None, timeout=None):
+      http.client.HTTPConnection.__init__(self, "localhost", timeout=timeout)
+      self.__sSocket = sSocket
+
+   def connect(self):
+      self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+      self.sock.settimeout(self.timeout)
+      self.sock.connect(self.__sSocket)
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CDaemonClient():
+   """
+The ``CDaemonClient`` class sends build requests to a running build daemon (command line parameter ``--usedaemon``).
+
+A build request contains the repository (the folder containing ``genpackagedoc.py``), the command line arguments and the environment
+of the client. The daemon answers with the result of the build together with the console output of the build.
+   """
+
+   def __init__(self, sAddress=None):
+      """
+Constructor of class ``CDaemonClient``.
+
+**Arguments:**
+
+* ``sAddress``
+
+  / *Condition*: required / *Type*: str /
+
+  Loopback port or path of the Unix socket the daemon is listening at.
+      """
+
+      self.__sFamily, self.__oAddress = GetDaemonAddress(sAddress)
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __Request(self, sRequestMethod="GET", sPath="/", dictBody=None):
+      """Sends a single request to the daemon and returns the decoded answer (exceptions are handled by the caller).
+      """
+      if self.__sFamily == "tcp":
+         oConnection = http.client.HTTPConnection("127.0.0.1", self.__oAddress, timeout=None) # builds may take a while
+      else:
+         oConnection = _CUnixHTTPConnection(self.__oAddress, timeout=None)
+      try:
+         bytesBody = None
+         dictHeaders = {}
+         if dictBody is not None:
+            bytesBody = json.dumps(dictBody).encode("utf-8")
+            dictHeaders['Content-Type'] = "application/json"
+         oConnection.request(sRequestMethod, sPath, body=bytesBody, headers=dictHeaders)
+         oResponse = oConnection.getresponse()
+         return json.loads(oResponse.read().decode("utf-8"))
+      finally:
+         oConnection.close()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Build(self, sRepository=None, listCmdLineArgs=[]):
+      """
+Sends a build request to the daemon and waits for the result.
+
+**Arguments:**
+
+* ``sRepository``
+
+  / *Condition*: required / *Type*: str /
+
+  Path of the repository (the folder containing ``genpackagedoc.py`` and ``config/repository_config.json``).
+
+* ``listCmdLineArgs``
+
+  / *Condition*: optional / *Type*: list / *Default*: [] /
+
+  Command line arguments of the build (like given to ``genpackagedoc.py``).
+
+**Returns:**
+
+* ``dictResult``
+
+  / *Type*: dict /
+
+  The result of the build (see ``CBuildDaemon``); ``None`` in case of the daemon is not reachable.
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CDaemonClient.Build"
+
+      if self.__sFamily is None:
+         bSuccess = False
+         sResult  = self.__oAddress
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      dictRequest = {}
+      dictRequest['REPOSITORY']  = os.path.abspath(sRepository)
+      dictRequest['ARGUMENTS']   = list(listCmdLineArgs)
+      dictRequest['ENVIRONMENT'] = dict(os.environ)
+      try:
+         dictResult = self.__Request("POST", "/build", dictRequest)
+      except (OSError, http.client.HTTPException) as ex:
+         bSuccess = False
+         sResult  = f"Build daemon at '{self.__oAddress}' not reachable ({ex})"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"Build executed by daemon at '{self.__oAddress}'"
+      return dictResult, bSuccess, sResult
+
+   # eof def Build(self, sRepository=None, listCmdLineArgs=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CDaemonClient():
+
+# --------------------------------------------------------------------------------------------------------------
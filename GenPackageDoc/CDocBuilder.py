@@ -30,12 +30,21 @@ Python module containing all methods to generate tex sources.
 
 # --------------------------------------------------------------------------------------------------------------
 
-import os, sys, time, shlex, subprocess, platform, shutil, re, json
+import os, sys, time, shlex, subprocess, platform, shutil, re, json, hashlib, io, contextlib, tempfile, threading, fnmatch
 import colorama as col
-import pypandoc
 
 from GenPackageDoc.CSourceParser import CSourceParser
 from GenPackageDoc.CPatterns import CPatterns
+from GenPackageDoc.CConversionCache import CConversionCache
+from GenPackageDoc.CConversionEngine import CONVERSIONENGINES
+from GenPackageDoc.CPlaceholderResolver import CPlaceholderResolver
+from GenPackageDoc.COutputWriter import COutputWriter
+from GenPackageDoc.CPlantUMLService import CPlantUMLService
+from GenPackageDoc.CPictureProcessor import CPictureProcessor
+from GenPackageDoc.CLaTeXLogParser import CLaTeXLogParser
+from GenPackageDoc.CProcessRunner import CProcessRunner
+from GenPackageDoc.CLabelIndex import CLabelIndex
+from GenPackageDoc.CPDFAssembler import CPDFAssembler
 from GenPackageDoc.version import VERSION
 
 from PythonExtensionsCollection.String.CString import CString
@@ -43,6 +52,15 @@ from PythonExtensionsCollection.File.CFile import CFile
 from PythonExtensionsCollection.Folder.CFolder import CFolder
 from PythonExtensionsCollection.Utils.CUtils import *
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+   import fcntl # POSIX
+   msvcrt = None
+except ImportError:
+   fcntl = None
+   import msvcrt # Windows
+
 col.init(autoreset=True)
 COLBR = col.Style.BRIGHT + col.Fore.RED
 COLBG = col.Style.BRIGHT + col.Fore.GREEN
@@ -52,6 +70,48 @@ COLBW = col.Style.BRIGHT + col.Fore.WHITE
 SUCCESS = 0
 ERROR   = 1
 
+# files written by the LaTeX compiler that are input of the next pass (kept between builds)
+LATEXAUXEXTENSIONS = ('.aux', '.toc', '.out', '.lof', '.lot')
+# suffix of the labels files of the shards (first page number and labels of all other shards; kept like the auxiliary files)
+SHARDLABELSSUFFIX = "_labels.tex"
+# suffix of the tex files containing a single chapter imported by '\include' (partial build, see command line parameter '--only')
+INCLUDESUFFIX = "_include"
+
+# extensions of picture files, that LaTeX (pdflatex) tries in case of a picture is referenced without extension
+PICTUREEXTENSIONS = ('.pdf', '.png', '.jpg', '.mps', '.jpeg', '.jbig2', '.jb2', '.PDF', '.PNG', '.JPG', '.JPEG', '.JBIG2', '.JB2', '.eps')
+
+# format of the diagrams rendered by PlantUML
+DIAGRAMFORMAT = "png"
+
+# name of the precompiled LaTeX format containing the static part of the preamble
+LATEXFORMATNAME = "genpackagedoc_preamble"
+
+# the LaTeX compiler runs without user interaction and stops at the first error (errors are reported as <file>:<line>: <message>)
+LATEXINTERACTIONOPTIONS = ["-interaction=nonstopmode", "-halt-on-error", "-file-line-error"]
+
+# file within the build folder capturing the console output of the LaTeX compiler (all passes)
+LATEXOUTPUTFILENAME = "latex_output.txt"
+
+# lock file within the build folder (only one documentation build at a time per build folder)
+LOCKFILENAME = ".genpackagedoc.lock"
+
+# --------------------------------------------------------------------------------------------------------------
+# Worker process functions used by CDocBuilder.__ProcessModules (in case of more than one job is requested).
+# Every worker process gets its own copy of the doc builder once at start (initializer); afterwards only the module names
+# are transferred. The console output of the modules is collected and returned to the main process.
+
+_oWorkerDocBuilder = None
+
+def _InitModuleWorker(oDocBuilder):
+   global _oWorkerDocBuilder
+   _oWorkerDocBuilder = oDocBuilder
+
+def _ProcessModulesInWorker(listModules, sRootPath):
+   oOutput = io.StringIO()
+   with contextlib.redirect_stdout(oOutput):
+      dictResults, bSuccess, sResult = _oWorkerDocBuilder.ProcessModules(listModules, sRootPath)
+   return dictResults, bSuccess, sResult, oOutput.getvalue()
+
 # --------------------------------------------------------------------------------------------------------------
 #TM***
 
@@ -65,7 +125,7 @@ Repository configuration).
 Method to execute: ``Build()``
    """
 
-   def __init__(self, oPackageDocConfig=None):
+   def __init__(self, oPackageDocConfig=None, dictSharedServices=None):
       """
 Constructor of class ``CDocBuilder``.
 
@@ -74,6 +134,13 @@ Constructor of class ``CDocBuilder``.
   / *Condition*: required / *Type*: CPackageDocConfig() /
 
   **GenPackageDoc** configuration containing static and dynamic configuration values.
+
+* ``dictSharedServices``
+
+  / *Condition*: optional / *Type*: dict / *Default*: None /
+
+  Conversion engines and PlantUML services kept alive by the caller over several builds (build daemon). Services found here are used
+  instead of starting new ones; new services are added. Shared services are not closed by the builder.
       """
 
       sMethod = "CDocBuilder.__init__"
@@ -109,9 +176,123 @@ Constructor of class ``CDocBuilder``.
 
       self.__dictScopes = {}
 
+      # The full scope strings are restored by looking up the payload of every 'section' command (see __PostprocessTEX).
+      # The full scope strings do not contain curly brackets, therefore the payload is everything up to the next closing bracket.
+      self.__oRegExSection = re.compile(r"section\{([^{}]*)\}") # this includes 'subsection'
+
+      # pictures referenced within tex code (optional arguments in square brackets are skipped); comments start with unmasked '%'
+      self.__oRegExPictureReference = re.compile(r"\\(?:includegraphics|includepdf)\s*(?:\[[^\]]*\])?\s*\{([^{}]+)\}")
+      self.__oRegExTeXComment       = re.compile(r"(?<!\\)%.*$")
+
+      # PlantUML reports errors per diagram file like: "Error line 5 in file: <path>"
+      self.__oRegExPlantUMLError = re.compile(r"Error line \d+ in file: (.+)$")
+
+      # The conversion of rst code to tex code (Pandoc) is the most time consuming part of the tex file generation.
+      # In case of a cache is configured, the result of every conversion is stored on disk, addressed by a hash of the rst input
+      # and the conversion settings. Unchanged input is taken over from cache without calling Pandoc again.
+      self.__oConversionCache = None
+      dictCache = self.__dictPackageDocConfig['CACHE']
+      if dictCache is not None:
+         self.__oConversionCache = CConversionCache(f"{dictCache['FOLDER']}/conversion", dictCache['MAXSIZE'])
+
+      # Also the diagrams rendered by PlantUML are cached (addressed by a hash of the diagram source, the PlantUML version and the output format).
+      # In case of all diagrams are cached, Java is not started at all.
+      self.__oDiagramCache = None
+      if dictCache is not None:
+         self.__oDiagramCache = CConversionCache(f"{dictCache['FOLDER']}/diagrams", dictCache['MAXSIZE'], sExtension=f".{DIAGRAMFORMAT}", bBinary=True)
+
+      # Optionally the pictures are downscaled and recompressed before they are embedded in the PDF file (see __PreprocessPictures).
+      # Also the preprocessed pictures are cached (addressed by a hash of the picture and the processing settings).
+      self.__oPictureProcessor = None
+      self.__listStagedPictures = [] # pictures (source file, destination file) staged in the build folder within the current build
+      if self.__dictPackageDocConfig['PICTUREPROCESSING'] is not None:
+         oPictureCache = None
+         if dictCache is not None:
+            oPictureCache = CConversionCache(f"{dictCache['FOLDER']}/pictures", dictCache['MAXSIZE'], sExtension=".picture", bBinary=True)
+         self.__oPictureProcessor = CPictureProcessor(self.__dictPackageDocConfig['PICTUREPROCESSING'], oPictureCache, self.__dictPackageDocConfig['nJobs'])
+
+      # The conversion engine (see CConversionEngine) defines how Pandoc is called: once per conversion, once for many conversions,
+      # or by requests to a long running Pandoc server.
+      # All external tools (Pandoc, PlantUML, LaTeX compiler) are executed by the process runner: with timeout and optional resource limits
+      # (section 'LIMITS' of the configuration). The runner also records the duration of every execution.
+      self.__oProcessRunner = CProcessRunner(self.__dictPackageDocConfig['LIMITS'])
+      self.__hBuildLock     = None # lock file of the build folder (see Build)
+
+      # In case of the caller keeps the services alive over several builds (build daemon), an engine started by a previous build is reused
+      # (the builds of the caller are executed one after another; the engine uses the process runner of the current build).
+      self.__dictSharedServices = dictSharedServices
+      sEngine = self.__dictPackageDocConfig['CONVERSION']['ENGINE']
+      if ( (self.__dictSharedServices is not None) and (("ENGINE", sEngine) in self.__dictSharedServices) ):
+         self.__oConversionEngine = self.__dictSharedServices[("ENGINE", sEngine)]
+         self.__oConversionEngine.oProcessRunner = self.__oProcessRunner
+      else:
+         self.__oConversionEngine = CONVERSIONENGINES[sEngine](oProcessRunner=self.__oProcessRunner)
+         if self.__dictSharedServices is not None:
+            self.__dictSharedServices[("ENGINE", sEngine)] = self.__oConversionEngine
+
+      # All generated files are written by the output writer: files with unchanged content are not touched
+      # (their modification time is kept for LaTeX tooling, synchronization tools and uploaders).
+      self.__oOutputWriter = COutputWriter()
+
+      # The placeholders of runtime variables (###NAME###) within docstrings and separate rst files are resolved in a single pass
+      # (the resolver is built once per build).
+      self.__oPlaceholderResolver = CPlaceholderResolver(self.__dictPackageDocConfig['dictRuntimeVariables'])
+
+      # Every build writes a manifest into the output folder, containing the fingerprints of all inputs together with the outputs
+      # generated out of them. In incremental mode the manifest of the previous build is used to regenerate only the chapters
+      # whose inputs have changed and to delete outputs that are not generated any more.
+      self.__sManifestFile      = f"{self.__dictPackageDocConfig['OUTPUT']}/_MANIFEST_{self.__dictPackageDocConfig['PACKAGENAME']}.json"
+      self.__dictManifestBefore = None # manifest of previous build
+      self.__dictManifest       = None # manifest of current build
+      self.__sConfigFingerprint = None
+      self.__bChanged           = True # anything changed compared to previous build?
+      self.__dictSourceFingerprints = {} # fingerprints of the chapter sources (kept in memory over several builds, see __GetSourceFingerprint)
+
+      # Diagrams can be rendered by a long running PlantUML service (started once, or shared with other builds).
+      self.__oPlantUMLService = None
+      dictPlantUMLService = self.__dictPackageDocConfig['PLANT_UML_SERVICE']
+      if dictPlantUMLService is not None:
+         tupleServiceKey = ("PLANT_UML_SERVICE", self.__dictPackageDocConfig['JAVA'], self.__dictPackageDocConfig['PLANT_UML'],
+                            dictPlantUMLService['PORT'], dictPlantUMLService['CONNECTIONS'])
+         if ( (self.__dictSharedServices is not None) and (tupleServiceKey in self.__dictSharedServices) ):
+            self.__oPlantUMLService = self.__dictSharedServices[tupleServiceKey]
+         else:
+            self.__oPlantUMLService = CPlantUMLService(self.__dictPackageDocConfig['JAVA'], self.__dictPackageDocConfig['PLANT_UML'],
+                                                       dictPlantUMLService['PORT'], dictPlantUMLService['CONNECTIONS'])
+            if self.__dictSharedServices is not None:
+               self.__dictSharedServices[tupleServiceKey] = self.__oPlantUMLService
+
+      # path and name of the precompiled LaTeX format within the cache (see __PrepareLaTeXFormat)
+      self.__sLaTeXFormatCacheFile = None
+
+      # Very large documentations can be compiled in several parts (shards) in parallel (section 'SHARDING'). The PDF files of the shards
+      # are assembled to one PDF file; references between the shards are resolved with the help of a label index (see __CompileShards).
+      self.__oPDFAssembler  = None
+      self.__listShards     = None # shards of the current build (None: documentation compiled as one document)
+      self.__dictShardFront = None # front matter (title page and table of contents) of a sharded documentation
+      self.__oLabelIndex    = None
+      if self.__dictPackageDocConfig['SHARDING'] is not None:
+         self.__oPDFAssembler = CPDFAssembler()
+
+      # tex files of the chapters imported by '\include' (partial build; their auxiliary files belong to the main tex file)
+      self.__listIncludedFiles = []
+
    def __del__(self):
-      pass
+      self.Close()
 
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Close(self):
+      """
+Releases all resources of the documentation builder (conversion engine, PlantUML service). Called by the destructor; in watch mode
+also in case of the builder is replaced (changed configuration). Shared services (see ``dictSharedServices``) are kept alive.
+      """
+      listSharedServices = list((self.__dict__.get("_CDocBuilder__dictSharedServices") or {}).values())
+      for sAttribute in ("_CDocBuilder__oConversionEngine", "_CDocBuilder__oPlantUMLService"):
+         oService = self.__dict__.get(sAttribute)
+         if ( (oService is not None) and (len([oShared for oShared in listSharedServices if oShared is oService]) == 0) ):
+            oService.Close()
 
    # --------------------------------------------------------------------------------------------------------------
    #TM***
@@ -168,6 +349,319 @@ Constructor of class ``CDocBuilder``.
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
+   def __GetFingerprint(self, *listParts):
+      """Computes a fingerprint (hash) out of all given parts (str or bytes).
+      """
+      oHash = hashlib.sha256()
+      for oPart in listParts:
+         if isinstance(oPart, str):
+            oPart = oPart.encode('utf-8')
+         oHash.update(oPart)
+         oHash.update(b'\0')
+      return oHash.hexdigest()
+
+   # eof def __GetFingerprint(self, *listParts):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __NeutralizeNow(self, sString=""):
+      """Replaces the current timestamp by the corresponding placeholder. The timestamp changes with every build,
+but this is not handled as change of inputs.
+      """
+      return sString.replace(self.__dictPackageDocConfig['NOW'], "###NOW###")
+
+   # eof def __NeutralizeNow(self, sString=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetTimestamp(self):
+      """Returns the timestamp written to generated files: the current time, or - in reproducible mode - the timestamp of the build (NOW),
+that does not depend on the time of the build.
+      """
+      if self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] is True:
+         return self.__dictPackageDocConfig['NOW']
+      return time.strftime('%d.%m.%Y - %H:%M:%S')
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetConfigFingerprint(self):
+      """Computes the fingerprint of all configuration values that have an impact on every chapter.
+
+Runtime variables (``PARAMS``, ``DOCUMENT``, ...) are not part of this fingerprint. They are considered separately
+for every chapter (depending on the placeholders used within the chapter).
+
+Instead of the name of the conversion engine the settings of the engine are used (engines with identical output share them).
+      """
+      tupleKeysToSkip = ('NOW', 'CWD', 'PARAMS', 'DOCUMENT', 'dictRuntimeVariables', 'PDFDEST', 'CONFIGDEST', 'CONVERSION', 'PICTUREPROCESSING',
+                         'SHARDING', 'listOnly', 'bWatch', 'bSimulateOnly', 'bIncremental', 'bLinkAssets', 'nJobs', 'sMainTexFile', 'sPDFFileName', 'sPDFFileExpected')
+      dictConfig = {}
+      for key, value in self.__dictPackageDocConfig.items():
+         if key not in tupleKeysToSkip:
+            dictConfig[key] = value
+      dictConfig['CONVERSION'] = self.__oConversionEngine.GetSettings()
+      sConfig = json.dumps(dictConfig, sort_keys=True, default=str)
+      return self.__GetFingerprint(VERSION, self.__NeutralizeNow(sConfig))
+
+   # eof def __GetConfigFingerprint(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetSourceFingerprint(self, sSourceFile=None, bPlaceholders=True):
+      """Computes the fingerprint of a chapter source file. The fingerprint covers the content of the file, the values
+of all runtime variables used inside (in case of ``bPlaceholders`` is ``True``) and the configuration.
+Returns the fingerprint together with the names of the runtime variables used inside.
+
+The fingerprints are kept in memory (the builder is reused in watch mode): files whose modification time and size have not changed
+are not read again (see also ``GetAffectedChapters``).
+      """
+      oStat = os.stat(sSourceFile)
+      tupleKey    = (sSourceFile, bPlaceholders)
+      tupleStatus = (oStat.st_mtime_ns, oStat.st_size, self.__sConfigFingerprint)
+      if tupleKey in self.__dictSourceFingerprints:
+         tupleStatusBefore, sFingerprint, listVariables = self.__dictSourceFingerprints[tupleKey]
+         if tupleStatusBefore == tupleStatus:
+            return sFingerprint, list(listVariables)
+      with open(sSourceFile, "rb") as hSourceFile:
+         bytesContent = hSourceFile.read()
+      listParts = [self.__sConfigFingerprint, bytesContent]
+      listVariables = []
+      if bPlaceholders is True:
+         dictUsedVariables = self.__oPlaceholderResolver.GetUsedVariables(bytesContent.decode('utf-8', errors='replace'))
+         for sName, sValue in dictUsedVariables.items():
+            listParts.append(f"{sName}={self.__NeutralizeNow(sValue)}")
+         listVariables = list(dictUsedVariables.keys())
+      sFingerprint = self.__GetFingerprint(*listParts)
+      self.__dictSourceFingerprints[tupleKey] = (tupleStatus, sFingerprint, list(listVariables))
+      return sFingerprint, listVariables
+
+   # eof def __GetSourceFingerprint(self, sSourceFile=None, bPlaceholders=True):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetFolderFingerprint(self, sFolder=None, sExtension=None):
+      """Computes the fingerprint of a folder out of relative path, size and modification time of all files inside
+(optionally restricted to files with extension ``sExtension``).
+      """
+      listParts = []
+      if ( (sFolder is not None) and (os.path.isdir(sFolder) is True) ):
+         for sLocalRootPath, listFolderNames, listFileNames in os.walk(sFolder):
+            listFolderNames.sort()
+            for sFileName in sorted(listFileNames):
+               if ( (sExtension is not None) and (sFileName.endswith(sExtension) is False) ):
+                  continue
+               sFile = os.path.join(sLocalRootPath, sFileName)
+               oStat = os.stat(sFile)
+               sRelPath = os.path.relpath(sFile, sFolder).replace('\\', '/')
+               listParts.append(f"{sRelPath}|{oStat.st_size}|{oStat.st_mtime_ns}")
+      return self.__GetFingerprint(*listParts)
+
+   # eof def __GetFolderFingerprint(self, sFolder=None, sExtension=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __LoadManifest(self):
+      """Reads the manifest of the previous build (if available and if created by the same version of **GenPackageDoc**).
+      """
+      self.__dictManifestBefore = None
+      if os.path.isfile(self.__sManifestFile) is True:
+         try:
+            with open(self.__sManifestFile, encoding="utf-8") as hManifestFile:
+               dictManifest = json.load(hManifestFile)
+            if dictManifest.get('VERSION') == VERSION:
+               self.__dictManifestBefore = dictManifest
+         except Exception:
+            # a broken manifest causes a complete rebuild
+            self.__dictManifestBefore = None
+
+      self.__dictManifest = {}
+      self.__dictManifest['VERSION']  = VERSION
+      self.__dictManifest['CONFIG']   = self.__sConfigFingerprint
+      self.__dictManifest['ASSETS']   = {}
+      self.__dictManifest['CHAPTERS'] = {}
+      self.__dictManifest['MAIN']     = None
+
+      if ( (self.__dictManifestBefore is None) or (self.__dictManifestBefore.get('CONFIG') != self.__sConfigFingerprint) ):
+         self.__bChanged = True
+      else:
+         self.__bChanged = False
+
+   # eof def __LoadManifest(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __SaveManifest(self):
+      """Writes the manifest of the current build to the output folder.
+      """
+
+      sMethod = "CDocBuilder.__SaveManifest"
+
+      bSuccess, sResult = self.__oOutputWriter.Write(self.__sManifestFile, json.dumps(self.__dictManifest, indent=3, sort_keys=True))
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"Manifest '{self.__sManifestFile}' written"
+      return bSuccess, sResult
+
+   # eof def __SaveManifest(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsAssetUnchanged(self, sAssetName=None, sFingerprint=None):
+      """Stores the fingerprint of an asset (e.g. the pictures folder) in the current manifest and returns ``True`` in case of
+incremental mode is active and the asset is unchanged compared to the previous build.
+      """
+      self.__dictManifest['ASSETS'][sAssetName] = sFingerprint
+      bUnchanged = False
+      if ( (self.__dictPackageDocConfig['bIncremental'] is True) and (self.__dictManifestBefore is not None) ):
+         bUnchanged = (self.__dictManifestBefore['ASSETS'].get(sAssetName) == sFingerprint)
+      if bUnchanged is False:
+         self.__bChanged = True
+      return bUnchanged
+
+   # eof def __IsAssetUnchanged(self, sAssetName=None, sFingerprint=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetUnchangedChapter(self, sChapterKey=None, sFingerprint=None, bSelected=True):
+      """In incremental mode: returns the manifest entry of the previous build belonging to chapter ``sChapterKey``, in case of the
+chapter is unchanged (same fingerprint, all outputs still available). Otherwise ``None`` is returned.
+
+Chapters not selected in a partial build (``bSelected`` is ``False``) are taken over from the previous build also in case of
+their fingerprint has changed (the fingerprint of the previous build is kept; the next build regenerates them).
+      """
+      if ( (self.__dictPackageDocConfig['bIncremental'] is not True) or (self.__dictManifestBefore is None) ):
+         return None
+      dictChapterBefore = self.__dictManifestBefore['CHAPTERS'].get(sChapterKey)
+      if dictChapterBefore is None:
+         return None
+      if ( (dictChapterBefore['FINGERPRINT'] != sFingerprint) and (bSelected is True) ):
+         return None
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      for sOutput in dictChapterBefore['OUTPUTS']:
+         if os.path.isfile(f"{sBuildFolder}/{sOutput}") is False:
+            return None
+      return dictChapterBefore
+
+   # eof def __GetUnchangedChapter(self, sChapterKey=None, sFingerprint=None, bSelected=True):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsSelected(self, *listNames):
+      """Returns ``True`` in case of a chapter is selected for a partial build (command line parameter ``--only``): one of the patterns
+matches one of the names of the chapter (name of the document part, path of the source file, name of the source file).
+Without partial build all chapters are selected.
+      """
+      listOnly = self.__dictPackageDocConfig['listOnly']
+      if listOnly is None:
+         return True
+      for sName in listNames:
+         sName = sName.replace("\\", "/")
+         for sPattern in listOnly:
+            if ( (fnmatch.fnmatchcase(sName, sPattern) is True) or (fnmatch.fnmatchcase(os.path.basename(sName), sPattern) is True) ):
+               return True
+      return False
+
+   # eof def __IsSelected(self, *listNames):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetPictureReferences(self, listOutputs=[]):
+      """Returns the paths of all pictures referenced (``\\includegraphics``, ``\\includepdf``) within the tex files of ``listOutputs``
+(relative to the build folder). Comments are ignored.
+      """
+      setPictures = set()
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      for sOutput in listOutputs:
+         if sOutput.lower().endswith('.tex') is False:
+            continue
+         try:
+            with open(f"{sBuildFolder}/{sOutput}", encoding="utf-8", errors="replace") as hTeXFile:
+               listLines = hTeXFile.read().splitlines()
+         except Exception:
+            continue # not available; LaTeX will complain
+         for sLine in listLines:
+            sLine = self.__oRegExTeXComment.sub("", sLine)
+            for oMatch in self.__oRegExPictureReference.finditer(sLine):
+               setPictures.add(oMatch.group(1).strip().strip('"'))
+      return sorted(setPictures)
+
+   # eof def __GetPictureReferences(self, listOutputs=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RegisterChapter(self, sChapterKey=None, sFingerprint=None, listOutputs=[], dictChapterInfo=None, bRegenerated=True, listVariables=[]):
+      """Adds a chapter together with its fingerprint, its outputs (relative to the build folder), the names of the runtime variables
+used inside and the pictures referenced inside to the manifest of the current build.
+      """
+      dictChapter = {}
+      dictChapter['FINGERPRINT'] = sFingerprint
+      dictChapter['OUTPUTS']     = listOutputs
+      dictChapter['CHAPTERINFO'] = dictChapterInfo
+      dictChapter['VARIABLES']   = listVariables
+      # pictures referenced within the chapter (taken over from previous build, in case of the chapter is unchanged)
+      listPictures = None
+      if ( (bRegenerated is False) and (self.__dictManifestBefore is not None) ):
+         listPictures = self.__dictManifestBefore['CHAPTERS'].get(sChapterKey, {}).get('PICTURES')
+      if listPictures is None:
+         listPictures = self.__GetPictureReferences(listOutputs)
+      dictChapter['PICTURES']    = listPictures
+      self.__dictManifest['CHAPTERS'][sChapterKey] = dictChapter
+      if bRegenerated is True:
+         self.__bChanged = True
+
+   # eof def __RegisterChapter(...):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __DeleteStaleOutputs(self):
+      """Deletes all outputs of the previous build that are not generated by the current build any more.
+      """
+
+      sMethod = "CDocBuilder.__DeleteStaleOutputs"
+
+      nDeleted = 0
+      if self.__dictManifestBefore is not None:
+         setOutputs = set()
+         for dictChapter in self.__dictManifest['CHAPTERS'].values():
+            setOutputs.update(dictChapter['OUTPUTS'])
+         sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+         for sChapterKey, dictChapterBefore in self.__dictManifestBefore['CHAPTERS'].items():
+            if sChapterKey not in self.__dictManifest['CHAPTERS']:
+               self.__bChanged = True
+            for sOutput in dictChapterBefore['OUTPUTS']:
+               sOutputFile = f"{sBuildFolder}/{sOutput}"
+               if ( (sOutput not in setOutputs) and (os.path.isfile(sOutputFile) is True) ):
+                  try:
+                     os.remove(sOutputFile)
+                  except Exception as ex:
+                     bSuccess = None
+                     sResult  = str(ex)
+                     return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+                  nDeleted = nDeleted + 1
+
+      bSuccess = True
+      sResult  = f"{nDeleted} stale outputs deleted"
+      return bSuccess, sResult
+
+   # eof def __DeleteStaleOutputs(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
    def __ResolvePlaceholders(self, listLines=[]):
       """Resolves placeholders used in packagedoc configuration (json file)
       """
@@ -177,18 +671,11 @@ Constructor of class ``CDocBuilder``.
       bSuccess = None
       sResult  = None
 
-      listLinesResolved = []
-
-      dictRuntimeVariables = self.__dictPackageDocConfig['dictRuntimeVariables']
-      for sLine in listLines:
-         sLineResolved = sLine
-         for key, value in dictRuntimeVariables.items():
-            if type(value) == str:
-               sLineResolved = sLineResolved.replace(f"###{key}###", value)
-         listLinesResolved.append(sLineResolved)
+      setUsed = set()
+      listLinesResolved = [self.__oPlaceholderResolver.Resolve(sLine, setUsed) for sLine in listLines]
 
       bSuccess = True
-      sResult  = "Placeholders resolved"
+      sResult  = f"Placeholders resolved (runtime variables used: {sorted(setUsed)})"
 
       return listLinesResolved, bSuccess, sResult
 
@@ -222,13 +709,21 @@ characters belonging to syntax of rst and LaTeX.
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
-   def __PostprocessTEX(self, listLinesTEX=[]):
+   def __PostprocessTEX(self, listLinesTEX=[], dictScopes={}):
       """Postprocessing of TEX text. This covers e.g. the computation of rst syntax extensions and also
-the recovery of the original headlines out of the intermediately used full scope strings.
+the recovery of the original headlines out of the intermediately used full scope strings (``dictScopes``).
 
 The masking of newline, newpage and vspace (rst syntax extensions) are replaced by the corresponding LaTeX commands.
       """
 
+      def RestoreHeadline(oMatch):
+         # oMatch.group(1) is the payload of the 'section' command; in case of it is a full scope string,
+         # it is replaced by the original headline (= original name of function, class or method)
+         sHeadline = dictScopes.get(oMatch.group(1))
+         if sHeadline is None:
+            return oMatch.group(0)
+         return "section{" + sHeadline.replace('_', r'\_') + "}" # LaTeX requires this masking
+
       listLinesProcessed = []
 
       for sLine in listLinesTEX:
@@ -243,31 +738,101 @@ The masking of newline, newpage and vspace (rst syntax extensions) are replaced
          # when converting the rst source code to LaTeX code.
          # Here we have to undo this replacement: We replace the full scope string in every section and subsection by the original headline.
 
-         # Pandoc adds ligatures in some cases: '--' -> '-\/-'. We do not need them. They have to be removed before we search for sKey,
-         # because sKey does not contain these ligatures.
+         # Pandoc adds ligatures in some cases: '--' -> '-\/-'. We do not need them. They have to be removed before we look up the
+         # full scope string, because the full scope string does not contain these ligatures.
          if "section{" in sLine:
             sLine = sLine.replace(r'\/', '')
-
-         for sKey in self.__dictScopes:
-            # sKey is full scope string
-            # value of sKey is original headline (= original name of function, class or method)
-            sSearch  = "section{" + sKey + "}" # this includes 'subsection'
-            sReplace = "section{" + self.__dictScopes[sKey] + "}"
-            sReplace = sReplace.replace('_', r'\_') # LaTeX requires this masking
-            sLine = sLine.replace(sSearch, sReplace)
+            sLine = self.__oRegExSection.sub(RestoreHeadline, sLine)
 
          listLinesProcessed.append(sLine)
 
       return listLinesProcessed
 
-   # eof def __PostprocessTEX(self, listLinesTEX=[]):
+   # eof def __PostprocessTEX(self, listLinesTEX=[], dictScopes={}):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __ConvertRSTToTEXList(self, listRSTCodes=[]):
+      """Converts a list of rst code pieces to tex code (with the configured conversion engine). In case of a conversion cache
+is configured, the results are taken over from cache (if available) or stored in cache (if not yet available). Only the pieces
+not found in cache are handed over to the conversion engine (all together).
+
+The cache contains the plain Pandoc output. The postprocessing (__PostprocessTEX) is applied afterwards in both cases.
+      """
+
+      sMethod = "CDocBuilder.__ConvertRSTToTEXList"
+
+      if self.__oConversionCache is None:
+         listTEX, bSuccess, sResult = self.__oConversionEngine.ConvertList(listRSTCodes)
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         return listTEX, bSuccess, sResult
+
+      dictSettings = self.__oConversionEngine.GetSettings()
+      listTEX  = []
+      listKeys = []
+      listIndicesToConvert = []
+      for nIndex, sRSTCode in enumerate(listRSTCodes):
+         sKey = self.__oConversionCache.GetKey(sRSTCode, dictSettings)
+         listKeys.append(sKey)
+         listTEX.append(self.__oConversionCache.Get(sKey))
+         if listTEX[nIndex] is None:
+            listIndicesToConvert.append(nIndex)
+
+      if len(listIndicesToConvert) > 0:
+         listTEXConverted, bSuccess, sResult = self.__oConversionEngine.ConvertList([listRSTCodes[nIndex] for nIndex in listIndicesToConvert])
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         for nIndex, sTEX in zip(listIndicesToConvert, listTEXConverted):
+            listTEX[nIndex] = sTEX
+            bSuccess, sResult = self.__oConversionCache.Put(listKeys[nIndex], sTEX)
+            if bSuccess is not True:
+               # a cache that cannot be written is no reason to break the build
+               print(COLBY + sResult)
+               print()
+
+      bSuccess = True
+      sResult  = f"{len(listTEX)} conversions done ({len(listIndicesToConvert)} not taken from cache)"
+      return listTEX, bSuccess, sResult
+
+   # eof def __ConvertRSTToTEXList(self, listRSTCodes=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetLaTeXAuxFiles(self, sJobName=None):
+      """Returns paths and names of all auxiliary files of the LaTeX compiler within the build folder (see ``LATEXAUXEXTENSIONS``),
+that belong to the job ``sJobName`` (the name of the compiled tex file without extension; together with the auxiliary files
+of the chapters imported by ``\\include``).
+      """
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      listAuxFiles = []
+      if os.path.isdir(sBuildFolder) is True:
+         for sFileName in sorted(os.listdir(sBuildFolder)):
+            sFileNameOnly, sExtension = os.path.splitext(sFileName)
+            if ( (sExtension.lower() in LATEXAUXEXTENSIONS) and
+                 ( (sFileNameOnly == sJobName) or ( (sExtension.lower() == ".aux") and (sFileNameOnly in self.__listIncludedFiles) ) ) ):
+               listAuxFiles.append(f"{sBuildFolder}/{sFileName}")
+      return listAuxFiles
+
+   def __GetLaTeXAuxFingerprint(self, sJobName=None):
+      """Computes the fingerprint of all auxiliary files of the LaTeX compiler belonging to the job ``sJobName`` (names and contents).
+The LaTeX passes have converged, in case of this fingerprint does not change any more.
+      """
+      listParts = []
+      for sAuxFile in self.__GetLaTeXAuxFiles(sJobName):
+         listParts.append(os.path.basename(sAuxFile))
+         with open(sAuxFile, "rb") as hAuxFile:
+            listParts.append(hAuxFile.read())
+      return self.__GetFingerprint(*listParts)
 
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
    def __CleanBuildFolder(self):
       """Cleans the build folder (to a avoid a mixture of current and previous results).
-The meaning of clean is: *delete*, followed by *create*.
+The meaning of clean is: *delete the content* (except the lock file, the auxiliary files of the LaTeX compiler and the labels files of the shards).
       """
 
       sMethod = "CDocBuilder.__CleanBuildFolder"
@@ -277,19 +842,29 @@ The meaning of clean is: *delete*, followed by *create*.
 
       sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
 
-      if os.path.isdir(sBuildFolder) is True:
-         print(f"* Deleting folder '{sBuildFolder}'")
-         print()
-         try:
-            shutil.rmtree(sBuildFolder)
-            pass
-         except Exception as ex:
-            bSuccess = None
-            sResult  = str(ex)
-            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      if ( (self.__dictPackageDocConfig['bIncremental'] is True) and (os.path.isdir(sBuildFolder) is True) ):
+         # in incremental mode the previous outputs are kept; stale outputs are deleted later (__DeleteStaleOutputs)
+         bSuccess = True
+         sResult  = f"Build folder '{sBuildFolder}' kept (incremental mode)"
+         return bSuccess, sResult
 
+      # The content of the build folder is deleted; the build folder itself contains the lock file of the current build (see Build).
+      # The auxiliary files of the LaTeX compiler are kept: with the auxiliary files of the previous build usually a single pass
+      # of the LaTeX compiler is sufficient (see __GenDocPDF).
       try:
-         os.makedirs(sBuildFolder)
+         os.makedirs(sBuildFolder, exist_ok=True)
+         listEntries = [sEntry for sEntry in sorted(os.listdir(sBuildFolder))
+                        if ( (sEntry != LOCKFILENAME) and (os.path.splitext(sEntry)[1].lower() not in LATEXAUXEXTENSIONS) and
+                             (sEntry.endswith(SHARDLABELSSUFFIX) is False) )]
+         if len(listEntries) > 0:
+            print(f"* Deleting content of folder '{sBuildFolder}'")
+            print()
+         for sEntry in listEntries:
+            sPath = f"{sBuildFolder}/{sEntry}"
+            if ( (os.path.isdir(sPath) is True) and (os.path.islink(sPath) is False) ):
+               shutil.rmtree(sPath)
+            else:
+               os.remove(sPath)
       except Exception as ex:
          bSuccess = None
          sResult  = str(ex)
@@ -305,8 +880,74 @@ The meaning of clean is: *delete*, followed by *create*.
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
+   def __StageFolder(self, sSourceDir=None, sDestinationDir=None, listFiles=None):
+      """Makes the content of ``sSourceDir`` available as ``sDestinationDir`` (an already existing ``sDestinationDir`` is replaced).
+In case of ``listFiles`` is not ``None``, only these files (paths relative to ``sSourceDir``) are staged.
+
+Per default the files are copied. With command line parameter ``--linkassets`` the files are hard linked instead
+(or symbolically linked, in case of the file system does not support hard links). Files are copied only in case of source
+and destination are located on different file systems; these copies are done in parallel.
+      """
+
+      sMethod = "CDocBuilder.__StageFolder"
+
+      try:
+         if os.path.isdir(sDestinationDir) is True:
+            shutil.rmtree(sDestinationDir)
+         if ( (listFiles is None) and (self.__dictPackageDocConfig['bLinkAssets'] is not True) ):
+            shutil.copytree(sSourceDir, sDestinationDir)
+            bSuccess = True
+            sResult  = "copied"
+            return bSuccess, sResult
+         os.makedirs(sDestinationDir)
+         if listFiles is None:
+            listFiles = []
+            for sLocalRootPath, listFolderNames, listFileNames in os.walk(sSourceDir):
+               for sFileName in listFileNames:
+                  listFiles.append(os.path.relpath(os.path.join(sLocalRootPath, sFileName), sSourceDir))
+         bLink = ( (self.__dictPackageDocConfig['bLinkAssets'] is True) and
+                   (os.stat(sSourceDir).st_dev == os.stat(sDestinationDir).st_dev) ) # no links to other file systems
+         listCopies = [] # (source file, destination file)
+         nLinks     = 0
+         for sFile in listFiles:
+            sSourceFile      = os.path.join(sSourceDir, sFile)
+            sDestinationFile = os.path.join(sDestinationDir, sFile)
+            os.makedirs(os.path.dirname(sDestinationFile), exist_ok=True)
+            if bLink is False:
+               listCopies.append((sSourceFile, sDestinationFile))
+               continue
+            try:
+               os.link(sSourceFile, sDestinationFile)
+            except OSError:
+               try:
+                  os.symlink(os.path.abspath(sSourceFile), sDestinationFile)
+               except OSError:
+                  listCopies.append((sSourceFile, sDestinationFile))
+                  continue
+            nLinks = nLinks + 1
+         # eof for sFile in listFiles:
+         if len(listCopies) > 0:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as oExecutor:
+               for sDummy in oExecutor.map(lambda tupleCopy: shutil.copy2(*tupleCopy), listCopies):
+                  pass
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"{nLinks} files linked, {len(listCopies)} files copied"
+      return bSuccess, sResult
+
+   # eof def __StageFolder(self, sSourceDir=None, sDestinationDir=None, listFiles=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
    def __CopyPictures(self):
-      """Copies the pictures folder to the output folder (required to keep relative paths valid also in created tex files)
+      """Copies the pictures referenced within the documentation from pictures folder to the output folder (required to keep relative paths
+valid also in created tex files). Referenced pictures that are not available are reported. In case of a reference cannot be resolved
+(e.g. because of it contains a LaTeX command), the complete pictures folder is copied.
       """
 
       sMethod = "CDocBuilder.__CopyPictures"
@@ -314,23 +955,82 @@ The meaning of clean is: *delete*, followed by *create*.
       bSuccess = None
       sResult  = "UNKNOWN"
 
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+
+      # -- all pictures referenced within the chapters (paths relative to the build folder)
+      setReferences = set()
+      for dictChapter in self.__dictManifest['CHAPTERS'].values():
+         setReferences.update(dictChapter['PICTURES'])
+
       sPicturesSourceDir = self.__dictPackageDocConfig['PICTURES']
+      sDirName = None
+      if ( (sPicturesSourceDir is not None) and (os.path.isdir(sPicturesSourceDir) is True) ):
+         sDirName = os.path.basename(sPicturesSourceDir)
+
+      # -- resolve the references (LaTeX accepts picture files without extension)
+      setFiles    = set() # relative to pictures folder
+      listMissing = []
+      bComplete   = False # copy complete pictures folder
+      for sReference in sorted(setReferences):
+         if ( ("\\" in sReference) or ("#" in sReference) ):
+            bComplete = True # e.g. a LaTeX command within the path; not resolvable here
+            continue
+         sRelPath = os.path.normpath(sReference).replace('\\', '/')
+         listCandidates = [sRelPath] + [f"{sRelPath}{sExtension}" for sExtension in PICTUREEXTENSIONS]
+         bFound = False
+         if ( (sDirName is not None) and (sRelPath.startswith(f"{sDirName}/") is True) ):
+            for sCandidate in listCandidates:
+               sFile = sCandidate[len(sDirName)+1:]
+               if os.path.isfile(f"{sPicturesSourceDir}/{sFile}") is True:
+                  setFiles.add(sFile)
+                  bFound = True
+         else:
+            # not part of the pictures folder (e.g. a diagram), expected to be available within the build folder already
+            for sCandidate in listCandidates:
+               if os.path.isfile(os.path.join(sBuildFolder, sCandidate)) is True:
+                  bFound = True
+         if bFound is False:
+            listMissing.append(sReference)
+      # eof for sReference in sorted(setReferences):
+
+      for sReference in listMissing:
+         print(COLBY + f"Picture '{sReference}' referenced within the documentation, but not found")
+      if len(listMissing) > 0:
+         print()
+
       if sPicturesSourceDir is None:
          bSuccess = True
          sResult  = f"No pictures defined, nothing to copy"
       else:
          if os.path.isdir(sPicturesSourceDir) is True:
-            # copy the pictures folder to output folder
-            sDirName = os.path.basename(sPicturesSourceDir)
-            sPicturesDestinationDir = f"{self.__dictPackageDocConfig['OUTPUT']}/{sDirName}"
-            try:
-               shutil.copytree(sPicturesSourceDir, sPicturesDestinationDir)
-            except Exception as ex:
-               bSuccess = None
-               sResult  = str(ex)
+            # copy the (referenced) pictures to output folder
+            sPicturesDestinationDir = f"{sBuildFolder}/{sDirName}"
+            listFiles = None
+            if bComplete is False:
+               listFiles = sorted(setFiles)
+            # (the settings of the picture preprocessing are part of the fingerprint: other settings require freshly staged pictures)
+            sFingerprint = self.__GetFingerprint(self.__GetFolderFingerprint(sPicturesSourceDir), json.dumps(listFiles),
+                                                 json.dumps(self.__dictPackageDocConfig['PICTUREPROCESSING'], sort_keys=True))
+            bUnchanged = self.__IsAssetUnchanged('PICTURES', sFingerprint)
+            if ( (bUnchanged is True) and (os.path.isdir(sPicturesDestinationDir) is True) ):
+               bSuccess = True
+               sResult  = f"Pictures folder '{sPicturesSourceDir}' unchanged"
+               return bSuccess, sResult
+            bSuccess, sResult = self.__StageFolder(sPicturesSourceDir, sPicturesDestinationDir, listFiles)
+            if bSuccess is not True:
                return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            listStagedFiles = listFiles
+            if listStagedFiles is None:
+               listStagedFiles = []
+               for sRootDir, listDirNames, listFileNames in os.walk(sPicturesSourceDir):
+                  for sFileName in listFileNames:
+                     listStagedFiles.append(os.path.relpath(os.path.join(sRootDir, sFileName), sPicturesSourceDir).replace('\\', '/'))
+            self.__listStagedPictures = [(f"{sPicturesSourceDir}/{sFile}", f"{sPicturesDestinationDir}/{sFile}") for sFile in sorted(listStagedFiles)]
             bSuccess = True
-            sResult  = f"Pictures folder '{sPicturesSourceDir}' copied to build folder '{sPicturesDestinationDir}'"
+            if listFiles is None:
+               sResult  = f"Pictures folder '{sPicturesSourceDir}' staged in build folder '{sPicturesDestinationDir}' ({sResult})"
+            else:
+               sResult  = f"{len(listFiles)} referenced pictures of folder '{sPicturesSourceDir}' staged in build folder '{sPicturesDestinationDir}' ({sResult})"
          else:
             bSuccess = False
             sResult  = f"Pictures folder '{sPicturesSourceDir}' does not exist"
@@ -344,6 +1044,29 @@ The meaning of clean is: *delete*, followed by *create*.
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
+   def __PreprocessPictures(self):
+      """Downscales and recompresses the pictures staged in the build folder within the current build (see section ``PICTUREPROCESSING``
+of the documentation project configuration). The pictures are read from the pictures folder (the staged pictures may be links).
+      """
+
+      sMethod = "CDocBuilder.__PreprocessPictures"
+
+      if len(self.__listStagedPictures) == 0:
+         bSuccess = True
+         sResult  = "No pictures staged, nothing to preprocess"
+         return bSuccess, sResult
+
+      bSuccess, sResult = self.__oPictureProcessor.Process(self.__listStagedPictures, self.__oOutputWriter)
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      return bSuccess, sResult
+
+   # eof def __PreprocessPictures(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
    def __RenderDiagrams(self):
       """Render all diagrams in 'DIAGRAMS' folder (with PlantUML). Diagram files are expected to have the extension '.puml'.
       """
@@ -365,10 +1088,9 @@ The meaning of clean is: *delete*, followed by *create*.
             for sLocalRootPath, listFolderNames, listFileNames in os.walk(sDiagramsSourceDir):
                for sFileName in listFileNames:
                   if sFileName.endswith('.puml'):
-                     sDiagramFile = CString.NormalizePath(os.path.join(sLocalRootPath, sFileName))
-                     if sDiagramFile not in listDiagramFiles:
-                        listDiagramFiles.append(sDiagramFile)
+                     listDiagramFiles.append(CString.NormalizePath(os.path.join(sLocalRootPath, sFileName)))
             # eof for ...
+            listDiagramFiles.sort() # every file is found only once; sorted to get a defined order
 
             nNrOfDiagramFiles = len(listDiagramFiles)
             if nNrOfDiagramFiles == 0:
@@ -376,17 +1098,13 @@ The meaning of clean is: *delete*, followed by *create*.
                sResult  = f"No diagram files found in '{sDiagramsSourceDir}'; nothing to render"
                return bSuccess, sResult
 
-            # diagram files available in diagrams folder (DIAGRAMS), therefore we need JAVA and PLANT_UML
-            # -- JAVA
-            JAVA = self.__dictPackageDocConfig['JAVA']
-            if JAVA is None:
-               bSuccess = False
-               sResult  = f"Java not configured in GenPackageDoc configuration; cannot render diagrams"
-               return bSuccess, sResult
-            if os.path.isfile(JAVA) is False:
-               bSuccess = False
-               sResult  = f"Java '{JAVA}' not found; check GenPackageDoc configuration; cannot render diagrams"
+            # in incremental mode the diagrams are rendered again only in case of the diagram sources have changed
+            if self.__IsAssetUnchanged('DIAGRAMSOURCES', self.__GetFolderFingerprint(sDiagramsSourceDir, '.puml')) is True:
+               bSuccess = True
+               sResult  = f"Diagram files in '{sDiagramsSourceDir}' unchanged; nothing to render"
                return bSuccess, sResult
+
+            # diagram files available in diagrams folder (DIAGRAMS), therefore we need PLANT_UML (and JAVA, in case of not all diagrams are cached)
             # -- PLANT_UML
             PLANT_UML = self.__dictPackageDocConfig['PLANT_UML']
             if PLANT_UML is None:
@@ -401,39 +1119,139 @@ The meaning of clean is: *delete*, followed by *create*.
             print(COLBY + "Rendering diagrams ...")
             print()
 
-            # -- render all diagrams
-            nCntDiagramFiles = 0
-            for sDiagramFile in listDiagramFiles:
-               nCntDiagramFiles = nCntDiagramFiles + 1
-               sInfo = f"* ({nCntDiagramFiles}/{nNrOfDiagramFiles}) : '{sDiagramFile}'"
-               print(sInfo)
-               print()
-               listCmdLineParts = []
-               listCmdLineParts.append(f"\"{JAVA}\"")
-               listCmdLineParts.append(f"-jar")
-               listCmdLineParts.append(f"\"{PLANT_UML}\"")
-               listCmdLineParts.append(f"\"{sDiagramFile}\"")
-
-               sCmdLine = " ".join(listCmdLineParts)
-               # -- debug
-               print("Now executing command line:\n" + sCmdLine)
-               print()
-               del listCmdLineParts
-               listCmdLineParts = shlex.split(sCmdLine)
-
+            # -- take over the rendered diagrams out of the cache (if configured)
+            #    Key: diagram source, PlantUML version (hash of the jar file) and output format. PlantUML writes the rendered diagram
+            #    next to the source file (same name, extension of the output format).
+            dictDiagramKeys  = {} # key: diagram file, value: cache key
+            listRenderFiles  = [] # diagram files to be rendered by PlantUML
+            if self.__oDiagramCache is not None:
                try:
-                  nReturn = subprocess.call(listCmdLineParts)
-                  print(f"PlantUML returned {nReturn}")
-                  print()
+                  with open(PLANT_UML, "rb") as hPlantUML:
+                     sPlantUMLHash = hashlib.sha256(hPlantUML.read()).hexdigest()
                except Exception as ex:
                   bSuccess = None
                   sResult  = str(ex)
                   return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+               dictSettings = {'plantuml' : sPlantUMLHash, 'format' : DIAGRAMFORMAT}
+               for sDiagramFile in listDiagramFiles:
+                  try:
+                     with open(sDiagramFile, encoding="utf-8", errors="replace") as hDiagramFile:
+                        sDiagramSource = hDiagramFile.read()
+                  except Exception as ex:
+                     bSuccess = None
+                     sResult  = str(ex)
+                     return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+                  sKey = self.__oDiagramCache.GetKey(sDiagramSource, dictSettings)
+                  dictDiagramKeys[sDiagramFile] = sKey
+                  bytesPicture = self.__oDiagramCache.Get(sKey)
+                  if bytesPicture is None:
+                     listRenderFiles.append(sDiagramFile)
+                     continue
+                  sPictureFile = os.path.splitext(sDiagramFile)[0] + f".{DIAGRAMFORMAT}"
+                  bSuccess, sResult = self.__oOutputWriter.Write(sPictureFile, bytesPicture)
+                  if bSuccess is not True:
+                     return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+               # eof for sDiagramFile in listDiagramFiles:
+               print(f"Diagram cache: {self.__oDiagramCache.nHits} hits, {self.__oDiagramCache.nMisses} misses")
+               print()
+            else:
+               listRenderFiles = listDiagramFiles
+
+            nNrOfRenderFiles = len(listRenderFiles)
+            nCntFailed = 0
+            if nNrOfRenderFiles > 0:
+               dictErrors    = {} # key: diagram file not rendered, value: error message
+               listJavaFiles = listRenderFiles # diagram files to be rendered by a PlantUML call ('java -jar')
+
+               # -- render the diagrams by the long running PlantUML service (if configured)
+               if self.__oPlantUMLService is not None:
+                  listSources = []
+                  for sDiagramFile in listRenderFiles:
+                     try:
+                        with open(sDiagramFile, encoding="utf-8", errors="replace") as hDiagramFile:
+                           listSources.append(hDiagramFile.read())
+                     except Exception as ex:
+                        bSuccess = None
+                        sResult  = str(ex)
+                        return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+                  listResults, bSuccess, sResult = self.__oPlantUMLService.RenderList(listSources)
+                  if bSuccess is True:
+                     listJavaFiles = []
+                     for sDiagramFile, (bytesPicture, sError) in zip(listRenderFiles, listResults):
+                        if bytesPicture is not None:
+                           sPictureFile = os.path.splitext(sDiagramFile)[0] + f".{DIAGRAMFORMAT}"
+                           bSuccess, sResult = self.__oOutputWriter.Write(sPictureFile, bytesPicture)
+                           if bSuccess is not True:
+                              return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+                        elif sError is not None:
+                           dictErrors[sDiagramFile] = sError
+                        else:
+                           listJavaFiles.append(sDiagramFile) # service not reachable any more
+                  if len(listJavaFiles) > 0:
+                     print(COLBY + f"{len(listJavaFiles)} diagrams not rendered by PlantUML service; falling back to PlantUML call")
+                     print()
+
+               # -- render the remaining diagrams by a single PlantUML call (one start of the Java VM); PlantUML renders them
+               #    in parallel (number of threads: command line parameter '--jobs'). PlantUML reports errors per diagram file.
+               if len(listJavaFiles) > 0:
+                  JAVA = self.__dictPackageDocConfig['JAVA']
+                  if JAVA is None:
+                     bSuccess = False
+                     sResult  = f"Java not configured in GenPackageDoc configuration; cannot render diagrams"
+                     return bSuccess, sResult
+                  if os.path.isfile(JAVA) is False:
+                     bSuccess = False
+                     sResult  = f"Java '{JAVA}' not found; check GenPackageDoc configuration; cannot render diagrams"
+                     return bSuccess, sResult
+                  nJobs = self.__dictPackageDocConfig['nJobs']
+                  listCmdLineParts = [JAVA, "-jar", PLANT_UML, f"-t{DIAGRAMFORMAT}", "-nbthread", str(nJobs)] + listJavaFiles
+                  print(f"Now executing command line ({len(listJavaFiles)} diagrams):\n" + " ".join(listCmdLineParts[:6]) + " ...")
+                  print()
+                  oProcess, bSuccess, sResult = self.__oProcessRunner.Run("PLANTUML", listCmdLineParts)
+                  if bSuccess is not True:
+                     return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+                  nReturn = oProcess.returncode
+                  print(f"PlantUML returned {nReturn}")
+                  print()
+                  sOutput = oProcess.stdout.decode("utf-8", errors="replace")
+                  if sOutput.strip() != "":
+                     print(sOutput)
+                  sErrors = oProcess.stderr.decode("utf-8", errors="replace")
+                  for sLine in sErrors.splitlines():
+                     oMatch = self.__oRegExPlantUMLError.search(sLine)
+                     if oMatch is not None:
+                        dictErrors[CString.NormalizePath(oMatch.group(1).strip())] = sLine.strip()
+                  if ( (nReturn != SUCCESS) and (len(dictErrors) == 0) ):
+                     print(COLBR + sErrors) # error not related to a certain diagram file
+               # eof if len(listJavaFiles) > 0:
+
+               # -- per diagram report
+               nCntDiagramFiles = 0
+               for sDiagramFile in listRenderFiles:
+                  nCntDiagramFiles = nCntDiagramFiles + 1
+                  if sDiagramFile in dictErrors:
+                     nCntFailed = nCntFailed + 1
+                     print(COLBR + f"* ({nCntDiagramFiles}/{nNrOfRenderFiles}) : '{sDiagramFile}' : failed ({dictErrors[sDiagramFile]})")
+                     continue
+                  print(f"* ({nCntDiagramFiles}/{nNrOfRenderFiles}) : '{sDiagramFile}' : rendered")
+                  # -- store the rendered diagram in cache
+                  sPictureFile = os.path.splitext(sDiagramFile)[0] + f".{DIAGRAMFORMAT}"
+                  if ( (sDiagramFile in dictDiagramKeys) and (os.path.isfile(sPictureFile) is True) ):
+                     with open(sPictureFile, "rb") as hPictureFile:
+                        bytesPicture = hPictureFile.read()
+                     bSuccess, sResult = self.__oDiagramCache.Put(dictDiagramKeys[sDiagramFile], bytesPicture)
+                     if bSuccess is not True:
+                        return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+               print()
+               if nCntFailed > 0:
+                  print(COLBR + f"{nCntFailed} of {nNrOfRenderFiles} diagrams not rendered")
+                  print()
+            # eof if nNrOfRenderFiles > 0:
 
-            # eof for sDiagramFile in listDiagramFiles:
+            nCntDiagramFiles = nNrOfDiagramFiles
 
             bSuccess = True
-            sResult  = f"{nCntDiagramFiles} diagrams within '{sDiagramsSourceDir}' rendered"
+            sResult  = f"{nCntDiagramFiles - nCntFailed} of {nCntDiagramFiles} diagrams within '{sDiagramsSourceDir}' rendered"
          else:
             bSuccess = False
             sResult  = f"Diagrams folder '{sDiagramsSourceDir}' does not exist"
@@ -465,14 +1283,16 @@ The meaning of clean is: *delete*, followed by *create*.
             # copy the diagrams folder to output folder
             sDirName = os.path.basename(sDiagramsSourceDir)
             sDiagramsDestinationDir = f"{self.__dictPackageDocConfig['OUTPUT']}/{sDirName}"
-            try:
-               shutil.copytree(sDiagramsSourceDir, sDiagramsDestinationDir)
-            except Exception as ex:
-               bSuccess = None
-               sResult  = str(ex)
+            bUnchanged = self.__IsAssetUnchanged('DIAGRAMS', self.__GetFolderFingerprint(sDiagramsSourceDir))
+            if ( (bUnchanged is True) and (os.path.isdir(sDiagramsDestinationDir) is True) ):
+               bSuccess = True
+               sResult  = f"Diagrams folder '{sDiagramsSourceDir}' unchanged"
+               return bSuccess, sResult
+            bSuccess, sResult = self.__StageFolder(sDiagramsSourceDir, sDiagramsDestinationDir)
+            if bSuccess is not True:
                return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
             bSuccess = True
-            sResult  = f"Pictures folder '{sDiagramsSourceDir}' copied to build folder '{sDiagramsDestinationDir}'"
+            sResult  = f"Diagrams folder '{sDiagramsSourceDir}' staged in build folder '{sDiagramsDestinationDir}' ({sResult})"
          else:
             bSuccess = False
             sResult  = f"Pictures folder '{sDiagramsSourceDir}' does not exist"
@@ -486,23 +1306,515 @@ The meaning of clean is: *delete*, followed by *create*.
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
-   def __GenDocPDF(self):
-      """Executes the LaTeX compiler to create the PDF file out of the generated source tex files
+   def __PrepareLaTeXFormat(self, dictEnvironment=None):
+      """Provides the static part of the preamble of the main tex file as precompiled LaTeX format within the build folder.
+The format is taken out of the cache (key: content of the styles folder and version of the LaTeX compiler) or dumped and stored
+in the cache. Returns the name of the format, or ``None`` in case of no format is available (the LaTeX compiler has to process
+the complete preamble then).
       """
 
-      sMethod = "CDocBuilder.__GenDocPDF"
+      if self.__dictPackageDocConfig['CACHE'] is None:
+         return None # without cache there is nothing to gain
 
-      bSuccess = None
-      sResult  = None
+      sLaTeXInterpreter = self.__dictPackageDocConfig['LATEXINTERPRETER']
+      sBuildFolder      = self.__dictPackageDocConfig['OUTPUT']
+      sFormatFile       = f"{sBuildFolder}/{LATEXFORMATNAME}.fmt"
+      sFormatSource     = CPatterns().GetFormatSource()
 
-      sPDFFileExpected = None
+      try:
+         oProcess, bSuccess, sResult = self.__oProcessRunner.Run("LATEX", [sLaTeXInterpreter, "--version"], dictEnvironment=dictEnvironment)
+         if bSuccess is not True:
+            raise Exception(sResult)
+         sEngineVersion = oProcess.stdout.decode("utf-8", errors="replace").strip().splitlines()[0]
+      except Exception as ex:
+         print(COLBY + f"Version of LaTeX compiler not available ({ex}); precompiled preamble not used")
+         print()
+         return None
 
-      # -- consider strictness regarding availability of LaTeX compiler
-      sLaTeXInterpreter = self.__dictPackageDocConfig['LATEXINTERPRETER']
-      if os.path.isfile(sLaTeXInterpreter) is False:
-         bStrict = self.__dictPackageDocConfig['CONTROL']['STRICT']
+      sFormatKey = self.__GetFingerprint(sEngineVersion, sFormatSource,
+                                         self.__GetFolderFingerprint(self.__dictPackageDocConfig['LATEXSTYLESFOLDER']))
+      sFormatCacheFolder = f"{self.__dictPackageDocConfig['CACHE']['FOLDER']}/formats"
+      self.__sLaTeXFormatCacheFile = f"{sFormatCacheFolder}/{sFormatKey}.fmt"
+
+      if os.path.isfile(self.__sLaTeXFormatCacheFile) is True:
+         try:
+            shutil.copyfile(self.__sLaTeXFormatCacheFile, sFormatFile)
+         except Exception as ex:
+            print(COLBY + f"Precompiled preamble not taken over from cache ({ex})")
+            print()
+            return None
+         print(f"Precompiled preamble taken over from cache ('{self.__sLaTeXFormatCacheFile}')")
          print()
-         print(COLBR + f"Missing LaTeX compiler '{sLaTeXInterpreter}'!")
+         return LATEXFORMATNAME
+
+      # -- dump the format (within build folder, because the preamble refers to the styles folder there)
+      bSuccess, sResult = self.__oOutputWriter.Write(f"{sBuildFolder}/{LATEXFORMATNAME}.tex", sFormatSource)
+      if bSuccess is not True:
+         print(COLBY + sResult)
+         print()
+         return None
+      sBaseFormat = os.path.splitext(os.path.basename(sLaTeXInterpreter))[0] # e.g. 'pdflatex'
+      listCmdLineParts = [sLaTeXInterpreter, "-ini", f"-jobname={LATEXFORMATNAME}", "-interaction=batchmode", "-halt-on-error",
+                          f"&{sBaseFormat}", f"{LATEXFORMATNAME}.tex"]
+      print("Now dumping the precompiled preamble:\n" + " ".join(listCmdLineParts))
+      print()
+      nReturn = ERROR
+      try:
+         oProcess, bSuccess, sResult = self.__oProcessRunner.Run("LATEX", listCmdLineParts, sCwd=sBuildFolder, dictEnvironment=dictEnvironment)
+         if bSuccess is not True:
+            raise Exception(sResult)
+         nReturn = oProcess.returncode
+      except Exception as ex:
+         print(COLBY + f"Precompiled preamble not available ({ex})")
+         print()
+         return None
+      if ( (nReturn != SUCCESS) or (os.path.isfile(sFormatFile) is False) ):
+         print(COLBY + f"Precompiled preamble not available (LaTeX compiler returned {nReturn}, see '{sBuildFolder}/{LATEXFORMATNAME}.log')")
+         print()
+         return None
+
+      # -- store the format in cache (several processes may share the same cache folder)
+      try:
+         os.makedirs(sFormatCacheFolder, exist_ok=True)
+         hTmpFile, sTmpFile = tempfile.mkstemp(dir=sFormatCacheFolder, prefix=f".{sFormatKey}.", suffix=".tmp")
+         os.close(hTmpFile)
+         shutil.copyfile(sFormatFile, sTmpFile)
+         os.replace(sTmpFile, self.__sLaTeXFormatCacheFile)
+      except Exception as ex:
+         print(COLBY + f"Precompiled preamble not stored in cache ({ex})")
+         print()
+
+      return LATEXFORMATNAME
+
+   # eof def __PrepareLaTeXFormat(self, dictEnvironment=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RemoveLaTeXFormat(self):
+      """Removes the precompiled LaTeX format from build folder and from cache (e.g. because the LaTeX compiler is not able to use it).
+      """
+      listFormatFiles = [f"{self.__dictPackageDocConfig['OUTPUT']}/{LATEXFORMATNAME}.fmt"]
+      if self.__sLaTeXFormatCacheFile is not None:
+         listFormatFiles.append(self.__sLaTeXFormatCacheFile)
+      for sFormatFile in listFormatFiles:
+         try:
+            os.remove(sFormatFile)
+         except Exception:
+            pass # not existing or removed in the meantime by another process
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __FormatLaTeXMessage(self, dictMessage=None):
+      """Formats a message of the LaTeX compiler (see ``CLaTeXLogParser``) as ``<file>:<line>: <message>``.
+      """
+      sLocation = ""
+      if dictMessage['FILE'] is not None:
+         sLocation = f"{dictMessage['FILE']}:"
+         if dictMessage['LINE'] is not None:
+            sLocation = f"{sLocation}{dictMessage['LINE']}:"
+         sLocation = f"{sLocation} "
+      elif dictMessage['LINE'] is not None:
+         sLocation = f"line {dictMessage['LINE']}: "
+      return f"{sLocation}{dictMessage['MESSAGE']}"
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RunLaTeXPass(self, listCmdLineParts=[], dictEnvironment=None, sJobName=None, sOutputFile=None):
+      """Executes a single pass of the LaTeX compiler within the build folder. The console output of the LaTeX compiler is appended to
+the file ``sOutputFile``; the log file of the job ``sJobName`` is parsed while the LaTeX compiler is running. In case of an error appears,
+the LaTeX compiler is stopped immediately. Returns the return value of the LaTeX compiler together with the log parser
+(containing the errors and warnings of this pass), followed by ``bSuccess`` and ``sResult`` of the process runner
+(``bSuccess`` is not ``True`` in case of a limit is exceeded).
+      """
+
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      sLogFile     = f"{sBuildFolder}/{sJobName}.log"
+      if os.path.isfile(sLogFile) is True:
+         os.remove(sLogFile) # log file of the previous pass
+
+      oLogParser = CLaTeXLogParser()
+      listLogFile = [None] # opened as soon as the LaTeX compiler has created it
+
+      def ReadLogFile():
+         # feeds the new part of the log file to the parser; returns True in case of an error appeared (fail fast: the first error is a fatal one)
+         if ( (listLogFile[0] is None) and (os.path.isfile(sLogFile) is True) ):
+            listLogFile[0] = open(sLogFile, "r", encoding="utf-8", errors="replace")
+         if listLogFile[0] is None:
+            return False
+         listNewMessages = oLogParser.Feed(listLogFile[0].read())
+         return ( len([dictMessage for dictMessage in listNewMessages if dictMessage['TYPE'] == "ERROR"]) > 0 )
+
+      try:
+         with open(sOutputFile, "a", encoding="utf-8") as hOutputFile:
+            hOutputFile.write(" ".join(listCmdLineParts) + "\n")
+            hOutputFile.flush()
+            oProcess, bSuccess, sResult = self.__oProcessRunner.Run("LATEX", listCmdLineParts, hOutputFile=hOutputFile, sCwd=sBuildFolder,
+                                                                    dictEnvironment=dictEnvironment, fnMonitor=ReadLogFile)
+         ReadLogFile() # rest of the log file
+      finally:
+         if listLogFile[0] is not None:
+            listLogFile[0].close()
+      oLogParser.Close()
+
+      if bSuccess is not True:
+         return None, oLogParser, bSuccess, sResult
+
+      nReturn = oProcess.returncode
+      if ( (nReturn == SUCCESS) and (len(oLogParser.GetErrors()) > 0) ):
+         nReturn = ERROR
+      return nReturn, oLogParser, bSuccess, sResult
+
+   # eof def __RunLaTeXPass(self, listCmdLineParts=[], dictEnvironment=None, sJobName=None, sOutputFile=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __CompileTeXFile(self, sTeXFile=None, sFormatName=None, dictEnvironment=None, sOutputFile=None, nMaxPasses=None, listConsoleLines=None):
+      """Executes the LaTeX compiler (pass scheduler) to create the PDF file out of the tex file ``sTeXFile`` (within the build folder).
+Returns the name of the precompiled format, that is still usable (``None`` in case of the LaTeX compiler failed with this format),
+followed by ``bSuccess`` and ``sResult``. In case of ``listConsoleLines`` is given, the console output is collected there
+instead of being printed (several tex files compiled in parallel).
+      """
+
+      sMethod = "CDocBuilder.__CompileTeXFile"
+
+      sLaTeXInterpreter = self.__dictPackageDocConfig['LATEXINTERPRETER']
+      sJobName = os.path.splitext(os.path.basename(sTeXFile))[0]
+
+      def Print(sLine=""):
+         if listConsoleLines is None:
+            print(sLine)
+         else:
+            listConsoleLines.append(sLine)
+
+      # -- pass scheduler
+      #    The LaTeX compiler is called until the auxiliary files (TOC, labels, ...) do not change any more (but not more than
+      #    'MAXPASSES' times). Passes that are known to be intermediate ones run in draft mode. The last pass always creates the PDF file.
+      #    With the auxiliary files of the previous build (kept in build folder) usually a single pass is sufficient.
+      if nMaxPasses is None:
+         nMaxPasses = self.__dictPackageDocConfig['TEX']['MAXPASSES']
+      bAuxAvailable = ( len(self.__GetLaTeXAuxFiles(sJobName)) > 0 )
+      bDraft        = not bAuxAvailable # without auxiliary files the first pass is an intermediate one for sure
+      nPass         = 0
+      while True:
+         nPass = nPass + 1
+         if nPass >= nMaxPasses:
+            bDraft = False # the last pass has to create the PDF file
+         sAuxFingerprintBefore = self.__GetLaTeXAuxFingerprint(sJobName)
+         listCmdLinePartsPass = [sLaTeXInterpreter] + LATEXINTERACTIONOPTIONS
+         if bDraft is True:
+            listCmdLinePartsPass.append("-draftmode") # intermediate passes only update the auxiliary files (no PDF output)
+         if sFormatName is not None:
+            listCmdLinePartsPass.append(f"-fmt={sFormatName}")
+         listCmdLinePartsPass.append(sTeXFile)
+         Print(f"Now executing command line (pass {nPass}):\n" + " ".join(listCmdLinePartsPass))
+         Print()
+         try:
+            nReturn, oLogParser, bSuccess, sResult = self.__RunLaTeXPass(listCmdLinePartsPass, dictEnvironment, sJobName, sOutputFile)
+         except Exception as ex:
+            bSuccess = None
+            sResult  = str(ex)
+            return sFormatName, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         if bSuccess is not True:
+            return sFormatName, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         Print(f"LaTeX compiler returned {nReturn} ({len(oLogParser.GetErrors())} error(s), {len(oLogParser.GetWarnings())} warning(s); output in '{sOutputFile}')")
+         Print()
+         for dictError in oLogParser.GetErrors():
+            Print(COLBR + self.__FormatLaTeXMessage(dictError))
+         if len(oLogParser.GetErrors()) > 0:
+            Print()
+         # an error within the documentation itself is not caused by the precompiled preamble or by the auxiliary files (no retry)
+         listErrors = oLogParser.GetErrors()
+         bDocumentError = ( (len(listErrors) > 0) and (str(listErrors[0]['FILE']).lower().endswith(".tex") is True) )
+         if ( (nReturn != SUCCESS) and (bDocumentError is False) and (sFormatName is not None) and (nPass == 1) ):
+            # maybe the precompiled format does not fit to the LaTeX installation any more; fall back to the complete preamble
+            Print(COLBY + "LaTeX compiler failed with precompiled preamble; removing the format and trying again without")
+            Print()
+            self.__RemoveLaTeXFormat()
+            sFormatName = None
+            bDraft = not bAuxAvailable
+            nPass  = 0
+            continue
+         if ( (nReturn != SUCCESS) and (bDocumentError is False) and (bAuxAvailable is True) and (nPass == 1) ):
+            # maybe the auxiliary files of the previous build do not fit any more; start from scratch
+            Print(COLBY + "LaTeX compiler failed with auxiliary files of previous build; deleting them and trying again")
+            Print()
+            for sAuxFile in self.__GetLaTeXAuxFiles(sJobName):
+               os.remove(sAuxFile)
+            bAuxAvailable = False
+            bDraft = True
+            nPass  = 0
+            continue
+         if nReturn != SUCCESS:
+            bSuccess = False
+            sResult  = f"LaTeX compiler not returned expected value {SUCCESS}"
+            if len(listErrors) > 0:
+               sResult = f"{sResult}; first error: {self.__FormatLaTeXMessage(listErrors[0])}"
+            return sFormatName, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         bConverged = ( self.__GetLaTeXAuxFingerprint(sJobName) == sAuxFingerprintBefore )
+         if bDraft is True:
+            if bConverged is True:
+               bDraft = False # auxiliary files are stable; the next pass is the final one
+            continue
+         if ( (bConverged is True) or (nPass >= nMaxPasses) ):
+            break
+         bDraft = True # auxiliary files changed; intermediate passes until they are stable, followed by a final pass
+      # eof while True:
+
+      Print(f"LaTeX compiler called {nPass} time(s) for '{sJobName}'")
+      Print()
+
+      # warnings of the final pass (warnings of intermediate passes, like undefined references, may be outdated)
+      for dictWarning in oLogParser.GetWarnings():
+         Print(COLBY + self.__FormatLaTeXMessage(dictWarning))
+      if len(oLogParser.GetWarnings()) > 0:
+         Print()
+
+      bSuccess = True
+      sResult  = f"'{sJobName}' compiled ({nPass} passes)"
+      return sFormatName, bSuccess, sResult
+
+   # eof def __CompileTeXFile(self, sTeXFile=None, sFormatName=None, dictEnvironment=None, sOutputFile=None, nMaxPasses=None, listConsoleLines=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __WriteShards(self, listofdictChapterInfo=[], listChapterGroups=[], listCreationLines=[]):
+      """Distributes the chapters to shards (see section ``SHARDING``) and writes the tex files of all shards together with the tex file
+of the front matter (title page and table of contents). The chapters of a group (an INTERFACE sub-package or consecutive separate files)
+are kept together within a shard as long as the shard does not exceed ``MAXCHAPTERS``. Also the label index is computed here
+(out of the tex files of the chapters).
+      """
+
+      sMethod = "CDocBuilder.__WriteShards"
+
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      nMaxChapters = self.__dictPackageDocConfig['SHARDING']['MAXCHAPTERS']
+      sMainTexFileNameOnly = os.path.splitext(os.path.basename(self.__dictPackageDocConfig['sMainTexFile']))[0]
+
+      # -- consecutive chapters of the same group
+      listGroups = []
+      for dictChapterInfo, sGroup in zip(listofdictChapterInfo, listChapterGroups):
+         if ( (len(listGroups) > 0) and (listGroups[-1][0] == sGroup) ):
+            listGroups[-1][1].append(dictChapterInfo)
+         else:
+            listGroups.append((sGroup, [dictChapterInfo]))
+
+      # -- groups to shards (groups larger than MAXCHAPTERS are split, small consecutive groups share a shard)
+      listShardChapters = []
+      for sGroup, listChapters in listGroups:
+         for nIndex in range(0, len(listChapters), nMaxChapters):
+            listPart = listChapters[nIndex:nIndex + nMaxChapters]
+            if ( (len(listShardChapters) > 0) and (len(listShardChapters[-1]) + len(listPart) <= nMaxChapters) ):
+               listShardChapters[-1].extend(listPart)
+            else:
+               listShardChapters.append(list(listPart))
+
+      oPatterns = CPatterns()
+      self.__oLabelIndex = CLabelIndex()
+      self.__listShards  = []
+      nChapterOffset = 0
+      for nShard, listChapters in enumerate(listShardChapters):
+         sJobName = f"{sMainTexFileNameOnly}_shard{nShard + 1:03d}"
+         dictShard = {'NAME'       : sJobName,
+                      'TEXFILE'    : f"{sBuildFolder}/{sJobName}.tex",
+                      'LABELSFILE' : f"{sBuildFolder}/{sJobName}{SHARDLABELSSUFFIX}",
+                      'CHAPTERS'   : len(listChapters)}
+         listLines = [oPatterns.GetShardHeader(os.path.basename(dictShard['LABELSFILE']), nChapterOffset)]
+         for dictChapterInfo in listChapters:
+            sChapter = oPatterns.GetChapter(sHeadline=dictChapterInfo['sChaptername'], sLabel=dictChapterInfo['sLabel'], sDocumentName=dictChapterInfo['sTeXFileName'])
+            listLines.append(sChapter)
+            self.__oLabelIndex.ScanTeX(sJobName, sChapter)
+            try:
+               with open(f"{sBuildFolder}/{dictChapterInfo['sTeXFileName']}", "r", encoding="utf-8", errors="replace") as hTeXFile:
+                  self.__oLabelIndex.ScanTeX(sJobName, hTeXFile.read())
+            except Exception as ex:
+               bSuccess = None
+               sResult  = str(ex)
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         if nShard == len(listShardChapters) - 1:
+            listLines.extend(listCreationLines)
+         listLines.append(oPatterns.GetFooter())
+         bSuccess, sResult = self.__oOutputWriter.Write(dictShard['TEXFILE'], "\n".join(listLines) + "\n")
+         if bSuccess is not True:
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         self.__listShards.append(dictShard)
+         nChapterOffset = nChapterOffset + len(listChapters)
+
+      # -- front matter (title page and table of contents of all shards)
+      sJobName = f"{sMainTexFileNameOnly}_front"
+      self.__dictShardFront = {'NAME' : sJobName, 'TEXFILE' : f"{sBuildFolder}/{sJobName}.tex"}
+      sHeader = oPatterns.GetHeader(sTitle=self.__dictPackageDocConfig['DOCUMENT']['TITLE'],
+                                    sVersion=self.__dictPackageDocConfig['DOCUMENT']['VERSION'],
+                                    sAuthor=self.__dictPackageDocConfig['DOCUMENT']['AUTHOR'],
+                                    sDate=self.__dictPackageDocConfig['DOCUMENT']['DATE'])
+      bSuccess, sResult = self.__oOutputWriter.Write(self.__dictShardFront['TEXFILE'], sHeader + "\n" + oPatterns.GetFooter() + "\n")
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"{len(listofdictChapterInfo)} chapters distributed to {len(self.__listShards)} shards (up to {nMaxChapters} chapters per shard)"
+      return bSuccess, sResult
+
+   # eof def __WriteShards(self, listofdictChapterInfo=[], listChapterGroups=[], listCreationLines=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __CompileShards(self, sFormatName=None, dictEnvironment=None):
+      """Compiles all shards in parallel and assembles them to the final PDF file. The page numbers of every shard continue the page numbers
+of the previous shard, and the labels of all other shards are made available within every shard (see ``CLabelIndex``). Both are known only
+after the shards are compiled; therefore shards whose page numbers or labels have changed are compiled again (not more than ``MAXPASSES`` rounds).
+Finally the front matter is compiled with the table of contents of all shards.
+      """
+
+      sMethod = "CDocBuilder.__CompileShards"
+
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      nJobs        = self.__dictPackageDocConfig['nJobs']
+      oPatterns    = CPatterns()
+      oRegExFirstPage = re.compile(r"\\def\\GenPackageDocFirstPage\{(\d+)\}")
+      oRegExNextPage  = re.compile(r"\\gdef\s*\\GenPackageDocNextPage\{(\d+)\}")
+      oConsoleLock    = threading.Lock()
+
+      # -- the labels files of the previous build are kept (their page numbers and labels are usually still valid)
+      for dictShard in self.__listShards:
+         dictShard['LABELS'] = None
+         if os.path.isfile(dictShard['LABELSFILE']) is True:
+            with open(dictShard['LABELSFILE'], "r", encoding="utf-8") as hLabelsFile:
+               dictShard['LABELS'] = hLabelsFile.read()
+         if ( (dictShard['LABELS'] is None) or (oRegExFirstPage.search(dictShard['LABELS']) is None) ):
+            dictShard['LABELS'] = oPatterns.GetShardLabels(1, "")
+            bSuccess, sResult = self.__oOutputWriter.Write(dictShard['LABELSFILE'], dictShard['LABELS'])
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      listShardsToCompile = list(self.__listShards)
+      nRound = 0
+      while len(listShardsToCompile) > 0:
+         nRound = nRound + 1
+         print(f"Compiling {len(listShardsToCompile)} of {len(self.__listShards)} shards (round {nRound}; {nJobs} job(s))")
+         print()
+
+         def CompileShard(dictShard):
+            # the console output of every shard is printed at once (shards are compiled in parallel)
+            sOutputFile = f"{sBuildFolder}/{os.path.splitext(LATEXOUTPUTFILENAME)[0]}_{dictShard['NAME']}.txt"
+            listConsoleLines = []
+            tupleResult = self.__CompileTeXFile(dictShard['TEXFILE'], sFormatName, dictEnvironment, sOutputFile, listConsoleLines=listConsoleLines)
+            with oConsoleLock:
+               for sLine in listConsoleLines:
+                  print(sLine)
+            return tupleResult
+
+         if ( (nJobs <= 1) or (len(listShardsToCompile) <= 1) ):
+            listResults = [CompileShard(dictShard) for dictShard in listShardsToCompile]
+         else:
+            with ThreadPoolExecutor(max_workers=min(nJobs, len(listShardsToCompile))) as oExecutor:
+               listResults = list(oExecutor.map(CompileShard, listShardsToCompile))
+         for sFormatNameUsed, bSuccess, sResult in listResults:
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            if sFormatNameUsed is None:
+               sFormatName = None # precompiled preamble not usable any more
+
+         # -- page numbers and labels of all shards (out of the auxiliary files)
+         nFirstPage = 1
+         for dictShard in self.__listShards:
+            try:
+               with open(f"{sBuildFolder}/{dictShard['NAME']}.aux", "r", encoding="utf-8", errors="replace") as hAuxFile:
+                  sAux = hAuxFile.read()
+            except Exception as ex:
+               bSuccess = None
+               sResult  = str(ex)
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            oMatchNextPage = oRegExNextPage.search(sAux)
+            if oMatchNextPage is None:
+               bSuccess = False
+               sResult  = f"Number of pages of shard '{dictShard['NAME']}' not found within its auxiliary file"
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            nFirstPageUsed = int(oRegExFirstPage.search(dictShard['LABELS']).group(1))
+            self.__oLabelIndex.ReadAux(dictShard['NAME'], sAux, nFirstPage - nFirstPageUsed)
+            dictShard['FIRSTPAGE'] = nFirstPage
+            nFirstPage = nFirstPage + int(oMatchNextPage.group(1)) - nFirstPageUsed
+
+         # -- shards with changed page numbers or changed labels of other shards have to be compiled again
+         listShardsToCompile = []
+         for dictShard in self.__listShards:
+            sLabels = oPatterns.GetShardLabels(dictShard['FIRSTPAGE'], self.__oLabelIndex.GetLabelDefinitions(dictShard['NAME']))
+            if sLabels == dictShard['LABELS']:
+               continue
+            bSuccess, sResult = self.__oOutputWriter.Write(dictShard['LABELSFILE'], sLabels)
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            dictShard['LABELS'] = sLabels
+            listShardsToCompile.append(dictShard)
+         if ( (len(listShardsToCompile) > 0) and (nRound >= self.__dictPackageDocConfig['TEX']['MAXPASSES']) ):
+            print(COLBY + f"Page numbers and labels of {len(listShardsToCompile)} shards not stable after {nRound} rounds; giving up")
+            print()
+            break
+      # eof while len(listShardsToCompile) > 0:
+
+      nCrossReferences = 0
+      for dictShard in self.__listShards:
+         with open(dictShard['TEXFILE'], "r", encoding="utf-8", errors="replace") as hTeXFile:
+            nCrossReferences = nCrossReferences + len(self.__oLabelIndex.GetCrossReferences(dictShard['NAME'], hTeXFile.read()))
+      print(f"Label index: {len(self.__oLabelIndex.dictLabels)} labels, {len(self.__oLabelIndex.dictAnchors)} anchors ({nFirstPage - 1} pages)")
+      print()
+
+      # -- front matter: table of contents of all shards (read by the LaTeX compiler in a single pass)
+      listTOC = []
+      for dictShard in self.__listShards:
+         sTOCFile = f"{sBuildFolder}/{dictShard['NAME']}.toc"
+         if os.path.isfile(sTOCFile) is True:
+            with open(sTOCFile, "r", encoding="utf-8", errors="replace") as hTOCFile:
+               listTOC.append(hTOCFile.read())
+      sFrontJobName = self.__dictShardFront['NAME']
+      with open(f"{sBuildFolder}/{sFrontJobName}.toc", "w", encoding="utf-8") as hTOCFile:
+         hTOCFile.write("".join(listTOC))
+      sOutputFile = f"{sBuildFolder}/{os.path.splitext(LATEXOUTPUTFILENAME)[0]}_{sFrontJobName}.txt"
+      sFormatName, bSuccess, sResult = self.__CompileTeXFile(self.__dictShardFront['TEXFILE'], sFormatName, dictEnvironment, sOutputFile, nMaxPasses=1)
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      # -- assemble the PDF files
+      listParts = [(sFrontJobName, f"{sBuildFolder}/{sFrontJobName}.pdf", False)]
+      for dictShard in self.__listShards:
+         listParts.append((dictShard['NAME'], f"{sBuildFolder}/{dictShard['NAME']}.pdf", True))
+      bSuccess, sResult = self.__oPDFAssembler.Assemble(listParts, self.__oLabelIndex.dictAnchors, self.__dictPackageDocConfig['sPDFFileExpected'])
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      print(COLBY + sResult)
+      print()
+
+      bSuccess = True
+      sResult  = f"{len(self.__listShards)} shards compiled and assembled ({nCrossReferences} references between shards)"
+      return bSuccess, sResult
+
+   # eof def __CompileShards(self, sFormatName=None, dictEnvironment=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GenDocPDF(self):
+      """Executes the LaTeX compiler to create the PDF file out of the generated source tex files
+      """
+
+      sMethod = "CDocBuilder.__GenDocPDF"
+
+      bSuccess = None
+      sResult  = None
+
+      sPDFFileExpected = None
+
+      # -- consider strictness regarding availability of LaTeX compiler
+      sLaTeXInterpreter = self.__dictPackageDocConfig['LATEXINTERPRETER']
+      if os.path.isfile(sLaTeXInterpreter) is False:
+         bStrict = self.__dictPackageDocConfig['CONTROL']['STRICT']
+         print()
+         print(COLBR + f"Missing LaTeX compiler '{sLaTeXInterpreter}'!")
          print()
          if bStrict is True:
             bSuccess = False
@@ -516,39 +1828,30 @@ The meaning of clean is: *delete*, followed by *create*.
       sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
       sMainTexFile = self.__dictPackageDocConfig['sMainTexFile']
 
-      listCmdLineParts = []
-      listCmdLineParts.append(f"\"{sLaTeXInterpreter}\"")
-      listCmdLineParts.append(f"\"{sMainTexFile}\"")
+      # -- in reproducible mode the LaTeX compiler uses the timestamp of the build (creation date and ID of the PDF file)
+      dictEnvironment = dict(os.environ)
+      dictEnvironment['max_print_line'] = "10000" # no line wrapping within the log file (simplifies the parsing)
+      if self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] is True:
+         dictEnvironment['SOURCE_DATE_EPOCH'] = str(self.__dictPackageDocConfig['nSourceDateEpoch'])
+         dictEnvironment['FORCE_SOURCE_DATE'] = "1"
 
-      sCmdLine = " ".join(listCmdLineParts)
-      del listCmdLineParts
-      listCmdLineParts = shlex.split(sCmdLine)
+      # -- the static part of the preamble is loaded from a precompiled format (if available)
+      sFormatName = self.__PrepareLaTeXFormat(dictEnvironment)
 
-      # -- debug
-      sCmdLine = " ".join(listCmdLineParts)
-      print("Now executing command line:\n" + sCmdLine)
-      print()
+      # -- output of the previous build
+      sOutputFileNameOnly = os.path.splitext(LATEXOUTPUTFILENAME)[0]
+      for sFileName in os.listdir(sBuildFolder):
+         if ( (sFileName == LATEXOUTPUTFILENAME) or ( (sFileName.startswith(f"{sOutputFileNameOnly}_") is True) and (sFileName.endswith(".txt") is True) ) ):
+            os.remove(f"{sBuildFolder}/{sFileName}")
 
-      for nDummy in range(2): # call LaTeX compiler 2 times to get TOC and index lists updated properly
-         cwd = os.getcwd() # we have to save cwd because later we have to change
-         nReturn = ERROR
-         try:
-            os.chdir(sBuildFolder) # otherwise LaTeX compiler is not able to find files inside
-            nReturn = subprocess.call(listCmdLineParts)
-            print()
-            print(f"LaTeX compiler returned {nReturn}")
-            print()
-            os.chdir(cwd) # restore original value
-         except Exception as ex:
-            os.chdir(cwd) # restore original value
-            bSuccess = None
-            sResult  = str(ex)
-            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
-         if nReturn != SUCCESS:
-            bSuccess = False
-            sResult  = f"LaTeX compiler not returned expected value {SUCCESS}"
-            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
-      # eof for nDummy in range(2):
+      if self.__listShards is None:
+         sFormatName, bSuccess, sResult = self.__CompileTeXFile(sMainTexFile, sFormatName, dictEnvironment, f"{sBuildFolder}/{LATEXOUTPUTFILENAME}")
+      else:
+         bSuccess, sResult = self.__CompileShards(sFormatName, dictEnvironment)
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      print(sResult)
+      print()
 
       # -- verify the outcome
       sPDFFileExpected = self.__dictPackageDocConfig['sPDFFileExpected']
@@ -556,7 +1859,10 @@ The meaning of clean is: *delete*, followed by *create*.
          # expected PDF file found
          bSuccess = True
          sResult  = f"PDF file '{sPDFFileExpected}' generated"
-         if self.__dictPackageDocConfig['PDFDEST'] is not None:
+         if ( (self.__dictPackageDocConfig['PDFDEST'] is not None) and (self.__dictPackageDocConfig['listOnly'] is not None) ):
+            # the PDF file of a partial build does not contain all chapters; it must not replace the documentation of the package
+            sResult = f"{sResult} (partial build; not copied to '{self.__dictPackageDocConfig['PDFDEST']}')"
+         elif self.__dictPackageDocConfig['PDFDEST'] is not None:
             # further destination defined => copy PDF from build folder to there
             sDestinationPDFFile = f"{self.__dictPackageDocConfig['PDFDEST']}/{self.__dictPackageDocConfig['sPDFFileName']}"
             oPDFFile = CFile(sPDFFileExpected)
@@ -568,44 +1874,501 @@ The meaning of clean is: *delete*, followed by *create*.
             else:
                sResult  = CString.FormatResult(sMethod, bSuccess, sResult)
       else:
-         bSuccess = False
-         sResult  = f"Expected PDF file '{sPDFFileExpected}' not generated"
-         sResult  = CString.FormatResult(sMethod, bSuccess, sResult)
+         bSuccess = False
+         sResult  = f"Expected PDF file '{sPDFFileExpected}' not generated"
+         sResult  = CString.FormatResult(sMethod, bSuccess, sResult)
+
+      return bSuccess, sResult
+
+   # eof def __GenDocPDF(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __PrepareModule(self, sModule=None, sRootPath=None):
+      """Parses a single Python module and generates the intermediate rst file. The rst code is returned within ``dictResult``
+(key ``sRSTCode``; ``None`` in case of the module does not contain anything relevant) and converted to tex code by the caller
+(see ``ProcessModules``).
+      """
+
+      sMethod = "CDocBuilder.__PrepareModule"
+
+      if sModule is None:
+         bSuccess = None
+         sResult  = "sModule is None"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      if sRootPath is None:
+         bSuccess = None
+         sResult  = "sRootPath is None"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      sSourceFilesRootFolderName = os.path.basename(sRootPath) # should be the package name
+
+      dictResult = {}
+      dictResult['dictChapterInfo'] = None
+      dictResult['dictScopes']      = {}
+      dictResult['listOutputs']     = []
+      dictResult['sRSTCode']        = None
+      dictResult['sTeXFile']        = None
+
+      print(f"* Module : '{sModule}'")
+
+      listLinesRST = [] # the module/chapter specific subset
+
+      # -- get informations about the source file and derive further information
+
+      oModule = CFile(sModule)
+      dModuleFileInfo = oModule.GetFileInfo()
+      del oModule
+      sModuleFilePath     = dModuleFileInfo['sFilePath']
+      sModuleFileNameOnly = dModuleFileInfo['sFileNameOnly']
+      sModuleFileSubPath  = sModuleFilePath[len(sRootPath)+1:]
+
+      # -- prepare the scope of the module file (used for labels within LaTeX code and for the names of LaTeX files generated out of rst code)
+      sModuleFileScope = ""
+      if sModuleFileSubPath == "":
+         sModuleFileScope = f"{sSourceFilesRootFolderName}-{sModuleFileNameOnly}"
+      else:
+         sModuleFileScope = f"{sSourceFilesRootFolderName}-{sModuleFileSubPath}-{sModuleFileNameOnly}"
+      sModuleFileScope   = self.__ConvertToScopeFormat(sModuleFileScope)
+      sModuleTeXFileName = f"{sModuleFileScope}.tex"
+      sModuleTeXFile     = f"{sBuildFolder}/{sModuleTeXFileName}"
+
+      # -- prepare the import path of the module in Python 'import' notation
+      sPythonModuleImport = ""
+      if sModuleFileSubPath == "":
+         sPythonModuleImport = f"{sSourceFilesRootFolderName}.{sModuleFileNameOnly}"
+      else:
+         sModuleFileSubPath = sModuleFileSubPath.replace('/', '.')
+         sPythonModuleImport = f"{sSourceFilesRootFolderName}.{sModuleFileSubPath}.{sModuleFileNameOnly}"
+
+      # -- get all informations out of the source file
+      oSourceParser = CSourceParser()
+      dictContent, bSuccess, sResult = oSourceParser.ParseSourceFile(sModule,
+                                                                     self.__dictPackageDocConfig['CONTROL']['INCLUDEPRIVATE'],
+                                                                     self.__dictPackageDocConfig['CONTROL']['INCLUDEUNDOCUMENTED'])
+      del oSourceParser
+      if bSuccess is not True:
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      if dictContent is None:
+         print("  nothing relevant inside")
+         print()
+         bSuccess = True
+         sResult  = f"Nothing relevant inside module '{sModule}'"
+         return dictResult, bSuccess, sResult
+
+      listofdictFunctions = dictContent['listofdictFunctions']
+      listofdictClasses   = dictContent['listofdictClasses']
+      sFileDescription    = dictContent['sFileDescription']
+
+      # -- file description
+      if sFileDescription is not None:
+         print("  file description found")
+         listLinesRST.append(sFileDescription)
+
+      # -- rst content of all functions
+
+      for dictFunction in listofdictFunctions:
+         sFunctionName  = dictFunction['sFunctionName']
+         sFunctionScope = f"{sModuleFileScope}-{sFunctionName}"
+         sFunctionScope = self.__ConvertToScopeFormat(sFunctionScope)
+         sFunctionHeadline = f"Function: {sFunctionName}"
+         dictResult['dictScopes'][sFunctionScope] = sFunctionHeadline
+
+         sFunctionDocString = dictFunction['sFunctionDocString']
+
+         print(f"    > Function : '{sFunctionName}' / scope: '{sFunctionScope}'")
+
+         listLinesRST.append(sFunctionScope)
+         sFunctionHeadlineUnderline = len(sFunctionScope)*"="
+         listLinesRST.append(sFunctionHeadlineUnderline)
+         listLinesRST.append("")
+         if sFunctionDocString is not None:
+            listLinesRST.append(sFunctionDocString)
+
+      # eof for dictFunction in listofdictFunctions:
+
+
+      # -- rst content of all classes and methods
+
+      for dictClass in listofdictClasses:
+         sClassName  = dictClass['sClassName']
+         sClassScope = f"{sModuleFileScope}-{sClassName}"
+         sClassScope = self.__ConvertToScopeFormat(sClassScope)
+         sClassHeadline = f"Class: {sClassName}"
+         dictResult['dictScopes'][sClassScope] = sClassHeadline
+
+         sClassDocString   = dictClass['sClassDocString']
+         listofdictMethods = dictClass['listofdictMethods']
+
+         print(f"  > Class : '{sClassName}' / scope: '{sClassScope}'")
+
+         # tmp mapping
+         sClassHeadline = sClassScope
+
+         sPythonModuleImportFull = f"from {sPythonModuleImport} import {sClassName}"
+
+         listLinesRST.append(sClassHeadline)
+         sClassHeadlineUnderline = len(sClassHeadline)*"="
+         listLinesRST.append(sClassHeadlineUnderline)
+         listLinesRST.append("")
+         listLinesRST.append("*Imported by*:")
+         listLinesRST.append("")
+         listLinesRST.append(".. code::python")
+         listLinesRST.append("")
+         listLinesRST.append(f"   {sPythonModuleImportFull}")
+         listLinesRST.append("")
+         if sClassDocString is not None:
+            listLinesRST.append(sClassDocString)
+
+
+         for dictMethod in listofdictMethods:
+            sMethodName = dictMethod['sMethodName']
+            bIsKeyword  = dictMethod['bIsKeyword']
+            sIdentifier = "Method"
+            if bIsKeyword is True:
+               sIdentifier = "Keyword"
+            sMethodHeadline = f"{sIdentifier}: {sMethodName}"
+            sMethodScope    = f"{sModuleFileScope}-{sClassName}-{sMethodName}"
+            sMethodScope    = self.__ConvertToScopeFormat(sMethodScope)
+            dictResult['dictScopes'][sMethodScope] = sMethodHeadline
+
+            print(f"    - {sIdentifier} : '{sMethodName}' / scope: '{sMethodScope}'")
+
+            # tmp mapping
+            sMethodHeadline = sMethodScope
+
+            listLinesRST.append(sMethodHeadline)
+            sMethodHeadlineUnderline = len(sMethodHeadline)*"-"
+            listLinesRST.append(sMethodHeadlineUnderline)
+            listLinesRST.append("")
+            sMethodDocString = dictMethod['sMethodDocString']
+            if sMethodDocString is not None:
+               listLinesRST.append(sMethodDocString)
+
+      # eof for dictClass in listofdictClasses:
+
+      print()
+
+      listLinesResolved, bSuccess, sResult = self.__ResolvePlaceholders(listLinesRST)
+      if bSuccess is not True:
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      sRSTCode = "\n".join(listLinesResolved)
+
+      # debug only; sRSTCodeFile not really required
+      sRSTCodeFileName = os.path.basename(sModule) + ".rst"
+      sRSTCodeFile = f"{sBuildFolder}/{sRSTCodeFileName}"
+      bSuccess, sResult = self.__oOutputWriter.Write(sRSTCodeFile, sRSTCode + "\n")
+      if bSuccess is not True:
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      # -- save some infos needed for TOC of main TeX file
+      sFileName = dModuleFileInfo['sFileName']
+      dictChapterInfo ={}
+      dictChapterInfo['sChaptername'] = sFileName
+      dictChapterInfo['sTeXFileName'] = sModuleTeXFileName
+      dictChapterInfo['sLabel']       = sModuleFileScope
+      dictResult['dictChapterInfo'] = dictChapterInfo
+      dictResult['listOutputs']     = [sRSTCodeFileName, sModuleTeXFileName]
+      dictResult['sRSTCode']        = sRSTCode
+      dictResult['sTeXFile']        = sModuleTeXFile
+
+      bSuccess = True
+      sResult  = f"Module '{sModule}' prepared"
+      return dictResult, bSuccess, sResult
+
+   # eof def __PrepareModule(self, sModule=None, sRootPath=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __WriteTeXFile(self, sTeXFile=None, sTEX=""):
+      """Writes the tex code of a chapter (together with a header) to ``sTeXFile``.
+      """
+      listLines = []
+      listLines.append("%")
+      listLines.append("% Generated at " + self.__GetTimestamp() + " by " + self.__dictPackageDocConfig['PACKAGENAME'])
+      listLines.append("%")
+      listLines.append("")
+      listLines.append(sTEX)
+      return self.__oOutputWriter.Write(sTeXFile, "\n".join(listLines) + "\n")
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __FinishModule(self, dictResult=None, sTEX=""):
+      """Postprocesses the tex code of a single Python module (prepared by ``__PrepareModule``) and writes the tex file.
+      """
+
+      listLinesTEX = sTEX.splitlines() # ensure proper line endings
+
+      # -- tex postprocessing (extended syntax and multiply-defined labels; only the scopes of the current module are relevant)
+      listLinesProcessed = self.__PostprocessTEX(listLinesTEX, dictResult['dictScopes'])
+
+      sTEX = "\n".join(listLinesProcessed)
+
+      # -- create the corresponding tex file for the current source file
+      return self.__WriteTeXFile(dictResult['sTeXFile'], sTEX)
+
+   # eof def __FinishModule(self, dictResult=None, sTEX=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ProcessModules(self, listModules=[], sRootPath=None):
+      """
+Generates the tex files (and the intermediate rst files) belonging to a list of Python modules. This method is called by ``Build()``
+(either directly or within a separate worker process, in case of more than one job is requested).
+
+At first all modules are parsed, afterwards the rst code of all modules is converted to tex code at once. This enables
+conversion engines to handle many conversions within a single call.
+
+**Arguments:**
+
+* ``listModules``
+
+  / *Condition*: required / *Type*: list /
+
+  Paths and names of the Python modules.
+
+* ``sRootPath``
+
+  / *Condition*: required / *Type*: str /
+
+  Path to the interface folder containing the Python modules (the folder name is the first part of all scopes).
+
+**Returns:**
+
+* ``dictResults``
+
+  / *Type*: dict /
+
+  Contains the information required by ``Build()`` to continue. Key ``dictModules`` contains for every module the chapter information
+  for the main tex file (``None`` in case of the module does not contain anything relevant), the scopes found within the module
+  and the names of all output files. Keys ``nCacheHits`` and ``nCacheMisses`` contain the usage of the conversion cache,
+  keys ``nFilesWritten`` and ``nFilesSkipped`` the number of written and unchanged output files, key ``listTimings`` the executions
+  of external tools (see ``CProcessRunner``).
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CDocBuilder.ProcessModules"
+
+      dictResults = {}
+      dictResults['dictModules']  = {}
+      dictResults['nCacheHits']   = 0
+      dictResults['nCacheMisses'] = 0
+
+      if self.__oConversionCache is not None:
+         nCacheHits   = self.__oConversionCache.nHits
+         nCacheMisses = self.__oConversionCache.nMisses
+      nFilesWritten = self.__oOutputWriter.nWritten
+      nFilesSkipped = self.__oOutputWriter.nSkipped
+      nTimings      = len(self.__oProcessRunner.listTimings)
+
+      # -- parse all modules
+      listModulesToConvert = []
+      for sModule in listModules:
+         dictResult, bSuccess, sResult = self.__PrepareModule(sModule, sRootPath)
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         dictResults['dictModules'][sModule] = dictResult
+         if dictResult['sRSTCode'] is not None:
+            listModulesToConvert.append(sModule)
+
+      # -- convert the rst content of all modules to tex format
+      listRSTCodes = []
+      for sModule in listModulesToConvert:
+         listRSTCodes.append(dictResults['dictModules'][sModule]['sRSTCode'])
+      listTEX, bSuccess, sResult = self.__ConvertRSTToTEXList(listRSTCodes)
+      if bSuccess is not True:
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      # -- postprocess and write the tex files
+      for sModule, sTEX in zip(listModulesToConvert, listTEX):
+         dictResult = dictResults['dictModules'][sModule]
+         bSuccess, sResult = self.__FinishModule(dictResult, sTEX)
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         del dictResult['sRSTCode'] # not needed any more
+         del dictResult['sTeXFile']
+
+      if self.__oConversionCache is not None:
+         dictResults['nCacheHits']   = self.__oConversionCache.nHits - nCacheHits
+         dictResults['nCacheMisses'] = self.__oConversionCache.nMisses - nCacheMisses
+      dictResults['nFilesWritten'] = self.__oOutputWriter.nWritten - nFilesWritten
+      dictResults['nFilesSkipped'] = self.__oOutputWriter.nSkipped - nFilesSkipped
+      dictResults['listTimings']   = self.__oProcessRunner.listTimings[nTimings:]
+
+      bSuccess = True
+      sResult  = f"{len(listModules)} modules processed"
+      return dictResults, bSuccess, sResult
+
+   # eof def ProcessModules(self, listModules=[], sRootPath=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __ProcessModules(self, listModules=[], sRootPath=None):
+      """Processes all modules in ``listModules`` (see ``ProcessModules``). In case of more than one job is configured (``--jobs``),
+the modules are processed in parallel within a pool of worker processes. Conversion engines that benefit from many conversions
+at once get one contiguous part of ``listModules`` per worker, all other engines get the modules one by one.
+The results are returned in a dictionary (key: module). The console output of the worker processes is printed in the order of ``listModules``.
+      """
+
+      sMethod = "CDocBuilder.__ProcessModules"
+
+      dictResults = {}
+
+      nJobs = self.__dictPackageDocConfig['nJobs']
+      if ( (nJobs <= 1) or (len(listModules) <= 1) ):
+         dictChunkResults, bSuccess, sResult = self.ProcessModules(listModules, sRootPath)
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         dictResults = dictChunkResults['dictModules']
+      else:
+         nWorkers = min(nJobs, len(listModules))
+         nChunkSize = 1
+         if self.__oConversionEngine.bBatch is True:
+            nChunkSize = -(-len(listModules) // nWorkers) # rounded up
+         listChunks = [listModules[nIndex:nIndex+nChunkSize] for nIndex in range(0, len(listModules), nChunkSize)]
+         print(COLBY + f"Processing {len(listModules)} modules with {nWorkers} jobs ...")
+         print()
+         self.__oConversionEngine.Start() # shared by all workers
+         try:
+            with ProcessPoolExecutor(max_workers=nWorkers, initializer=_InitModuleWorker, initargs=(self,)) as oExecutor:
+               listFutures = []
+               for listChunk in listChunks:
+                  listFutures.append(oExecutor.submit(_ProcessModulesInWorker, listChunk, sRootPath))
+               for oFuture in listFutures:
+                  dictChunkResults, bSuccess, sResult, sOutput = oFuture.result()
+                  print(sOutput, end='')
+                  if bSuccess is not True:
+                     for oFutureOpen in listFutures:
+                        oFutureOpen.cancel()
+                     return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+                  dictResults.update(dictChunkResults['dictModules'])
+                  if self.__oConversionCache is not None:
+                     self.__oConversionCache.nHits   = self.__oConversionCache.nHits + dictChunkResults['nCacheHits']
+                     self.__oConversionCache.nMisses = self.__oConversionCache.nMisses + dictChunkResults['nCacheMisses']
+                  self.__oOutputWriter.nWritten = self.__oOutputWriter.nWritten + dictChunkResults['nFilesWritten']
+                  self.__oOutputWriter.nSkipped = self.__oOutputWriter.nSkipped + dictChunkResults['nFilesSkipped']
+                  self.__oProcessRunner.listTimings.extend(dictChunkResults['listTimings'])
+         except Exception as ex:
+            bSuccess = None
+            sResult  = str(ex)
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
-      return bSuccess, sResult
+      bSuccess = True
+      sResult  = f"{len(listModules)} modules processed"
+      return dictResults, bSuccess, sResult
 
-   # eof def __GenDocPDF(self):
+   # eof def __ProcessModules(self, listModules=[], sRootPath=None):
 
    # --------------------------------------------------------------------------------------------------------------
    #TM***
 
-   def Build(self):
+   def __AcquireBuildLock(self):
+      """Locks the build folder (lock file ``LOCKFILENAME``). The lock is held by the operating system and therefore also released
+in case of the process terminates unexpectedly. Fails in case of another build (within this or within another process) uses the same build folder.
       """
-**Arguments:**
 
-(*no arguments*)
+      sMethod = "CDocBuilder.__AcquireBuildLock"
 
-**Returns:**
+      sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
+      sLockFile    = f"{sBuildFolder}/{LOCKFILENAME}"
+      try:
+         os.makedirs(sBuildFolder, exist_ok=True)
+         hLockFile = open(sLockFile, "a+", encoding="utf-8")
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
-* ``bSuccess``
+      try:
+         hLockFile.seek(0)
+         if fcntl is not None:
+            fcntl.flock(hLockFile.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+         else:
+            msvcrt.locking(hLockFile.fileno(), msvcrt.LK_NBLCK, 1)
+      except OSError:
+         sOwner = "unknown process"
+         try:
+            hLockFile.seek(0)
+            sOwner = hLockFile.read().strip() or sOwner
+         except Exception:
+            pass # on Windows the locked region cannot be read
+         hLockFile.close()
+         bSuccess = False
+         sResult  = f"The build folder '{sBuildFolder}' is used by another documentation build ({sOwner}). Please wait until this build is finished or use another build folder (OUTPUT)."
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
-  / *Type*: bool /
+      # information about the owner of the lock (for the error message of other builds)
+      hLockFile.seek(0)
+      hLockFile.truncate()
+      hLockFile.write(f"process {os.getpid()} on {platform.node()}, started {time.strftime('%d.%m.%Y %H:%M:%S')}\n")
+      hLockFile.flush()
+      self.__hBuildLock = hLockFile
 
-  Indicates if the computation of the method ``sMethod`` was successful or not.
+      bSuccess = True
+      sResult  = f"Build folder '{sBuildFolder}' locked"
+      return bSuccess, sResult
 
-* ``sResult``
+   # eof def __AcquireBuildLock(self):
 
-  / *Type*: str /
+   def __ReleaseBuildLock(self):
+      """Releases the lock of the build folder. The lock file itself is kept (deleting it would break the lock of a waiting build).
+      """
+      hLockFile = self.__hBuildLock
+      if hLockFile is None:
+         return
+      self.__hBuildLock = None
+      try:
+         if fcntl is not None:
+            fcntl.flock(hLockFile.fileno(), fcntl.LOCK_UN)
+         else:
+            hLockFile.seek(0)
+            msvcrt.locking(hLockFile.fileno(), msvcrt.LK_UNLCK, 1)
+      except OSError:
+         pass # released anyway when the file is closed
+      hLockFile.close()
 
-  The result of the computation of the method ``sMethod``.
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __Build(self):
+      """Builds the documentation (the build folder is locked by the caller).
       """
 
       sMethod = "CDocBuilder.Build"
 
+      self.__dictScopes = {} # the builder can be reused for several builds (watch mode)
+      self.__oOutputWriter.nWritten = 0
+      self.__oOutputWriter.nSkipped = 0
+      self.__oProcessRunner.listTimings = []
+
       bSuccess, sResult = self.__CleanBuildFolder()
       if bSuccess is not True:
          return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
+      # -- the manifest of the previous build (required in incremental mode)
+      self.__sConfigFingerprint = self.__GetConfigFingerprint()
+      self.__LoadManifest()
+
       bSuccess, sResult = self.__RenderDiagrams()
       if bSuccess is not True:
          return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
@@ -617,15 +2380,11 @@ The meaning of clean is: *delete*, followed by *create*.
       if bSuccess is not True:
          return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
-      bSuccess, sResult = self.__CopyPictures()
-      if bSuccess is not True:
-         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
-
       sBuildFolder = self.__dictPackageDocConfig['OUTPUT']
 
-      oSourceParser = CSourceParser()
-
       listofdictChapterInfo = [] # needed for TOC of main TeX file
+      listChapterGroups     = [] # group of every chapter (sub-package or separate file; needed to distribute the chapters to shards)
+      setSelectedChapters   = set() # tex files of the chapters selected for a partial build (command line parameter '--only')
 
       # -- check existence of document parts and parse the content
 
@@ -653,7 +2412,6 @@ The meaning of clean is: *delete*, followed by *create*.
          if sDocumentPart.startswith("INTERFACE"):
 
             sRootPath = sDocumentPartPath
-            sSourceFilesRootFolderName = os.path.basename(sRootPath) # should be the package name
 
             listModules, bSuccess, sResult = self.__GetModulesList(sRootPath)
             if bSuccess is not True:
@@ -663,187 +2421,51 @@ The meaning of clean is: *delete*, followed by *create*.
             print(sResult)
             print()
 
+            # -- modules unchanged since previous build (incremental mode) are taken over from previous build,
+            #    all other modules are processed (in parallel, in case of more than one job is configured)
+            #    (in a partial build the modules not selected are taken over from previous build as well)
+            dictFingerprints = {}
+            dictVariables    = {}
+            dictSelected     = {}
+            listModulesToProcess = []
             for sModule in listModules:
-
-               print(f"* Module : '{sModule}'")
-
-               listLinesRST = [] # the module/chapter specific subset
-
-               # -- get informations about the source file and derive further information
-
-               oModule = CFile(sModule)
-               dModuleFileInfo = oModule.GetFileInfo()
-               del oModule
-               sModuleFilePath     = dModuleFileInfo['sFilePath']
-               sModuleFileNameOnly = dModuleFileInfo['sFileNameOnly']
-               sModuleFileSubPath  = sModuleFilePath[len(sRootPath)+1:]
-
-               # -- prepare the scope of the module file (used for labels within LaTeX code and for the names of LaTeX files generated out of rst code)
-               sModuleFileScope = ""
-               if sModuleFileSubPath == "":
-                  sModuleFileScope = f"{sSourceFilesRootFolderName}-{sModuleFileNameOnly}"
+               sFingerprint, dictVariables[sModule] = self.__GetSourceFingerprint(sModule)
+               dictFingerprints[sModule] = sFingerprint
+               sModuleRelPath = os.path.relpath(sModule, sRootPath)
+               dictSelected[sModule] = self.__IsSelected(sDocumentPart, sModule, sModuleRelPath, f"{os.path.basename(os.path.abspath(sRootPath))}/{sModuleRelPath}")
+               dictChapterBefore = self.__GetUnchangedChapter(sModule, sFingerprint, dictSelected[sModule])
+               if dictChapterBefore is None:
+                  listModulesToProcess.append(sModule)
                else:
-                  sModuleFileScope = f"{sSourceFilesRootFolderName}-{sModuleFileSubPath}-{sModuleFileNameOnly}"
-               sModuleFileScope   = self.__ConvertToScopeFormat(sModuleFileScope)
-               sModuleTeXFileName = f"{sModuleFileScope}.tex"
-               sModuleTeXFile     = f"{sBuildFolder}/{sModuleTeXFileName}"
-
-               # -- prepare the import path of the module in Python 'import' notation
-               sPythonModuleImport = ""
-               if sModuleFileSubPath == "":
-                  sPythonModuleImport = f"{sSourceFilesRootFolderName}.{sModuleFileNameOnly}"
-               else:
-                  sModuleFileSubPath = sModuleFileSubPath.replace('/', '.')
-                  sPythonModuleImport = f"{sSourceFilesRootFolderName}.{sModuleFileSubPath}.{sModuleFileNameOnly}"
-
-               # -- get all informations out of the source file
-               dictContent, bSuccess, sResult = oSourceParser.ParseSourceFile(sModule,
-                                                                              self.__dictPackageDocConfig['CONTROL']['INCLUDEPRIVATE'],
-                                                                              self.__dictPackageDocConfig['CONTROL']['INCLUDEUNDOCUMENTED'])
-               if bSuccess is not True:
-                  return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
-
-               if dictContent is None:
-                  print("  nothing relevant inside")
+                  print(f"* Module : '{sModule}'")
+                  if dictChapterBefore['FINGERPRINT'] == sFingerprint:
+                     print("  unchanged")
+                  else:
+                     print("  not selected (taken over from previous build)")
                   print()
-                  continue
-
-               listofdictFunctions = dictContent['listofdictFunctions']
-               listofdictClasses   = dictContent['listofdictClasses']
-               sFileDescription    = dictContent['sFileDescription']
-
-               # -- file description
-               if sFileDescription is not None:
-                  print("  file description found")
-                  listLinesRST.append(sFileDescription)
-
-               # -- rst content of all functions
-
-               for dictFunction in listofdictFunctions:
-                  sFunctionName  = dictFunction['sFunctionName']
-                  sFunctionScope = f"{sModuleFileScope}-{sFunctionName}"
-                  sFunctionScope = self.__ConvertToScopeFormat(sFunctionScope)
-                  sFunctionHeadline = f"Function: {sFunctionName}"
-                  self.__dictScopes[sFunctionScope] = sFunctionHeadline
-
-                  sFunctionDocString = dictFunction['sFunctionDocString']
-
-                  print(f"    > Function : '{sFunctionName}' / scope: '{sFunctionScope}'")
-
-                  listLinesRST.append(sFunctionScope)
-                  sFunctionHeadlineUnderline = len(sFunctionScope)*"="
-                  listLinesRST.append(sFunctionHeadlineUnderline)
-                  listLinesRST.append("")
-                  if sFunctionDocString is not None:
-                     listLinesRST.append(sFunctionDocString)
-
-               # eof for dictFunction in listofdictFunctions:
-
-
-               # -- rst content of all classes and methods
-
-               for dictClass in listofdictClasses:
-                  sClassName  = dictClass['sClassName']
-                  sClassScope = f"{sModuleFileScope}-{sClassName}"
-                  sClassScope = self.__ConvertToScopeFormat(sClassScope)
-                  sClassHeadline = f"Class: {sClassName}"
-                  self.__dictScopes[sClassScope] = sClassHeadline
-
-                  sClassDocString   = dictClass['sClassDocString']
-                  listofdictMethods = dictClass['listofdictMethods']
-
-                  print(f"  > Class : '{sClassName}' / scope: '{sClassScope}'")
-
-                  # tmp mapping
-                  sClassHeadline = sClassScope
-
-                  sPythonModuleImportFull = f"from {sPythonModuleImport} import {sClassName}"
-
-                  listLinesRST.append(sClassHeadline)
-                  sClassHeadlineUnderline = len(sClassHeadline)*"="
-                  listLinesRST.append(sClassHeadlineUnderline)
-                  listLinesRST.append("")
-                  listLinesRST.append("*Imported by*:")
-                  listLinesRST.append("")
-                  listLinesRST.append(".. code::python")
-                  listLinesRST.append("")
-                  listLinesRST.append(f"   {sPythonModuleImportFull}")
-                  listLinesRST.append("")
-                  if sClassDocString is not None:
-                     listLinesRST.append(sClassDocString)
-
-
-                  for dictMethod in listofdictMethods:
-                     sMethodName = dictMethod['sMethodName']
-                     bIsKeyword  = dictMethod['bIsKeyword']
-                     sIdentifier = "Method"
-                     if bIsKeyword is True:
-                        sIdentifier = "Keyword"
-                     sMethodHeadline = f"{sIdentifier}: {sMethodName}"
-                     sMethodScope    = f"{sModuleFileScope}-{sClassName}-{sMethodName}"
-                     sMethodScope    = self.__ConvertToScopeFormat(sMethodScope)
-                     self.__dictScopes[sMethodScope] = sMethodHeadline
-
-                     print(f"    - {sIdentifier} : '{sMethodName}' / scope: '{sMethodScope}'")
-
-                     # tmp mapping
-                     sMethodHeadline = sMethodScope
-
-                     listLinesRST.append(sMethodHeadline)
-                     sMethodHeadlineUnderline = len(sMethodHeadline)*"-"
-                     listLinesRST.append(sMethodHeadlineUnderline)
-                     listLinesRST.append("")
-                     sMethodDocString = dictMethod['sMethodDocString']
-                     if sMethodDocString is not None:
-                        listLinesRST.append(sMethodDocString)
-
-               # eof for dictClass in listofdictClasses:
 
-               print()
-
-               listLinesResolved, bSuccess, sResult = self.__ResolvePlaceholders(listLinesRST)
-               if bSuccess is not True:
-                  return listLinesResolved, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
-
-               sRSTCode = "\n".join(listLinesResolved)
-
-               # debug only; sRSTCodeFile not really required
-               sRSTCodeFileName = os.path.basename(sModule) + ".rst"
-               sRSTCodeFile = f"{sBuildFolder}/{sRSTCodeFileName}"
-               oRSTCodeFile = CFile(sRSTCodeFile)
-               oRSTCodeFile.Write(sRSTCode)
-               del oRSTCodeFile
-
-               # -- convert the complete rst content of the current source file to tex format
-
-               sTEX = pypandoc.convert_text(sRSTCode,
-                                            'tex',
-                                            format='rst')
-
-               listLinesTEX = sTEX.splitlines() # ensure proper line endings
-
-               # -- tex postprocessing (extended syntax and multiply-defined labels)
-               listLinesProcessed = self.__PostprocessTEX(listLinesTEX)
-
-               sTEX = "\n".join(listLinesProcessed)
-
-               # -- create the corresponding tex file for the current source file
-
-               oModuleTeXFile = CFile(sModuleTeXFile)
-               oModuleTeXFile.Write("%")
-               oModuleTeXFile.Write("% Generated at " + time.strftime('%d.%m.%Y - %H:%M:%S') + " by " + self.__dictPackageDocConfig['PACKAGENAME'])
-               oModuleTeXFile.Write("%")
-               oModuleTeXFile.Write()
-               oModuleTeXFile.Write(sTEX)
-               del oModuleTeXFile
+            dictResults, bSuccess, sResult = self.__ProcessModules(listModulesToProcess, sRootPath)
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
-               # -- save some infos needed for TOC of main TeX file
-               sFileName = dModuleFileInfo['sFileName']
-               dictChapterInfo ={}
-               dictChapterInfo['sChaptername'] = sFileName
-               dictChapterInfo['sTeXFileName'] = sModuleTeXFileName
-               dictChapterInfo['sLabel']       = sModuleFileScope
-               listofdictChapterInfo.append(dictChapterInfo)
+            # -- merge the results (in the order of the modules to keep the output independent from the number of jobs)
+            for sModule in listModules:
+               sFingerprint = dictFingerprints[sModule]
+               if sModule in dictResults:
+                  dictResult = dictResults[sModule]
+                  self.__dictScopes.update(dictResult['dictScopes'])
+                  dictChapterInfo = dictResult['dictChapterInfo']
+                  self.__RegisterChapter(sModule, sFingerprint, dictResult['listOutputs'], dictChapterInfo, listVariables=dictVariables[sModule])
+               else:
+                  dictChapterBefore = self.__GetUnchangedChapter(sModule, sFingerprint, dictSelected[sModule])
+                  dictChapterInfo = dictChapterBefore['CHAPTERINFO']
+                  self.__RegisterChapter(sModule, dictChapterBefore['FINGERPRINT'], dictChapterBefore['OUTPUTS'], dictChapterInfo, bRegenerated=False, listVariables=dictVariables[sModule])
+               if dictChapterInfo is not None:
+                  listofdictChapterInfo.append(dictChapterInfo)
+                  if dictSelected[sModule] is True:
+                     setSelectedChapters.add(dictChapterInfo['sTeXFileName'])
+                  sSubPackage = os.path.dirname(os.path.relpath(sModule, sRootPath)).replace("\\", "/").split("/")[0]
+                  listChapterGroups.append(f"{sDocumentPart}:{sSubPackage}")
 
             # eof for sModule in listModules:
 
@@ -853,7 +2475,23 @@ The meaning of clean is: *delete*, followed by *create*.
 
             # all other separate files (rst or tex)
 
-            if sDocumentPartPath.lower().endswith('rst'):
+            # -- in incremental mode unchanged files are taken over from previous build
+            #    (in a partial build also the files not selected)
+            sFingerprint, listVariables = self.__GetSourceFingerprint(sDocumentPartPath, bPlaceholders=sDocumentPartPath.lower().endswith('rst'))
+            bSelected = self.__IsSelected(sDocumentPart, sDocumentPartPath)
+            dictChapterBefore = self.__GetUnchangedChapter(sDocumentPartPath, sFingerprint, bSelected)
+            nChaptersBefore = len(listofdictChapterInfo)
+            if dictChapterBefore is not None:
+               if dictChapterBefore['FINGERPRINT'] == sFingerprint:
+                  print("  unchanged")
+               else:
+                  print("  not selected (taken over from previous build)")
+               self.__RegisterChapter(sDocumentPartPath, dictChapterBefore['FINGERPRINT'], dictChapterBefore['OUTPUTS'], dictChapterBefore['CHAPTERINFO'], bRegenerated=False, listVariables=listVariables)
+               if dictChapterBefore['CHAPTERINFO'] is not None:
+                  listofdictChapterInfo.append(dictChapterBefore['CHAPTERINFO'])
+                  listChapterGroups.append("ADDITIONAL")
+
+            elif sDocumentPartPath.lower().endswith('rst'):
                sRSTFile = sDocumentPartPath
                oRSTFile = CFile(sRSTFile)
                listLinesRST, bSuccess, sResult = oRSTFile.ReadLines()
@@ -878,26 +2516,22 @@ The meaning of clean is: *delete*, followed by *create*.
                sRSTCode = "\n".join(listLinesProcessed)
 
                # -- convert the complete rst content of the current source file to tex format
-               sTEX = pypandoc.convert_text(sRSTCode,
-                                            'tex',
-                                            format='rst')
+               listTEX, bSuccess, sResult = self.__ConvertRSTToTEXList([sRSTCode])
+               if bSuccess is not True:
+                  return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+               sTEX = listTEX[0]
 
                listLinesTEX = sTEX.splitlines() # ensure proper line endings
 
                # -- tex postprocessing (extended syntax and multiply-defined labels)
-               listLinesProcessed = self.__PostprocessTEX(listLinesTEX)
+               listLinesProcessed = self.__PostprocessTEX(listLinesTEX, self.__dictScopes)
 
                sTEX = "\n".join(listLinesProcessed)
 
                # -- create the corresponding tex file for the current source file
-
-               oTeXFile = CFile(sTeXFile)
-               oTeXFile.Write("%")
-               oTeXFile.Write("% Generated at " + time.strftime('%d.%m.%Y - %H:%M:%S') + " by " + self.__dictPackageDocConfig['PACKAGENAME'])
-               oTeXFile.Write("%")
-               oTeXFile.Write()
-               oTeXFile.Write(sTEX)
-               del oTeXFile
+               bSuccess, sResult = self.__WriteTeXFile(sTeXFile, sTEX)
+               if bSuccess is not True:
+                  return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
                # -- save some infos needed for TOC of main TeX file
                dictChapterInfo ={}
@@ -905,6 +2539,8 @@ The meaning of clean is: *delete*, followed by *create*.
                dictChapterInfo['sTeXFileName'] = f"{sRSTFileNameOnly}.tex"
                dictChapterInfo['sLabel']       = self.__ConvertToScopeFormat(f"{sRSTFileNameOnly}")
                listofdictChapterInfo.append(dictChapterInfo)
+               listChapterGroups.append("ADDITIONAL")
+               self.__RegisterChapter(sDocumentPartPath, sFingerprint, [dictChapterInfo['sTeXFileName']], dictChapterInfo, listVariables=listVariables)
 
             # eof if sDocumentPartPath.lower().endswith('rst'):
 
@@ -928,38 +2564,95 @@ The meaning of clean is: *delete*, followed by *create*.
                dictChapterInfo['sTeXFileName'] = f"{sTEXFileNameOnly}.tex"
                dictChapterInfo['sLabel']       = self.__ConvertToScopeFormat(f"{sTEXFileNameOnly}")
                listofdictChapterInfo.append(dictChapterInfo)
+               listChapterGroups.append("ADDITIONAL")
+               self.__RegisterChapter(sDocumentPartPath, sFingerprint, [dictChapterInfo['sTeXFileName']], dictChapterInfo, listVariables=listVariables)
+
+            # eof elif sDocumentPartPath.lower().endswith('tex'):
+
+            if bSelected is True:
+               for dictChapterInfo in listofdictChapterInfo[nChaptersBefore:]:
+                  setSelectedChapters.add(dictChapterInfo['sTeXFileName'])
 
-            # eof else - if sDocumentPartPath.lower().endswith('rst'):
          # eof else - if sDocumentPart.startswith("INTERFACE"):
       # eof for sDocumentPart in listDocumentParts:
 
+      if ( (self.__dictPackageDocConfig['listOnly'] is not None) and (len(setSelectedChapters) == 0) ):
+         bSuccess = False
+         sResult  = f"No document part and no module matches the partial build selection '{','.join(self.__dictPackageDocConfig['listOnly'])}' (command line parameter '--only')"
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
       print()
 
+      if self.__oConversionCache is not None:
+         print(f"Conversion cache: {self.__oConversionCache.nHits} hits, {self.__oConversionCache.nMisses} misses")
+         print()
+
       # -- finally create the main TeX file and the PDF
 
-      # make the styles folder available within the new build folder
-      sStylesFolder = self.__dictPackageDocConfig['LATEXSTYLESFOLDER']
-      oStylesFolder = CFolder(sStylesFolder)
-      bSuccess, sResult = oStylesFolder.CopyTo(sBuildFolder)
+      # remove outputs of chapters that are not part of the documentation any more (incremental mode)
+      bSuccess, sResult = self.__DeleteStaleOutputs()
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      # make the pictures referenced within the chapters available within the new build folder
+      bSuccess, sResult = self.__CopyPictures()
       if bSuccess is not True:
          return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      print(COLBY + sResult)
+      print()
+
+      # optionally reduce the size of the pictures (before they are embedded in the PDF file)
+      if self.__oPictureProcessor is not None:
+         bSuccess, sResult = self.__PreprocessPictures()
+         if bSuccess is not True:
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         print(COLBY + sResult)
+         print()
+
+      # make the styles folder available within the new build folder
+      sStylesFolder = self.__dictPackageDocConfig['LATEXSTYLESFOLDER']
+      bUnchanged = self.__IsAssetUnchanged('STYLES', self.__GetFolderFingerprint(sStylesFolder))
+      if ( (bUnchanged is False) or (os.path.isdir(f"{sBuildFolder}/styles") is False) ):
+         bSuccess, sResult = self.__StageFolder(sStylesFolder, f"{sBuildFolder}/styles")
+         if bSuccess is not True:
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      # in incremental mode we are done in case of nothing has changed compared to the previous build and the PDF file is still available
+      sMainFingerprint = self.__GetFingerprint(self.__NeutralizeNow(json.dumps(self.__dictPackageDocConfig['DOCUMENT'], sort_keys=True)),
+                                               json.dumps(listofdictChapterInfo, sort_keys=True),
+                                               json.dumps(self.__dictPackageDocConfig['SHARDING'], sort_keys=True),
+                                               json.dumps(self.__dictPackageDocConfig['listOnly']))
+      self.__dictManifest['MAIN'] = sMainFingerprint
+      if ( (self.__dictPackageDocConfig['bIncremental'] is True) and (self.__bChanged is False) and
+           (self.__dictManifestBefore['MAIN'] == sMainFingerprint) ):
+         sMainTexFileNameOnly = os.path.splitext(self.__dictPackageDocConfig['DOCUMENT']['OUTPUTFILENAME'])[0]
+         sPDFFileExpected = f"{sBuildFolder}/{sMainTexFileNameOnly}.pdf"
+         if ( (self.__dictPackageDocConfig['bSimulateOnly'] is True) or (os.path.isfile(sPDFFileExpected) is True) ):
+            bSuccess, sResult = self.__SaveManifest()
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            bSuccess = True
+            sResult  = "Nothing changed since previous build; documentation is up to date"
+            return bSuccess, sResult
 
       # access to patterns
       oPatterns = CPatterns()
 
       # 1. autodefined sty file (containing runtime informations)
       sAutodefinedFile = f"{sBuildFolder}/styles/autodefined.sty"
-      oAutodefinedFile = CFile(sAutodefinedFile)
-      sAutodefinedHeader = oPatterns.GetAutodefinedHeader(time.strftime('%d.%m.%Y - %H:%M:%S'))
-      oAutodefinedFile.Write(sAutodefinedHeader)
+      listLines = []
+      sAutodefinedHeader = oPatterns.GetAutodefinedHeader(self.__GetTimestamp())
+      listLines.append(sAutodefinedHeader)
       REPOSITORYNAME = self.__dictPackageDocConfig['REPOSITORYNAME'].replace("_", r"\_")
       sCommand = r"\newcommand{\repo}{\textbf{" + REPOSITORYNAME + "}}"
-      oAutodefinedFile.Write(sCommand)
+      listLines.append(sCommand)
       PACKAGENAME = self.__dictPackageDocConfig['PACKAGENAME'].replace("_", r"\_")
       sCommand = r"\newcommand{\pkg}{\textbf{" + PACKAGENAME + "}}"
-      oAutodefinedFile.Write(sCommand)
-      oAutodefinedFile.Write()
-      del oAutodefinedFile
+      listLines.append(sCommand)
+      listLines.append("")
+      bSuccess, sResult = self.__oOutputWriter.Write(sAutodefinedFile, "\n".join(listLines) + "\n")
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
       # 2. main tex file
       sDocumentationTeXFileName = self.__dictPackageDocConfig['DOCUMENT']['OUTPUTFILENAME']
@@ -967,37 +2660,80 @@ The meaning of clean is: *delete*, followed by *create*.
       self.__dictPackageDocConfig['sMainTexFile'] = sMainTexFile
       oMainTexFile = CFile(sMainTexFile)
       dMainTexFileInfo = oMainTexFile.GetFileInfo()
+      del oMainTexFile
+      listLines = []
       sMainTexFileNameOnly = dMainTexFileInfo['sFileNameOnly']
       sPDFFileName = f"{sMainTexFileNameOnly}.pdf"
       sPDFFileExpected = f"{sBuildFolder}/{sPDFFileName}"
       self.__dictPackageDocConfig['sPDFFileName']     = sPDFFileName # used later to copy the file to another location
       self.__dictPackageDocConfig['sPDFFileExpected'] = sPDFFileExpected # used later to verify the build
+
+      # -- partial build: every chapter is placed within an own tex file imported by '\include'; only the selected chapters are typeset
+      #    ('\includeonly'), the page numbers and labels of all other chapters are taken out of their auxiliary files
+      listIncludeOnly = None
+      self.__listIncludedFiles = []
+      if self.__dictPackageDocConfig['listOnly'] is not None:
+         listIncludeOnly = []
+         bAuxMissing     = False
+         for dictChapterInfo in listofdictChapterInfo:
+            sIncludeName = f"{os.path.splitext(dictChapterInfo['sTeXFileName'])[0]}{INCLUDESUFFIX}"
+            self.__listIncludedFiles.append(sIncludeName)
+            if dictChapterInfo['sTeXFileName'] in setSelectedChapters:
+               listIncludeOnly.append(sIncludeName)
+            elif os.path.isfile(f"{sBuildFolder}/{sIncludeName}.aux") is False:
+               bAuxMissing = True
+         if bAuxMissing is True:
+            # the auxiliary files of the chapters are written by a partial build only; the first partial build typesets all chapters
+            print(COLBY + "Auxiliary files of chapters not selected are not available (no previous partial build); all chapters are typeset once")
+            print()
+            listIncludeOnly = list(self.__listIncludedFiles)
+
       sHeader = oPatterns.GetHeader(sTitle=self.__dictPackageDocConfig['DOCUMENT']['TITLE'],
                                     sVersion=self.__dictPackageDocConfig['DOCUMENT']['VERSION'],
                                     sAuthor=self.__dictPackageDocConfig['DOCUMENT']['AUTHOR'],
-                                    sDate=self.__dictPackageDocConfig['DOCUMENT']['DATE'])
-      oMainTexFile.Write(sHeader)
+                                    sDate=self.__dictPackageDocConfig['DOCUMENT']['DATE'],
+                                    listIncludeOnly=listIncludeOnly)
+      listLines.append(sHeader)
 
       # -- add modules to main TeX file
       for dictChapterInfo in listofdictChapterInfo:
          sChapter = oPatterns.GetChapter(sHeadline=dictChapterInfo['sChaptername'], sLabel=dictChapterInfo['sLabel'], sDocumentName=dictChapterInfo['sTeXFileName'])
-         oMainTexFile.Write(sChapter)
+         if listIncludeOnly is None:
+            listLines.append(sChapter)
+         else:
+            sIncludeName = f"{os.path.splitext(dictChapterInfo['sTeXFileName'])[0]}{INCLUDESUFFIX}"
+            bSuccess, sResult = self.__oOutputWriter.Write(f"{sBuildFolder}/{sIncludeName}.tex", sChapter + "\n")
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+            listLines.append(oPatterns.GetInclude(sIncludeName))
 
       # -- add creation date to main TeX file
       sPDFFileName_masked = sPDFFileName.replace('_', r'\_') # LaTeX requires this masking
-      oMainTexFile.Write(r"\vfill")
-      oMainTexFile.Write(r"\begin{center}")
-      oMainTexFile.Write(r"\begin{tabular}{m{16em}}\hline")
-      oMainTexFile.Write(r"   \multicolumn{1}{c}{\textbf{" + f"{sPDFFileName_masked}" + r"}}\\")
-      oMainTexFile.Write(r"   \multicolumn{1}{c}{\textit{Created at " + self.__dictPackageDocConfig['NOW'] + r"}}\\")
-      oMainTexFile.Write(r"   \multicolumn{1}{c}{\textit{by GenPackageDoc v. " + VERSION + r"}}\\ \hline")
-      oMainTexFile.Write(r"\end{tabular}")
-      oMainTexFile.Write(r"\end{center}")
+      listCreationLines = []
+      listCreationLines.append(r"\vfill")
+      listCreationLines.append(r"\begin{center}")
+      listCreationLines.append(r"\begin{tabular}{m{16em}}\hline")
+      listCreationLines.append(r"   \multicolumn{1}{c}{\textbf{" + f"{sPDFFileName_masked}" + r"}}\\")
+      listCreationLines.append(r"   \multicolumn{1}{c}{\textit{Created at " + self.__dictPackageDocConfig['NOW'] + r"}}\\")
+      listCreationLines.append(r"   \multicolumn{1}{c}{\textit{by GenPackageDoc v. " + VERSION + r"}}\\ \hline")
+      listCreationLines.append(r"\end{tabular}")
+      listCreationLines.append(r"\end{center}")
+      listLines.extend(listCreationLines)
 
       sFooter = oPatterns.GetFooter()
-      oMainTexFile.Write(sFooter)
+      listLines.append(sFooter)
 
-      del oMainTexFile
+      bSuccess, sResult = self.__oOutputWriter.Write(sMainTexFile, "\n".join(listLines) + "\n")
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      # -- 2.a tex files of the shards (in case of the documentation is compiled in several parts; not in a partial build)
+      if ( (self.__dictPackageDocConfig['SHARDING'] is not None) and (listIncludeOnly is None) ):
+         bSuccess, sResult = self.__WriteShards(listofdictChapterInfo, listChapterGroups, listCreationLines)
+         if bSuccess is not True:
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         print(COLBY + sResult)
+         print()
 
       # -- 3. Dump the complete configuration
       sOutputFolder = self.__dictPackageDocConfig['OUTPUT']
@@ -1007,27 +2743,30 @@ The meaning of clean is: *delete*, followed by *create*.
       sDumpConfigFileNameTxt = f"_CONFIG_{sPackageName}.txt"
       sDumpConfigFileTxt = f"{sOutputFolder}/{sDumpConfigFileNameTxt}"
       try:
-         hDumpConfigFile = open(sDumpConfigFileTxt, "w", encoding="utf-8")
-         PrettyPrint(self.__dictPackageDocConfig, hDumpConfigFile, bToConsole=False, sPrefix=None)
-         hDumpConfigFile.close()
-         del hDumpConfigFile
+         hDumpConfig = io.StringIO()
+         PrettyPrint(self.__dictPackageDocConfig, hDumpConfig, bToConsole=False, sPrefix=None)
+         sDumpConfig = hDumpConfig.getvalue()
+         del hDumpConfig
       except Exception as reason:
          bSuccess = None
          sResult  = str(reason)
          return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      bSuccess, sResult = self.__oOutputWriter.Write(sDumpConfigFileTxt, sDumpConfig)
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
       # -- 3.b json format
       sDumpConfigFileNameJson = f"_CONFIG_{sPackageName}.json"
       sDumpConfigFileJson = f"{sOutputFolder}/{sDumpConfigFileNameJson}"
       try:
-         hDumpConfigFile = open(sDumpConfigFileJson, "w", encoding="utf-8")
-         json.dump(self.__dictPackageDocConfig, hDumpConfigFile, indent=3)
-         hDumpConfigFile.close()
-         del hDumpConfigFile
+         sDumpConfig = json.dumps(self.__dictPackageDocConfig, indent=3)
       except Exception as reason:
          bSuccess = None
          sResult  = str(reason)
          return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      bSuccess, sResult = self.__oOutputWriter.Write(sDumpConfigFileJson, sDumpConfig)
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
 
       # -- make a backup of the configuration (if configured)
       sConfigDestFolder = self.__dictPackageDocConfig['CONFIGDEST']
@@ -1053,7 +2792,15 @@ The meaning of clean is: *delete*, followed by *create*.
             print(COLBY + sResult)
             print()
 
-      # 4. PDF file
+      # -- 4. manifest of the current build (required for following builds in incremental mode)
+      bSuccess, sResult = self.__SaveManifest()
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      print(f"Output files: {self.__oOutputWriter.nWritten} written, {self.__oOutputWriter.nSkipped} unchanged")
+      print()
+
+      # 5. PDF file
       if self.__dictPackageDocConfig['bSimulateOnly'] is True:
          print()
          print(COLBY + "GenPackageDoc is running in simulation mode.")
@@ -1065,14 +2812,151 @@ The meaning of clean is: *delete*, followed by *create*.
       else:
          bSuccess, sResult = self.__GenDocPDF()
 
+      # -- durations of the external tools
+      listTimingSummary = self.__oProcessRunner.GetTimingSummary()
+      if len(listTimingSummary) > 0:
+         print("Execution time of external tools:")
+         for sLine in listTimingSummary:
+            print(f"* {sLine}")
+         print()
+
       if bSuccess is not True:
          sResult = CString.FormatResult(sMethod, bSuccess, sResult)
 
       return bSuccess, sResult
 
+   # eof def __Build(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Build(self):
+      """
+Builds the documentation. The build folder is locked during the build: other builds using the same build folder
+(within this process or within other processes) are rejected.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CDocBuilder.Build"
+
+      bSuccess, sResult = self.__AcquireBuildLock()
+      if bSuccess is not True:
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      try:
+         bSuccess, sResult = self.__Build()
+      finally:
+         self.__ReleaseBuildLock()
+
+      return bSuccess, sResult
+
    # eof def Build(self):
 
    # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetWatchedPaths(self):
+      """
+Returns all sources of the documentation, that have to be watched for changes in watch mode (command line parameter ``--watch``):
+the ``INTERFACE`` folders (Python modules only), the separate rst and tex files, the pictures folder, the diagrams folder,
+the LaTeX styles folder and the configuration file ``packagedoc_config.json``.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+* ``listWatchedPaths``
+
+  / *Type*: list /
+
+  List of tuples ``(path, extensions)`` (see ``CFileWatcher``).
+      """
+
+      listWatchedPaths = []
+      for sDocumentPart in self.__dictPackageDocConfig['TOC']['DOCUMENTPARTS']:
+         sDocumentPartPath = self.__dictPackageDocConfig['TOC'][sDocumentPart]
+         if sDocumentPart.startswith("INTERFACE"):
+            listWatchedPaths.append((sDocumentPartPath, ('.py',)))
+         else:
+            listWatchedPaths.append((sDocumentPartPath, None))
+      for sKey in ('PICTURES', 'DIAGRAMS', 'LATEXSTYLESFOLDER'):
+         if ( (self.__dictPackageDocConfig[sKey] is not None) and (os.path.isdir(self.__dictPackageDocConfig[sKey]) is True) ):
+            listWatchedPaths.append((self.__dictPackageDocConfig[sKey], None))
+      listWatchedPaths.append((f"{self.__dictPackageDocConfig['PACKAGEDOC']}/packagedoc_config.json", None))
+      return listWatchedPaths
+
+   # eof def GetWatchedPaths(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetAffectedChapters(self, listChangedFiles=[]):
+      """
+Maps changed files to the chapters of the previous build that are affected by the changes: chapters generated out of the files
+and chapters referencing the files (pictures, diagrams). The fingerprints of the changed files kept in memory are discarded.
+
+**Arguments:**
+
+* ``listChangedFiles``
+
+  / *Condition*: required / *Type*: list /
+
+  The files that have changed (see ``CFileWatcher.Wait``).
+
+**Returns:**
+
+* ``dictAffectedChapters``
+
+  / *Type*: dict /
+
+  The names of the affected chapters for every changed file (empty list in case of the file is not related to a chapter,
+  e.g. a new Python module or a LaTeX style).
+      """
+
+      dictManifest = self.__dictManifest
+      if ( (dictManifest is None) or (len(dictManifest['CHAPTERS']) == 0) ):
+         dictManifest = self.__dictManifestBefore
+      dictChapters = {}
+      if dictManifest is not None:
+         dictChapters = dictManifest['CHAPTERS']
+
+      dictAffectedChapters = {}
+      for sChangedFile in listChangedFiles:
+         sChangedFileNormalized = CString.NormalizePath(sChangedFile)
+         for tupleKey in [tupleKey for tupleKey in self.__dictSourceFingerprints if tupleKey[0] == sChangedFileNormalized]:
+            del self.__dictSourceFingerprints[tupleKey]
+         sChangedName = os.path.splitext(os.path.basename(sChangedFile))[0]
+         listChapters = []
+         for sChapterKey, dictChapter in dictChapters.items():
+            if dictChapter['CHAPTERINFO'] is None:
+               continue
+            if ( (sChapterKey == sChangedFileNormalized) or
+                 (sChangedName in [os.path.splitext(os.path.basename(sPicture))[0] for sPicture in dictChapter.get('PICTURES', [])]) ):
+               listChapters.append(dictChapter['CHAPTERINFO']['sChaptername'])
+         dictAffectedChapters[sChangedFile] = sorted(listChapters)
+      return dictAffectedChapters
+
+   # eof def GetAffectedChapters(self, listChangedFiles=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
 
 # eof class CDocBuilder():
 
@@ -0,0 +1,220 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CDocWatcher.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the watch mode: the documentation is rebuilt whenever a source file changes.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, time
+import colorama as col
+
+from GenPackageDoc.CPackageDocConfig import CPackageDocConfig
+from GenPackageDoc.CDocBuilder import CDocBuilder
+from GenPackageDoc.CFileWatcher import CFileWatcher
+
+from PythonExtensionsCollection.String.CString import CString
+
+col.init(autoreset=True)
+COLBR = col.Style.BRIGHT + col.Fore.RED
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+COLBG = col.Style.BRIGHT + col.Fore.GREEN
+
+# time (in seconds) without further changes, that completes a set of changes
+DEBOUNCE = 0.5
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CDocWatcher():
+   """
+The ``CDocWatcher`` class implements the watch mode of **GenPackageDoc** (command line parameter ``--watch``).
+
+The documentation is built once; afterwards all sources (see ``CDocBuilder.GetWatchedPaths``) are watched for changes.
+Every set of changes is mapped to the affected chapters and the documentation is rebuilt in incremental mode. The process
+stays alive between the builds: configuration, conversion engine, PlantUML service and the fingerprints of the sources are kept
+in memory. In case of the configuration file changes, configuration and documentation builder are created again.
+   """
+
+   def __init__(self, oRepositoryConfig=None, oPackageDocConfig=None, oDocBuilder=None):
+      """
+Constructor of class ``CDocWatcher``.
+
+**Arguments:**
+
+* ``oRepositoryConfig``
+
+  / *Condition*: required / *Type*: CRepositoryConfig /
+
+  The repository configuration (required to read the configuration again).
+
+* ``oPackageDocConfig``
+
+  / *Condition*: required / *Type*: CPackageDocConfig /
+
+  The current configuration.
+
+* ``oDocBuilder``
+
+  / *Condition*: required / *Type*: CDocBuilder /
+
+  The documentation builder (reused for all builds).
+      """
+
+      self.__oRepositoryConfig = oRepositoryConfig
+      self.__oPackageDocConfig = oPackageDocConfig
+      self.__oDocBuilder       = oDocBuilder
+      self.__oFileWatcher      = None
+
+   def __del__(self):
+      if self.__oFileWatcher is not None:
+         self.__oFileWatcher.Close()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __BuildOnce(self):
+      """Executes a single build and prints the result (errors do not stop the watch mode).
+      """
+      fStart = time.time()
+      bSuccess, sResult = self.__oDocBuilder.Build()
+      print()
+      if bSuccess is None:
+         print(COLBR + f"Exception: {sResult}!")
+      elif bSuccess is False:
+         print(COLBR + f"Error: {sResult}!")
+      else:
+         print(COLBY + sResult)
+         print()
+         print(COLBG + f"genpackagedoc done ({time.time() - fStart:.2f} s)")
+      print()
+      return bSuccess
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __StartFileWatcher(self):
+      """Starts watching the sources of the current configuration.
+      """
+      if self.__oFileWatcher is not None:
+         self.__oFileWatcher.Close()
+      listWatchedPaths = self.__oDocBuilder.GetWatchedPaths()
+      self.__oFileWatcher = CFileWatcher(listWatchedPaths)
+      print(COLBY + f"Watching {len(listWatchedPaths)} paths for changes ({self.__oFileWatcher.sMethod}); stop with Ctrl+C")
+      print()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __ReloadConfig(self):
+      """Reads the configuration again and creates a new documentation builder. In case of the new configuration is invalid,
+the previous one is kept.
+      """
+      try:
+         oPackageDocConfig = CPackageDocConfig(self.__oRepositoryConfig)
+         oDocBuilder = CDocBuilder(oPackageDocConfig)
+      except Exception as ex:
+         print(COLBR + f"Exception: {ex}!")
+         print(COLBY + "Configuration not reloaded; the previous configuration is used")
+         print()
+         return False
+      self.__oDocBuilder.Close() # conversion engine and PlantUML service of the previous configuration
+      self.__oPackageDocConfig = oPackageDocConfig
+      self.__oDocBuilder       = oDocBuilder
+      self.__StartFileWatcher()
+      return True
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Run(self):
+      """
+Builds the documentation and rebuilds it whenever a source file changes, until the process is stopped (Ctrl+C).
+Failing builds do not stop the watch mode.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CDocWatcher.Run"
+
+      try:
+         # the sources are watched before the first build starts (changes during a build trigger the next build)
+         self.__StartFileWatcher()
+         self.__BuildOnce()
+         while True:
+            listChangedFiles = self.__oFileWatcher.Wait(DEBOUNCE)
+            print(COLBY + f"{len(listChangedFiles)} file(s) changed:")
+            sConfigFile = os.path.abspath(f"{self.__oPackageDocConfig.Get('PACKAGEDOC')}/packagedoc_config.json")
+            dictAffectedChapters = self.__oDocBuilder.GetAffectedChapters(listChangedFiles)
+            for sChangedFile in listChangedFiles:
+               if sChangedFile == sConfigFile:
+                  print(f"* '{sChangedFile}' : configuration (all chapters)")
+               elif len(dictAffectedChapters[sChangedFile]) > 0:
+                  print(f"* '{sChangedFile}' : chapter(s) {', '.join(dictAffectedChapters[sChangedFile])}")
+               else:
+                  print(f"* '{sChangedFile}' : no chapter of the previous build")
+            print()
+            if sConfigFile in listChangedFiles:
+               self.__ReloadConfig()
+            self.__BuildOnce()
+      except KeyboardInterrupt:
+         print()
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      finally:
+         if self.__oFileWatcher is not None:
+            self.__oFileWatcher.Close()
+            self.__oFileWatcher = None
+
+      bSuccess = True
+      sResult  = "Watch mode stopped"
+      return bSuccess, sResult
+
+   # eof def Run(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CDocWatcher():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,848 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CDocutilsEngine.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing an engine that converts rst code to tex code within the current process (based on docutils).
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, sys, re, io
+
+from PythonExtensionsCollection.String.CString import CString
+
+try:
+   import docutils
+   import docutils.core
+   import docutils.nodes as nodes
+except ImportError:
+   docutils = None # optional dependency; checked when the engine is created
+
+# version of the tex code generation; to be increased in case of the generated tex code changes (invalidates the conversion cache)
+RENDERERVERSION = "1"
+
+# -- escaping of special characters
+
+# characters that are replaced in the same way in text and in code
+DICTSPECIALCHARACTERS = {'{' : r"\{",
+                         '}' : r"\}",
+                         '$' : r"\$",
+                         '%' : r"\%",
+                         '&' : r"\&",
+                         '#' : r"\#",
+                         '_' : r"\_",
+                         '^' : r"\^{}",
+                         '[' : r"{[}",
+                         ']' : r"{]}"}
+
+# characters that are replaced by a control sequence (the termination of the control sequence depends on the next character)
+DICTCONTROLSEQUENCES = {'\\' : r"\textbackslash",
+                        '~'  : r"\textasciitilde",
+                        "'"  : r"\textquotesingle",
+                        '<'  : r"\textless",
+                        '>'  : r"\textgreater",
+                        '|'  : r"\textbar"}
+
+# typographic characters
+DICTTYPOGRAPHY = {'\u2026' : r"\ldots{}",
+                  '\u201c' : "``",
+                  '\u201d' : "''",
+                  '\u2018' : "`",
+                  '\u2019' : "'",
+                  '\u2013' : "--",
+                  '\u2014' : "---",
+                  '\u00a0' : "~"}
+
+# characters within code blocks (environment 'Highlighting' of pandoc.sty)
+DICTHIGHLIGHTING = {'\\' : r"\textbackslash{}",
+                    '{'  : r"\{",
+                    '}'  : r"\}",
+                    '_'  : r"\_",
+                    '&'  : r"\&",
+                    '%'  : r"\%",
+                    '#'  : r"\#",
+                    '`'  : r"\textasciigrave{}",
+                    "'"  : r"\textquotesingle{}",
+                    '-'  : r"{-}",
+                    '~'  : r"\textasciitilde{}",
+                    '^'  : r"\^{}",
+                    '>'  : r"\textgreater{}",
+                    '<'  : r"\textless{}"}
+
+# mapping of rst admonitions to the boxes defined in admonitions.sty
+DICTADMONITIONS = {'attention' : ("boxerror",   "Attention"),
+                   'caution'   : ("boxwarning", "Caution"),
+                   'danger'    : ("boxerror",   "Danger"),
+                   'error'     : ("boxerror",   "Error"),
+                   'hint'      : ("boxhint",    "Hint"),
+                   'important' : ("boxwarning", "Important"),
+                   'note'      : ("boxhint",    "Note"),
+                   'tip'       : ("boxtip",     "Tip"),
+                   'warning'   : ("boxwarning", "Warning")}
+
+# --------------------------------------------------------------------------------------------------------------
+
+def EscapeText(sText=""):
+   """
+Escapes ``sText`` for the usage within LaTeX text (in the same way Pandoc does).
+   """
+   listParts = []
+   nLength = len(sText)
+   for nIndex, sChar in enumerate(sText):
+      sNext = sText[nIndex+1] if nIndex+1 < nLength else ""
+      if sChar in DICTSPECIALCHARACTERS:
+         listParts.append(DICTSPECIALCHARACTERS[sChar])
+      elif sChar in DICTCONTROLSEQUENCES:
+         sControlSequence = DICTCONTROLSEQUENCES[sChar]
+         if sNext.isalpha():
+            listParts.append(sControlSequence + " ")
+         elif ( (sNext == "") or sNext.isspace() ):
+            listParts.append(sControlSequence + "{}")
+         else:
+            listParts.append(sControlSequence)
+      elif sChar in DICTTYPOGRAPHY:
+         listParts.append(DICTTYPOGRAPHY[sChar])
+      elif ( (sChar == '-') and (sNext == '-') ):
+         listParts.append(r"-\/") # avoid ligatures
+      else:
+         listParts.append(sChar)
+   return "".join(listParts)
+
+def EscapeCode(sCode=""):
+   """
+Escapes ``sCode`` for the usage within ``\\texttt`` (in the same way Pandoc does).
+   """
+   listParts = []
+   nLength = len(sCode)
+   for nIndex, sChar in enumerate(sCode):
+      sNext = sCode[nIndex+1] if nIndex+1 < nLength else ""
+      if sChar in DICTSPECIALCHARACTERS:
+         listParts.append(DICTSPECIALCHARACTERS[sChar])
+      elif sChar in DICTCONTROLSEQUENCES:
+         listParts.append(DICTCONTROLSEQUENCES[sChar] + "{}")
+      elif sChar.isspace():
+         listParts.append("\\ ")
+      elif ( (sChar == '-') and (sNext == '-') ):
+         listParts.append(r"-\/")
+      else:
+         listParts.append(sChar)
+   return "".join(listParts)
+
+def EscapeHighlighting(sCode=""):
+   """
+Escapes ``sCode`` for the usage within the ``Highlighting`` environment.
+   """
+   return "".join([DICTHIGHLIGHTING.get(sChar, sChar) for sChar in sCode])
+
+def EscapeURL(sURL=""):
+   """
+Escapes ``sURL`` for the usage within ``\\href`` and ``\\url``.
+   """
+   sURL = re.sub(r"\s", "%20", sURL)
+   for sChar in ('%', '#', '{', '}'):
+      sURL = sURL.replace(sChar, "\\" + sChar)
+   return sURL
+
+def GetIdentifier(sText=""):
+   """
+Computes the identifier of a headline (in the same way Pandoc does): all characters except alphanumerics, underscores,
+hyphens and periods are removed, spaces are replaced by hyphens, everything up to the first letter is removed.
+   """
+   sIdentifier = "".join([sChar for sChar in sText if ( sChar.isalnum() or (sChar in "_-.") or sChar.isspace() )])
+   sIdentifier = re.sub(r"\s+", "-", sIdentifier.strip()).lower()
+   sIdentifier = re.sub(r"^[^a-z\u00c0-\uffff]+", "", sIdentifier)
+   if sIdentifier == "":
+      sIdentifier = "section"
+   return sIdentifier
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CLaTeXRenderer():
+   """
+The ``CLaTeXRenderer`` class renders a docutils document tree to LaTeX code. The LaTeX code is a fragment (like the one Pandoc creates
+out of the docstrings and the separate rst files) and uses the commands and environments defined in the GenPackageDoc styles
+(``pandoc.sty``, ``admonitions.sty``).
+   """
+
+   def __init__(self, oDocument=None, sRSTCode=""):
+      """
+Constructor of class ``CLaTeXRenderer``.
+
+**Arguments:**
+
+* ``oDocument``
+
+  / *Condition*: required / *Type*: docutils.nodes.document /
+
+  The document tree to render.
+
+* ``sRSTCode``
+
+  / *Condition*: optional / *Type*: str / *Default*: "" /
+
+  The rst code the document tree is parsed from (needed for details that are not part of the document tree, like the kind of tables).
+      """
+
+      self.__oDocument    = oDocument
+      self.__listLinesRST = sRSTCode.splitlines()
+      self.__nEnumDepth   = 0
+
+      # identifiers of the sections (key: docutils id) and footnotes (key: docutils id)
+      self.__dictIdentifiers = {}
+      self.__dictFootnotes   = {}
+      setIdentifiers = set()
+      for oSection in self.__oDocument.findall(nodes.section):
+         sIdentifier = GetIdentifier(oSection[0].astext())
+         if sIdentifier in setIdentifiers:
+            nIndex = 1
+            while f"{sIdentifier}-{nIndex}" in setIdentifiers:
+               nIndex = nIndex + 1
+            sIdentifier = f"{sIdentifier}-{nIndex}"
+         setIdentifiers.add(sIdentifier)
+         for sId in oSection['ids']:
+            self.__dictIdentifiers[sId] = sIdentifier
+         oSection['genpackagedoc-identifier'] = sIdentifier
+      for oFootnote in self.__oDocument.findall(nodes.footnote):
+         for sId in oFootnote['ids']:
+            self.__dictFootnotes[sId] = oFootnote
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Render(self):
+      """
+Renders the document tree.
+
+**Returns:**
+
+* ``sTEX``
+
+  / *Type*: str /
+
+  The LaTeX code.
+      """
+      return "\n\n".join(self.__RenderBlocks(self.__oDocument.children, 1))
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderBlocks(self, listNodes=[], nLevel=1):
+      """Renders a list of block elements. Returns a list of LaTeX code blocks.
+      """
+      listBlocks = []
+      for oNode in listNodes:
+         listBlocks.extend([sBlock for sBlock in self.__RenderBlock(oNode, nLevel) if sBlock != ""])
+      return listBlocks
+
+   def __RenderBlock(self, oNode=None, nLevel=1):
+      """Renders a single block element. Returns a list of LaTeX code blocks (sections contain more than one block).
+      """
+
+      if isinstance(oNode, (nodes.comment, nodes.target, nodes.substitution_definition, nodes.footnote, nodes.citation,
+                            nodes.system_message, nodes.pending, nodes.decoration)):
+         return []
+
+      if isinstance(oNode, nodes.section):
+         return self.__RenderSection(oNode, nLevel)
+
+      if isinstance(oNode, nodes.paragraph):
+         return [self.__RenderInlines(oNode.children)]
+
+      if isinstance(oNode, nodes.bullet_list):
+         return [self.__RenderList("itemize", oNode, [])]
+
+      if isinstance(oNode, nodes.enumerated_list):
+         return [self.__RenderEnumeration(oNode, nLevel)]
+
+      if isinstance(oNode, (nodes.definition_list, nodes.field_list, nodes.option_list)):
+         return [self.__RenderDescription(oNode, nLevel)]
+
+      if isinstance(oNode, nodes.block_quote):
+         return ["\\begin{quote}\n" + "\n\n".join(self.__RenderBlocks(oNode.children, nLevel)) + "\n\\end{quote}"]
+
+      if isinstance(oNode, nodes.attribution):
+         return ["--- " + self.__RenderInlines(oNode.children)]
+
+      if isinstance(oNode, (nodes.literal_block, nodes.doctest_block)):
+         return [self.__RenderLiteralBlock(oNode)]
+
+      if isinstance(oNode, nodes.line_block):
+         return [" \\\\\n".join(self.__RenderLines(oNode))]
+
+      if isinstance(oNode, nodes.transition):
+         return ["\\begin{center}\\rule{0.5\\linewidth}{0.5pt}\\end{center}"]
+
+      if isinstance(oNode, nodes.image):
+         return [self.__RenderImage(oNode)]
+
+      if isinstance(oNode, nodes.figure):
+         return [self.__RenderFigure(oNode, nLevel)]
+
+      if isinstance(oNode, nodes.table):
+         return [self.__RenderTable(oNode)]
+
+      if isinstance(oNode, nodes.Admonition):
+         return [self.__RenderAdmonition(oNode, nLevel)]
+
+      if isinstance(oNode, (nodes.topic, nodes.sidebar)):
+         listBlocks = []
+         for oChild in oNode.children:
+            if isinstance(oChild, nodes.title):
+               listBlocks.append("\\textbf{" + self.__RenderInlines(oChild.children) + "}")
+            else:
+               listBlocks.extend(self.__RenderBlocks([oChild], nLevel))
+         return listBlocks
+
+      if isinstance(oNode, nodes.rubric):
+         return ["\\textbf{" + self.__RenderInlines(oNode.children) + "}"]
+
+      if isinstance(oNode, nodes.raw):
+         if "latex" in oNode.get('format', "").split():
+            return [oNode.astext()]
+         return []
+
+      if isinstance(oNode, nodes.math_block):
+         return ["\\[\n" + oNode.astext() + "\n\\]"]
+
+      if isinstance(oNode, nodes.Inline):
+         return [self.__RenderInline(oNode)]
+
+      # containers (compound, container, ...) and everything not known
+      if len(oNode.children) > 0:
+         return self.__RenderBlocks(oNode.children, nLevel)
+      return [EscapeText(oNode.astext())]
+
+   # eof def __RenderBlock(self, oNode=None, nLevel=1):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderSection(self, oSection=None, nLevel=1):
+      """Renders a section: the headline (with label) followed by the content.
+      """
+
+      oTitle = oSection[0]
+      sTitle = self.__RenderInlines(oTitle.children)
+      if any([not isinstance(oChild, nodes.Text) for oChild in oTitle.children]):
+         sTitle = "\\texorpdfstring{" + sTitle + "}{" + EscapeText(oTitle.astext()) + "}"
+
+      tupleCommands = ("section", "subsection", "subsubsection", "paragraph", "subparagraph")
+      listBlocks = []
+      if nLevel <= len(tupleCommands):
+         listBlocks.append(f"\\{tupleCommands[nLevel-1]}{{{sTitle}}}\\label{{{oSection['genpackagedoc-identifier']}}}")
+      else:
+         listBlocks.append(sTitle)
+      listBlocks.extend(self.__RenderBlocks(oSection.children[1:], nLevel+1))
+      return listBlocks
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsTight(self, listItems=[]):
+      """A list is tight in case of every list item contains not more than one paragraph (besides of nested lists).
+      """
+      for oItem in listItems:
+         listParagraphs = [oChild for oChild in oItem.children if isinstance(oChild, nodes.paragraph)]
+         listOthers     = [oChild for oChild in oItem.children if not isinstance(oChild, (nodes.paragraph, nodes.bullet_list, nodes.enumerated_list))]
+         if ( (len(listParagraphs) > 1) or (len(listOthers) > 0) ):
+            return False
+      return True
+
+   def __RenderList(self, sEnvironment="itemize", oList=None, listPreamble=[], nLevel=1):
+      """Renders the items of a list within ``sEnvironment``.
+      """
+      listLines = [f"\\begin{{{sEnvironment}}}"]
+      listLines.extend(listPreamble)
+      if self.__IsTight(oList.children):
+         listLines.append("\\tightlist")
+      for oItem in oList.children:
+         listBlocks = self.__RenderBlocks(oItem.children, nLevel)
+         if len(listBlocks) == 0:
+            listLines.append("\\item")
+         else:
+            listLines.append("\\item\n" + "\n\n".join(listBlocks))
+      listLines.append(f"\\end{{{sEnvironment}}}")
+      return "\n".join(listLines)
+
+   def __RenderEnumeration(self, oList=None, nLevel=1):
+      """Renders an enumerated list (numbering style, prefix, suffix and start value like defined in rst).
+      """
+      dictStyles = {'arabic'     : "\\arabic",
+                    'loweralpha' : "\\alph",
+                    'upperalpha' : "\\Alph",
+                    'lowerroman' : "\\roman",
+                    'upperroman' : "\\Roman"}
+      tupleCounters = ("enumi", "enumii", "enumiii", "enumiv")
+      self.__nEnumDepth = self.__nEnumDepth + 1
+      try:
+         sCounter = tupleCounters[min(self.__nEnumDepth, len(tupleCounters)) - 1]
+         sStyle   = dictStyles.get(oList.get('enumtype', 'arabic'), "\\arabic")
+         listPreamble = [f"\\def\\label{sCounter}{{{oList.get('prefix', '')}{sStyle}{{{sCounter}}}{oList.get('suffix', '.')}}}"]
+         nStart = int(oList.get('start', 1))
+         if nStart != 1:
+            listPreamble.append(f"\\setcounter{{{sCounter}}}{{{nStart - 1}}}")
+         sTEX = self.__RenderList("enumerate", oList, listPreamble, nLevel)
+      finally:
+         self.__nEnumDepth = self.__nEnumDepth - 1
+      return sTEX
+
+   def __RenderDescription(self, oList=None, nLevel=1):
+      """Renders definition lists, field lists and option lists as ``description`` environment.
+      """
+      listLines = ["\\begin{description}"]
+      if self.__IsTight([oItem[-1] for oItem in oList.children]):
+         listLines.append("\\tightlist")
+      for oItem in oList.children:
+         if isinstance(oItem, nodes.option_list_item):
+            listOptions = []
+            for oOption in oItem[0].children:
+               listOptions.append("".join([oPart.get('delimiter', "") + oPart.astext() for oPart in oOption.children]))
+            sTerm = "\\texttt{" + EscapeCode(", ".join(listOptions)) + "}"
+         else:
+            sTerm = self.__RenderInlines(oItem[0].children)
+            for oClassifier in oItem.children[1:-1]:
+               if isinstance(oClassifier, nodes.classifier):
+                  sTerm = sTerm + " : " + self.__RenderInlines(oClassifier.children)
+         if "]" in sTerm:
+            sTerm = "{" + sTerm + "}"
+         listLines.append(f"\\item[{sTerm}]\n" + "\n\n".join(self.__RenderBlocks(oItem[-1].children, nLevel)))
+      listLines.append("\\end{description}")
+      return "\n".join(listLines)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderLiteralBlock(self, oNode=None):
+      """Renders literal blocks: code with language as ``Highlighting`` environment (pandoc.sty), all other literal blocks as ``verbatim``.
+      """
+      listClasses = oNode.get('classes', [])
+      if ( ('code' in listClasses) and (len(listClasses) > 1) ):
+         listLines = ["\\begin{Shaded}", "\\begin{Highlighting}[]"]
+         for sLine in oNode.astext().splitlines():
+            if sLine.strip() == "":
+               listLines.append("")
+            else:
+               listLines.append("\\NormalTok{" + EscapeHighlighting(sLine) + "}")
+         listLines.extend(["\\end{Highlighting}", "\\end{Shaded}"])
+         return "\n".join(listLines)
+      return "\\begin{verbatim}\n" + oNode.astext() + "\n\\end{verbatim}"
+
+   def __RenderLines(self, oLineBlock=None):
+      """Renders the lines of a line block (nested line blocks are indented).
+      """
+      listLines = []
+      for oChild in oLineBlock.children:
+         if isinstance(oChild, nodes.line_block):
+            listLines.extend(["\\quad " + sLine for sLine in self.__RenderLines(oChild)])
+         else:
+            listLines.append(self.__RenderInlines(oChild.children))
+      return listLines
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderImage(self, oImage=None):
+      """Renders an image (width, height and scale like defined in rst).
+      """
+      listOptions = []
+      for sKey, sRelativeTo in (('width', "\\linewidth"), ('height', "\\textheight")):
+         if sKey in oImage:
+            sValue = str(oImage[sKey]).strip()
+            if sValue.endswith('%'):
+               sValue = f"{float(sValue[:-1])/100:g}{sRelativeTo}"
+            elif sValue.endswith('px'):
+               sValue = f"{float(sValue[:-2])/96:g}in"
+            elif re.match(r"^[0-9.]+$", sValue):
+               sValue = f"{float(sValue)/96:g}in"
+            listOptions.append(f"{sKey}={sValue}")
+      if 'scale' in oImage:
+         listOptions.append(f"scale={float(oImage['scale'])/100:g}")
+      sOptions = ""
+      if len(listOptions) > 0:
+         sOptions = "[" + ",".join(listOptions) + "]"
+      return f"\\includegraphics{sOptions}{{{oImage['uri']}}}"
+
+   def __RenderFigure(self, oFigure=None, nLevel=1):
+      """Renders a figure (image, caption and legend).
+      """
+      listLines = ["\\begin{figure}", "\\centering"]
+      for oChild in oFigure.children:
+         if isinstance(oChild, nodes.image):
+            listLines.append(self.__RenderImage(oChild))
+         elif isinstance(oChild, nodes.caption):
+            listLines.append("\\caption{" + self.__RenderInlines(oChild.children) + "}")
+         else:
+            listLines.extend(self.__RenderBlocks(oChild.children, nLevel))
+      listLines.append("\\end{figure}")
+      return "\n".join(listLines)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsGridTable(self, oTable=None):
+      """Grid tables have relative column widths, simple tables not (in the same way Pandoc handles them).
+The kind of table is not part of the document tree and therefore taken out of the rst code.
+      """
+      listClasses = oTable.get('classes', [])
+      if 'colwidths-auto' in listClasses:
+         return False
+      if 'colwidths-given' in listClasses:
+         return True
+      if oTable.line is None:
+         return False
+      for sLine in self.__listLinesRST[max(oTable.line-1, 0):oTable.line+20]:
+         sLine = sLine.strip()
+         if sLine.startswith('+'):
+            return True
+         if sLine.startswith('='):
+            return False
+      return False
+
+   def __RenderTableRow(self, oRow=None, bGrid=False):
+      """Renders a single table row.
+      """
+      listCells = []
+      for oEntry in oRow.children:
+         listBlocks = self.__RenderBlocks(oEntry.children)
+         if bGrid is True:
+            sCell = "\n\n".join(listBlocks)
+         else:
+            sCell = " ".join(listBlocks)
+         nMoreCols = int(oEntry.get('morecols', 0))
+         if nMoreCols > 0:
+            sCell = f"\\multicolumn{{{nMoreCols+1}}}{{l}}{{{sCell}}}"
+         listCells.append(sCell)
+      return " & ".join(listCells) + " \\\\"
+
+   def __RenderTable(self, oTable=None):
+      """Renders a table as ``longtable`` (in the same structure Pandoc uses).
+      """
+      sCaption = None
+      oTGroup  = None
+      for oChild in oTable.children:
+         if isinstance(oChild, nodes.title):
+            sCaption = self.__RenderInlines(oChild.children)
+         elif isinstance(oChild, nodes.tgroup):
+            oTGroup = oChild
+      if oTGroup is None:
+         return ""
+
+      listColSpecs = [oChild for oChild in oTGroup.children if isinstance(oChild, nodes.colspec)]
+      listHeadRows = []
+      listBodyRows = []
+      for oChild in oTGroup.children:
+         if isinstance(oChild, nodes.thead):
+            listHeadRows.extend(oChild.children)
+         elif isinstance(oChild, nodes.tbody):
+            listBodyRows.extend(oChild.children)
+
+      bGrid = self.__IsGridTable(oTable)
+      if bGrid is True:
+         nTotalWidth = sum([int(oColSpec.get('colwidth', 1)) for oColSpec in listColSpecs]) or 1
+         sColumns = ""
+         for oColSpec in listColSpecs:
+            fWidth = int(oColSpec.get('colwidth', 1)) / nTotalWidth
+            sColumns = sColumns + f">{{\\raggedright\\arraybackslash}}p{{\\dimexpr {fWidth:.4f}\\linewidth-2\\tabcolsep\\relax}}"
+      else:
+         sColumns = len(listColSpecs) * "l"
+
+      listHead = [self.__RenderTableRow(oRow, bGrid) for oRow in listHeadRows]
+
+      listLines = [f"\\begin{{longtable}}[]{{@{{}}{sColumns}@{{}}}}"]
+      if sCaption is not None:
+         listLines.append(f"\\caption{{{sCaption}}}\\tabularnewline")
+      listLines.append("\\toprule\\noalign{}")
+      if len(listHead) > 0:
+         listLines.extend(listHead)
+         listLines.append("\\midrule\\noalign{}")
+         if sCaption is not None:
+            listLines.append("\\endfirsthead")
+            listLines.append("\\toprule\\noalign{}")
+            listLines.extend(listHead)
+            listLines.append("\\midrule\\noalign{}")
+      listLines.append("\\endhead")
+      listLines.append("\\bottomrule\\noalign{}")
+      listLines.append("\\endlastfoot")
+      listLines.extend([self.__RenderTableRow(oRow, bGrid) for oRow in listBodyRows])
+      listLines.append("\\end{longtable}")
+
+      sTEX = "\n".join(listLines)
+      if sCaption is None:
+         sTEX = "{\\def\\LTcaptype{none} % do not increment counter\n" + sTEX + "\n}"
+      return sTEX
+
+   # eof def __RenderTable(self, oTable=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderAdmonition(self, oAdmonition=None, nLevel=1):
+      """Renders an admonition as box (admonitions.sty). A generic admonition with title 'Good practice' becomes a 'good practice' box.
+      """
+      sEnvironment, sTitle = DICTADMONITIONS.get(oAdmonition.tagname, ("boxhint", oAdmonition.tagname.capitalize()))
+      listChildren = oAdmonition.children
+      if ( (len(listChildren) > 0) and isinstance(listChildren[0], nodes.title) ):
+         sTitle = self.__RenderInlines(listChildren[0].children)
+         if listChildren[0].astext().strip().lower() == "good practice":
+            sEnvironment = "boxgoodpractice"
+         listChildren = listChildren[1:]
+      else:
+         sTitle = EscapeText(sTitle)
+      sContent = "\n\n".join(self.__RenderBlocks(listChildren, nLevel))
+      return f"\\begin{{{sEnvironment}}}{{{sTitle}}}\n{sContent}\n\\end{{{sEnvironment}}}"
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderInlines(self, listNodes=[]):
+      """Renders a list of inline elements.
+      """
+      return "".join([self.__RenderInline(oNode) for oNode in listNodes])
+
+   def __RenderInline(self, oNode=None):
+      """Renders a single inline element.
+      """
+
+      if isinstance(oNode, nodes.Text):
+         return EscapeText(oNode.astext())
+
+      if isinstance(oNode, nodes.emphasis):
+         return "\\emph{" + self.__RenderInlines(oNode.children) + "}"
+
+      if isinstance(oNode, nodes.strong):
+         return "\\textbf{" + self.__RenderInlines(oNode.children) + "}"
+
+      if isinstance(oNode, nodes.literal):
+         return "\\texttt{" + EscapeCode(oNode.astext()) + "}"
+
+      if isinstance(oNode, nodes.title_reference):
+         return "{" + self.__RenderInlines(oNode.children) + "}"
+
+      if isinstance(oNode, nodes.subscript):
+         return "\\textsubscript{" + self.__RenderInlines(oNode.children) + "}"
+
+      if isinstance(oNode, nodes.superscript):
+         return "\\textsuperscript{" + self.__RenderInlines(oNode.children) + "}"
+
+      if isinstance(oNode, nodes.reference):
+         return self.__RenderReference(oNode)
+
+      if isinstance(oNode, nodes.footnote_reference):
+         oFootnote = self.__dictFootnotes.get(oNode.get('refid', None), None)
+         if oFootnote is None:
+            return "{[}" + EscapeText(oNode.astext()) + "{]}"
+         listContent = [oChild for oChild in oFootnote.children if not isinstance(oChild, nodes.label)]
+         return "\\footnote{" + "\n\n".join(self.__RenderBlocks(listContent)) + "}"
+
+      if isinstance(oNode, nodes.citation_reference):
+         return "{[}" + EscapeText(oNode.astext()) + "{]}"
+
+      if isinstance(oNode, nodes.image):
+         return self.__RenderImage(oNode)
+
+      if isinstance(oNode, nodes.raw):
+         if "latex" in oNode.get('format', "").split():
+            return oNode.astext()
+         return ""
+
+      if isinstance(oNode, nodes.math):
+         return "\\(" + oNode.astext() + "\\)"
+
+      if isinstance(oNode, (nodes.system_message, nodes.comment)):
+         return ""
+
+      if isinstance(oNode, nodes.problematic):
+         return EscapeText(oNode.astext())
+
+      # inline targets, substitution references, generic inline elements, ...
+      if len(oNode.children) > 0:
+         return self.__RenderInlines(oNode.children)
+      return EscapeText(oNode.astext())
+
+   # eof def __RenderInline(self, oNode=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __RenderReference(self, oReference=None):
+      """Renders a reference: external (``\\href``, ``\\url``) or internal (``\\hyperref``).
+      """
+      sText = self.__RenderInlines(oReference.children)
+      if 'refuri' in oReference:
+         sURI = oReference['refuri']
+         # docutils removes the whitespace within embedded URIs, Pandoc keeps it (encoded)
+         oMatch = re.search(r"<([^<>]+)>`_{1,2}$", oReference.rawsource or "")
+         if oMatch is not None:
+            sURI = re.sub(r"\s+", " ", oMatch.group(1).strip())
+         sPlain = oReference.astext()
+         if ( (sPlain == sURI) or (f"mailto:{sPlain}" == sURI) ):
+            # standalone link
+            if sURI.startswith("mailto:"):
+               return f"\\href{{{EscapeURL(sURI)}}}{{\\nolinkurl{{{EscapeURL(sPlain)}}}}}"
+            return f"\\url{{{EscapeURL(sURI)}}}"
+         return f"\\href{{{EscapeURL(sURI)}}}{{{sText}}}"
+      if 'refid' in oReference:
+         sIdentifier = self.__dictIdentifiers.get(oReference['refid'], oReference['refid'])
+         return f"\\hyperref[{sIdentifier}]{{{sText}}}"
+      return sText
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CLaTeXRenderer():
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CDocutilsEngine():
+   """
+The ``CDocutilsEngine`` class converts rst code to tex code within the current process: the rst code is parsed by docutils
+and the resulting document tree is rendered by ``CLaTeXRenderer``. No external process is involved (and Pandoc is not required).
+
+The engine is tuned to the docstring conventions of GenPackageDoc:
+
+* ``.. code::python`` (without blank after ``::``) is accepted like Pandoc does
+* the generated LaTeX code is compatible with ``pandoc.sty`` (code blocks, lists, tables, labels)
+* admonitions (``note``, ``warning``, ...) are rendered as boxes defined in ``admonitions.sty``
+
+Requires the Python package ``docutils`` (optional dependency of GenPackageDoc).
+   """
+
+   sName  = "docutils"
+   bBatch = False
+
+   def __init__(self, oProcessRunner=None):
+      # (oProcessRunner: not used; the conversion is done within the GenPackageDoc process)
+      sMethod = "CDocutilsEngine.__init__"
+      if docutils is None:
+         bSuccess = None
+         sResult  = "The conversion engine 'docutils' requires the Python package 'docutils'. Please install it (or select another engine)."
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+      self.__oRegExCodeDirective = re.compile(r"^(\s*\.\.\s+(?:code|code-block|sourcecode))::(?=\S)", re.MULTILINE)
+      self.__dictSettings = None
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetSettings(self):
+      """
+Returns all settings that have an impact on the result of the conversion (used for the key of the conversion cache).
+      """
+
+      if self.__dictSettings is None:
+         self.__dictSettings = {}
+         self.__dictSettings['converter'] = "docutils"
+         self.__dictSettings['version']   = f"{docutils.__version__}/{RENDERERVERSION}"
+         self.__dictSettings['from']      = "rst"
+         self.__dictSettings['to']        = "tex"
+      return self.__dictSettings
+
+   # eof def GetSettings(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Convert(self, sRSTCode=""):
+      """
+Converts a single piece of rst code to tex code (see ``CPandocEngine.Convert``).
+      """
+
+      sMethod = "CDocutilsEngine.Convert"
+
+      # '.. code::python' is a comment for docutils, but a code block for Pandoc (and used like this in GenPackageDoc docstrings)
+      sRSTCode = self.__oRegExCodeDirective.sub(r"\1:: ", sRSTCode)
+
+      dictSettingsOverrides = {'report_level'           : 5, # the conversion is as tolerant as Pandoc is
+                               'halt_level'             : 5,
+                               'warning_stream'         : io.StringIO(),
+                               'syntax_highlight'       : 'none',
+                               'file_insertion_enabled' : False,
+                               'raw_enabled'            : True,
+                               'doctitle_xform'         : False,
+                               'sectsubtitle_xform'     : False,
+                               'docinfo_xform'          : False,
+                               'smart_quotes'           : False}
+      try:
+         oDocument = docutils.core.publish_doctree(sRSTCode, settings_overrides=dictSettingsOverrides)
+         sTEX = CLaTeXRenderer(oDocument, sRSTCode).Render()
+      except Exception as ex:
+         bSuccess = None
+         sResult  = str(ex)
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = "Done"
+      return sTEX + "\n", bSuccess, sResult
+
+   # eof def Convert(self, sRSTCode=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ConvertList(self, listRSTCodes=[]):
+      """
+Converts a list of rst code pieces to tex code (see ``CPandocEngine.ConvertList``).
+      """
+
+      sMethod = "CDocutilsEngine.ConvertList"
+
+      listTEX = []
+      for sRSTCode in listRSTCodes:
+         sTEX, bSuccess, sResult = self.Convert(sRSTCode)
+         if bSuccess is not True:
+            return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         listTEX.append(sTEX)
+
+      bSuccess = True
+      sResult  = f"{len(listTEX)} conversions done"
+      return listTEX, bSuccess, sResult
+
+   # eof def ConvertList(self, listRSTCodes=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Start(self):
+      """
+Nothing to do for this engine (see ``CPandocEngine.Start``).
+      """
+      pass
+
+   def Close(self):
+      """
+Nothing to do for this engine (see ``CPandocEngine.Close``).
+      """
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CDocutilsEngine():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,291 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CFileWatcher.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the watching of the documentation sources for changes (inotify on Linux, polling otherwise).
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, sys, time, select, struct
+
+try:
+   import ctypes, ctypes.util
+   _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+   if ( (sys.platform.startswith("linux") is False) or (hasattr(_libc, "inotify_init1") is False) ):
+      _libc = None
+except Exception:
+   _libc = None # inotify not available; the file watcher polls the file system instead
+
+# inotify (see 'man 7 inotify')
+IN_MODIFY      = 0x00000002
+IN_ATTRIB      = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_Q_OVERFLOW  = 0x00004000
+IN_ISDIR       = 0x40000000
+IN_NONBLOCK    = 0x00000800
+IN_CLOEXEC     = 0x00080000
+INOTIFYMASK    = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# files and folders that are never relevant (compiled Python files, temporary files of editors)
+IGNOREDFOLDERS = ('__pycache__', '.git', '.svn')
+IGNOREDSUFFIXES = ('.pyc', '.pyo', '~', '.swp', '.swx', '.tmp')
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CFileWatcher():
+   """
+The ``CFileWatcher`` class watches files and folders (recursively) for changes. On Linux the changes are reported by the kernel
+(inotify); on all other platforms (or in case of inotify is not available) the file system is polled.
+
+Changes are debounced: a set of changes is reported not before no further change happened for a short time
+(e.g. an editor saving several files, or a version control system updating many files).
+   """
+
+   def __init__(self, listWatchedPaths=[], fPollInterval=1.0):
+      """
+Constructor of class ``CFileWatcher``.
+
+**Arguments:**
+
+* ``listWatchedPaths``
+
+  / *Condition*: required / *Type*: list /
+
+  List of tuples ``(path, extensions)``. The path is either a file or a folder (watched recursively). Within folders only files with
+  one of the ``extensions`` are relevant (tuple; ``None``: all files).
+
+* ``fPollInterval``
+
+  / *Condition*: optional / *Type*: float / *Default*: 1.0 /
+
+  Interval (in seconds) of the polling (in case of inotify is not available).
+      """
+
+      self.__listWatchedPaths = [(os.path.abspath(sPath), tupleExtensions) for sPath, tupleExtensions in listWatchedPaths]
+      self.__fPollInterval    = fPollInterval
+      self.__hInotify         = None
+      self.__dictWatches      = {} # inotify: watch descriptor -> folder
+      self.__dictSnapshot     = None # polling: file -> (modification time, size)
+      self.sMethod            = "polling"
+
+      if _libc is not None:
+         hInotify = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+         if hInotify >= 0:
+            self.__hInotify = hInotify
+            self.sMethod    = "inotify"
+            for sPath, tupleExtensions in self.__listWatchedPaths:
+               if os.path.isdir(sPath) is True:
+                  self.__AddWatches(sPath)
+               else:
+                  self.__AddWatch(os.path.dirname(sPath))
+      if self.__hInotify is None:
+         self.__dictSnapshot = self.__GetSnapshot()
+
+   def __del__(self):
+      self.Close()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsRelevant(self, sFile=None):
+      """Returns ``True`` in case of a change of the file ``sFile`` is relevant (the file belongs to a watched path).
+      """
+      listParts = sFile.replace("\\", "/").split("/")
+      if ( (len([sPart for sPart in listParts if sPart in IGNOREDFOLDERS]) > 0) or (sFile.endswith(IGNOREDSUFFIXES) is True) or
+           (os.path.basename(sFile).startswith(".#") is True) ):
+         return False
+      for sPath, tupleExtensions in self.__listWatchedPaths:
+         if sFile == sPath:
+            return True
+         if sFile.startswith(sPath + os.sep) is True:
+            if ( (tupleExtensions is None) or (sFile.lower().endswith(tupleExtensions) is True) ):
+               return True
+      return False
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __AddWatch(self, sFolder=None):
+      """Adds an inotify watch for the folder ``sFolder`` (not recursive).
+      """
+      if sFolder in self.__dictWatches.values():
+         return
+      nWatch = _libc.inotify_add_watch(self.__hInotify, os.fsencode(sFolder), INOTIFYMASK)
+      if nWatch >= 0:
+         self.__dictWatches[nWatch] = sFolder
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __AddWatches(self, sFolder=None):
+      """Adds inotify watches for the folder ``sFolder`` and all its subfolders (inotify itself is not recursive).
+Returns the files found within these folders.
+      """
+      listFiles = []
+      for sLocalRootPath, listFolderNames, listFileNames in os.walk(sFolder):
+         listFolderNames[:] = [sFolderName for sFolderName in listFolderNames if sFolderName not in IGNOREDFOLDERS]
+         self.__AddWatch(sLocalRootPath)
+         listFiles.extend([os.path.join(sLocalRootPath, sFileName) for sFileName in listFileNames])
+      return listFiles
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __ReadEvents(self, fTimeout=None):
+      """Waits up to ``fTimeout`` seconds (``None``: infinite) for inotify events. Returns the set of relevant files that have changed.
+      """
+      setChanges = set()
+      listReady, listUnused1, listUnused2 = select.select([self.__hInotify], [], [], fTimeout)
+      if len(listReady) == 0:
+         return setChanges
+      try:
+         bytesEvents = os.read(self.__hInotify, 65536)
+      except BlockingIOError:
+         return setChanges
+      nOffset = 0
+      while nOffset + 16 <= len(bytesEvents):
+         nWatch, nMask, nCookie, nLength = struct.unpack_from("iIII", bytesEvents, nOffset)
+         sName = os.fsdecode(bytesEvents[nOffset + 16:nOffset + 16 + nLength].rstrip(b"\0"))
+         nOffset = nOffset + 16 + nLength
+         if (nMask & IN_Q_OVERFLOW) != 0:
+            # events lost; everything is considered as changed
+            setChanges.update([sPath for sPath, tupleExtensions in self.__listWatchedPaths])
+            continue
+         sFolder = self.__dictWatches.get(nWatch)
+         if ( (sFolder is None) or (sName == "") ):
+            continue
+         sFile = os.path.join(sFolder, sName)
+         if (nMask & IN_ISDIR) != 0:
+            if ( ( (nMask & (IN_CREATE | IN_MOVED_TO)) != 0 ) and (os.path.isdir(sFile) is True) and (sName not in IGNOREDFOLDERS) ):
+               # new folder within a watched folder: watched as well (files created in the meantime count as changes)
+               setChanges.update([sNewFile for sNewFile in self.__AddWatches(sFile) if self.__IsRelevant(sNewFile) is True])
+            continue
+         if self.__IsRelevant(sFile) is True:
+            setChanges.add(sFile)
+      return setChanges
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetSnapshot(self):
+      """Returns modification time and size of all relevant files (polling).
+      """
+      dictSnapshot = {}
+      for sPath, tupleExtensions in self.__listWatchedPaths:
+         listFiles = [sPath]
+         if os.path.isdir(sPath) is True:
+            listFiles = []
+            for sLocalRootPath, listFolderNames, listFileNames in os.walk(sPath):
+               listFolderNames[:] = [sFolderName for sFolderName in listFolderNames if sFolderName not in IGNOREDFOLDERS]
+               listFiles.extend([os.path.join(sLocalRootPath, sFileName) for sFileName in listFileNames])
+         for sFile in listFiles:
+            if self.__IsRelevant(sFile) is False:
+               continue
+            try:
+               oStat = os.stat(sFile)
+               dictSnapshot[sFile] = (oStat.st_mtime_ns, oStat.st_size)
+            except OSError:
+               pass # deleted in the meantime
+      return dictSnapshot
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __PollChanges(self, fTimeout=None):
+      """Polls the file system for up to ``fTimeout`` seconds (``None``: infinite). Returns the set of relevant files that have changed.
+      """
+      fStart = time.time()
+      while True:
+         time.sleep(self.__fPollInterval if fTimeout is None else min(self.__fPollInterval, fTimeout))
+         dictSnapshot = self.__GetSnapshot()
+         setChanges = set([sFile for sFile in set(dictSnapshot) | set(self.__dictSnapshot)
+                           if dictSnapshot.get(sFile) != self.__dictSnapshot.get(sFile)])
+         self.__dictSnapshot = dictSnapshot
+         if ( (len(setChanges) > 0) or ( (fTimeout is not None) and (time.time() - fStart >= fTimeout) ) ):
+            return setChanges
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Wait(self, fDebounce=0.5):
+      """
+Waits for changes of the watched files. Returns after the first change, as soon as no further change happened
+for ``fDebounce`` seconds.
+
+**Arguments:**
+
+* ``fDebounce``
+
+  / *Condition*: optional / *Type*: float / *Default*: 0.5 /
+
+  Time (in seconds) without further changes, that completes a set of changes.
+
+**Returns:**
+
+* ``listChangedFiles``
+
+  / *Type*: list /
+
+  The files that have changed (sorted; also deleted and new files).
+      """
+
+      if self.__hInotify is not None:
+         fnGetChanges = self.__ReadEvents
+      else:
+         fnGetChanges = self.__PollChanges
+      setChanges = set()
+      while len(setChanges) == 0:
+         setChanges = fnGetChanges(None)
+      while True:
+         setMoreChanges = fnGetChanges(fDebounce)
+         if len(setMoreChanges) == 0:
+            break
+         setChanges.update(setMoreChanges)
+      return sorted(setChanges)
+
+   # eof def Wait(self, fDebounce=0.5):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Close(self):
+      """
+Releases all resources of the file watcher.
+      """
+      if self.__hInotify is not None:
+         os.close(self.__hInotify)
+         self.__hInotify = None
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CFileWatcher():
+
+# --------------------------------------------------------------------------------------------------------------
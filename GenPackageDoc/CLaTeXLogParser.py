@@ -0,0 +1,240 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CLaTeXLogParser.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the parser of the log file of the LaTeX compiler.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import re
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CLaTeXLogParser():
+   """
+The ``CLaTeXLogParser`` class extracts errors and warnings out of the log file of the LaTeX compiler. The log file is parsed
+incrementally: the content can be fed in chunks while the LaTeX compiler is still running. Every message is a dictionary with the keys
+
+* ``TYPE``: ``"ERROR"`` or ``"WARNING"``
+* ``FILE``: the tex file the message belongs to (``None``, if unknown)
+* ``LINE``: the line number within this file (``None``, if unknown)
+* ``MESSAGE``: the text of the message
+
+The parser expects a log file of a LaTeX compiler called with ``-file-line-error`` (errors are reported as ``<file>:<line>: <message>``).
+Errors in classic format (``! <message>``, followed by ``l.<line>``) are also supported. The file of a warning is taken
+out of the files opened by the LaTeX compiler (parentheses within the log file).
+   """
+
+   def __init__(self):
+      """
+Constructor of class ``CLaTeXLogParser``.
+      """
+
+      self.__sPending        = ""   # incomplete last line of the previous chunk
+      self.__listFileStack   = []   # files currently opened by the LaTeX compiler
+      self.__dictOpenMessage = None # message that is continued within the next lines
+      self.listMessages      = []
+
+      self.__oRegExFileLineError = re.compile(r"^(.+?\.(?:tex|sty|cls|def|cfg|fd|clo|ltx|aux|toc|out)):(\d+): (.*)$")
+      self.__oRegExClassicError  = re.compile(r"^! (.*)$")
+      self.__oRegExErrorLine     = re.compile(r"^l\.(\d+)")
+      self.__oRegExWarning       = re.compile(r"^(?:LaTeX|pdfTeX|(?:Package|Class) (\S+)) Warning: (.*)$")
+      self.__oRegExInputLine     = re.compile(r"on input line (\d+)")
+      self.__oRegExFileToken     = re.compile(r"\((\.{0,2}/?[^\s()]+\.\w+)|(\()|(\))")
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetCurrentFile(self):
+      """Returns the innermost file currently opened by the LaTeX compiler (or ``None``).
+      """
+      for sFile in reversed(self.__listFileStack):
+         if sFile is not None:
+            return sFile
+      return None
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __CloseMessage(self):
+      """Completes the message that is continued within the next lines.
+      """
+      if self.__dictOpenMessage is not None:
+         self.__dictOpenMessage.pop('sPrefix', None)
+         self.__dictOpenMessage['MESSAGE'] = self.__dictOpenMessage['MESSAGE'].strip()
+         self.listMessages.append(self.__dictOpenMessage)
+         self.__dictOpenMessage = None
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __ParseLine(self, sLine=""):
+      """Parses a single line of the log file.
+      """
+
+      # -- continuation of the previous message
+      dictMessage = self.__dictOpenMessage
+      if dictMessage is not None:
+         if dictMessage['TYPE'] == "ERROR":
+            # the classic error format reports the line number in a separate line (l.<line>); the message ends there
+            oMatch = self.__oRegExErrorLine.match(sLine)
+            if oMatch is not None:
+               if dictMessage['LINE'] is None:
+                  dictMessage['LINE'] = int(oMatch.group(1))
+               self.__CloseMessage()
+               return
+            if ( (sLine.strip() == "") or (sLine.startswith("!")) or (self.__oRegExFileLineError.match(sLine) is not None) ):
+               self.__CloseMessage()
+            else:
+               return # context of the error (e.g. help text); not part of the message
+         else:
+            sPrefix = dictMessage.get('sPrefix')
+            if ( (sPrefix is not None) and (sLine.startswith(sPrefix) is True) ):
+               dictMessage['MESSAGE'] = dictMessage['MESSAGE'] + " " + sLine[len(sPrefix):].strip()
+               oMatch = self.__oRegExInputLine.search(sLine)
+               if oMatch is not None:
+                  dictMessage['LINE'] = int(oMatch.group(1))
+               return
+            self.__CloseMessage()
+
+      # -- errors
+      oMatch = self.__oRegExFileLineError.match(sLine)
+      if oMatch is not None:
+         self.__dictOpenMessage = {'TYPE' : "ERROR", 'FILE' : oMatch.group(1), 'LINE' : int(oMatch.group(2)), 'MESSAGE' : oMatch.group(3)}
+         return
+      oMatch = self.__oRegExClassicError.match(sLine)
+      if oMatch is not None:
+         self.__dictOpenMessage = {'TYPE' : "ERROR", 'FILE' : self.__GetCurrentFile(), 'LINE' : None, 'MESSAGE' : oMatch.group(1)}
+         return
+
+      # -- warnings
+      oMatch = self.__oRegExWarning.search(sLine)
+      if oMatch is not None:
+         nLine = None
+         oMatchLine = self.__oRegExInputLine.search(sLine)
+         if oMatchLine is not None:
+            nLine = int(oMatchLine.group(1))
+         self.__dictOpenMessage = {'TYPE' : "WARNING", 'FILE' : self.__GetCurrentFile(), 'LINE' : nLine, 'MESSAGE' : sLine[oMatch.start():]}
+         if oMatch.group(1) is not None:
+            self.__dictOpenMessage['sPrefix'] = f"({oMatch.group(1)})" # continuation lines of package warnings
+         return
+
+      # -- files opened and closed by the LaTeX compiler
+      for oMatch in self.__oRegExFileToken.finditer(sLine):
+         if oMatch.group(1) is not None:
+            self.__listFileStack.append(oMatch.group(1))
+         elif oMatch.group(2) is not None:
+            self.__listFileStack.append(None)
+         elif len(self.__listFileStack) > 0:
+            self.__listFileStack.pop()
+
+   # eof def __ParseLine(self, sLine=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Feed(self, sContent=""):
+      """
+Parses the next part of the log file.
+
+**Arguments:**
+
+* ``sContent``
+
+  / *Condition*: required / *Type*: str /
+
+  The next part of the log file (not necessarily ending with a complete line).
+
+**Returns:**
+
+* ``listNewMessages``
+
+  / *Type*: list /
+
+  The messages completed within this part of the log file.
+      """
+
+      nMessagesBefore = len(self.listMessages)
+      listLines = (self.__sPending + sContent).split("\n")
+      self.__sPending = listLines.pop() # incomplete last line
+      for sLine in listLines:
+         self.__ParseLine(sLine.rstrip("\r"))
+      return self.listMessages[nMessagesBefore:]
+
+   # eof def Feed(self, sContent=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Close(self):
+      """
+Parses the rest of the log file (has to be called after the last part of the log file is fed).
+
+**Returns:**
+
+* ``listNewMessages``
+
+  / *Type*: list /
+
+  The messages completed within the rest of the log file.
+      """
+
+      nMessagesBefore = len(self.listMessages)
+      if self.__sPending != "":
+         self.__ParseLine(self.__sPending.rstrip("\r"))
+         self.__sPending = ""
+      self.__CloseMessage()
+      return self.listMessages[nMessagesBefore:]
+
+   # eof def Close(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetErrors(self):
+      """
+Returns all errors found within the log file up to now.
+      """
+      return [dictMessage for dictMessage in self.listMessages if dictMessage['TYPE'] == "ERROR"]
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetWarnings(self):
+      """
+Returns all warnings found within the log file up to now.
+      """
+      return [dictMessage for dictMessage in self.listMessages if dictMessage['TYPE'] == "WARNING"]
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CLaTeXLogParser():
+
+# --------------------------------------------------------------------------------------------------------------
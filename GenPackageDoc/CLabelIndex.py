@@ -0,0 +1,246 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CLabelIndex.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the index of all labels of a documentation that is compiled in several parts (shards).
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import re
+
+# --------------------------------------------------------------------------------------------------------------
+
+def _GetGroups(sText="", nStart=0, nGroups=1):
+   """
+Returns the content of the next ``nGroups`` brace groups (``{...}``, nested braces included) within ``sText``, starting at
+position ``nStart``, together with the position after the last group. Returns ``None`` instead of the list of groups in case of
+the groups are incomplete.
+   """
+   listGroups = []
+   nPos = nStart
+   while len(listGroups) < nGroups:
+      while ( (nPos < len(sText)) and (sText[nPos] in " \t") ):
+         nPos = nPos + 1
+      if ( (nPos >= len(sText)) or (sText[nPos] != "{") ):
+         return None, nPos
+      nDepth = 0
+      nIndex = nPos
+      while nIndex < len(sText):
+         sChar = sText[nIndex]
+         if sChar == "\\":
+            nIndex = nIndex + 2 # escaped character (e.g. '\\{')
+            continue
+         if sChar == "{":
+            nDepth = nDepth + 1
+         elif sChar == "}":
+            nDepth = nDepth - 1
+            if nDepth == 0:
+               break
+         nIndex = nIndex + 1
+      if nIndex >= len(sText):
+         return None, nPos
+      listGroups.append(sText[nPos + 1:nIndex])
+      nPos = nIndex + 1
+   return listGroups, nPos
+
+# eof def _GetGroups(sText="", nStart=0, nGroups=1):
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CLabelIndex():
+   """
+The ``CLabelIndex`` class collects the labels of all shards of a documentation. Every shard is compiled as independent document;
+references to labels within other shards are resolved with the help of this index.
+
+The index is computed in two steps:
+
+1. Before the shards are compiled, the tex sources of every shard are scanned for labels (``\\label``) and for anchors (``\\hypertarget``).
+   This defines the shard every label and every anchor belongs to.
+2. After a shard is compiled, the auxiliary file of the shard provides number, page, title and anchor of every label.
+
+Out of this index for every shard the definitions of the labels of all other shards are generated (``GetLabelDefinitions``).
+The anchors are used later to resolve the links between the shards, when the PDF files of the shards are assembled (``dictAnchors``).
+   """
+
+   def __init__(self):
+      """
+Constructor of class ``CLabelIndex``.
+      """
+
+      self.dictLabels  = {} # label -> {'SHARD', 'FIELDS'} (FIELDS: the fields of the label within the auxiliary file; None before compilation)
+      self.dictAnchors = {} # anchor (named destination within the PDF file) -> shard
+
+      self.__oRegExLabel      = re.compile(r"\\label\{([^{}]+)\}")
+      self.__oRegExAnchor     = re.compile(r"\\hypertarget\{([^{}]+)\}")
+      self.__oRegExNewLabel   = re.compile(r"\\newlabel\{([^{}]+)\}")
+      self.__oRegExPageNumber = re.compile(r"^\d+$")
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ScanTeX(self, sShard=None, sTeX=""):
+      """
+Registers all labels and anchors defined within the tex source ``sTeX`` of the shard ``sShard``. In case of a label
+is defined in several shards, the first one is taken.
+
+**Arguments:**
+
+* ``sShard``
+
+  / *Condition*: required / *Type*: str /
+
+  The name of the shard.
+
+* ``sTeX``
+
+  / *Condition*: required / *Type*: str /
+
+  The tex source (or a part of it).
+
+**Returns:**
+
+(*no returns*)
+      """
+
+      for sLabel in self.__oRegExLabel.findall(sTeX):
+         if sLabel not in self.dictLabels:
+            self.dictLabels[sLabel] = {'SHARD' : sShard, 'FIELDS' : None}
+      for sAnchor in self.__oRegExAnchor.findall(sTeX):
+         if sAnchor not in self.dictAnchors:
+            self.dictAnchors[sAnchor] = sShard
+
+   # eof def ScanTeX(self, sShard=None, sTeX=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def ReadAux(self, sShard=None, sAux="", nPageOffset=0):
+      """
+Takes over number, page, title and anchor of all labels of the shard ``sShard`` out of the auxiliary file of this shard.
+
+**Arguments:**
+
+* ``sShard``
+
+  / *Condition*: required / *Type*: str /
+
+  The name of the shard.
+
+* ``sAux``
+
+  / *Condition*: required / *Type*: str /
+
+  The content of the auxiliary file of the shard.
+
+* ``nPageOffset``
+
+  / *Condition*: optional / *Type*: int / *Default*: 0 /
+
+  Offset added to the page numbers (in case of the shard was compiled with other page numbers than the final ones).
+
+**Returns:**
+
+* ``nLabels``
+
+  / *Type*: int /
+
+  The number of labels taken over.
+      """
+
+      nLabels = 0
+      for oMatch in self.__oRegExNewLabel.finditer(sAux):
+         sLabel = oMatch.group(1)
+         listOuter, nEnd = _GetGroups(sAux, oMatch.end(), 1)
+         if listOuter is None:
+            continue
+         listFields, nEnd = _GetGroups(listOuter[0], 0, 5) # hyperref: {number}{page}{title}{anchor}{extra}
+         if listFields is None:
+            listFields, nEnd = _GetGroups(listOuter[0], 0, 2) # without hyperref: {number}{page}
+            if listFields is None:
+               continue
+         dictLabel = self.dictLabels.setdefault(sLabel, {'SHARD' : sShard, 'FIELDS' : None})
+         if dictLabel['SHARD'] != sShard:
+            continue # label of another shard (multiply defined)
+         if ( (nPageOffset != 0) and (self.__oRegExPageNumber.match(listFields[1]) is not None) ):
+            listFields[1] = str(int(listFields[1]) + nPageOffset)
+         dictLabel['FIELDS'] = listFields
+         if ( (len(listFields) > 3) and (listFields[3] != "") and (listFields[3] not in self.dictAnchors) ):
+            self.dictAnchors[listFields[3]] = sShard
+         nLabels = nLabels + 1
+      return nLabels
+
+   # eof def ReadAux(self, sShard=None, sAux="", nPageOffset=0):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetLabelDefinitions(self, sShard=None):
+      """
+Returns the LaTeX definitions (``\\newlabel``) of all labels defined within other shards than ``sShard``. Only labels
+already taken over out of the auxiliary files of their shards are considered.
+      """
+
+      listLines = []
+      for sLabel in sorted(self.dictLabels):
+         dictLabel = self.dictLabels[sLabel]
+         if ( (dictLabel['SHARD'] == sShard) or (dictLabel['FIELDS'] is None) ):
+            continue
+         sFields = "".join([f"{{{sField}}}" for sField in dictLabel['FIELDS']])
+         listLines.append(f"\\newlabel{{{sLabel}}}{{{sFields}}}")
+      return "\n".join(listLines)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetCrossReferences(self, sShard=None, sTeX=""):
+      """
+Returns the labels and anchors referenced within the tex source ``sTeX`` of the shard ``sShard``, that are defined within other shards
+(sorted list of tuples ``(label or anchor, shard)``).
+      """
+
+      setReferences = set()
+      for oMatch in re.finditer(r"\\(?:ref|pageref|nameref|autoref)\{([^{}]+)\}|\\hyperref\[([^\[\]]+)\]", sTeX):
+         sLabel = oMatch.group(1) or oMatch.group(2)
+         dictLabel = self.dictLabels.get(sLabel)
+         if ( (dictLabel is not None) and (dictLabel['SHARD'] != sShard) ):
+            setReferences.add((sLabel, dictLabel['SHARD']))
+      for sAnchor in re.findall(r"\\hyperlink\{([^{}]+)\}", sTeX):
+         sAnchorShard = self.dictAnchors.get(sAnchor)
+         if ( (sAnchorShard is not None) and (sAnchorShard != sShard) ):
+            setReferences.add((sAnchor, sAnchorShard))
+      return sorted(setReferences)
+
+   # eof def GetCrossReferences(self, sShard=None, sTeX=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CLabelIndex():
+
+# --------------------------------------------------------------------------------------------------------------
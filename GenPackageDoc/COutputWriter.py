@@ -0,0 +1,152 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# COutputWriter.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the writer of all files generated by GenPackageDoc.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, hashlib, tempfile
+
+from PythonExtensionsCollection.String.CString import CString
+
+# --------------------------------------------------------------------------------------------------------------
+
+class COutputWriter():
+   """
+The ``COutputWriter`` class writes generated files only in case of their content has changed.
+
+The content of a file is built in memory and compared with the content of the existing file (size and hash).
+Unchanged files are not touched (their modification time is kept). Changed files are written to a temporary file first,
+that replaces the existing file afterwards (atomic: other processes see either the old or the new content, but nothing in between).
+
+The attributes ``nWritten`` and ``nSkipped`` count the written and the skipped (unchanged) files.
+   """
+
+   def __init__(self):
+      self.nWritten = 0
+      self.nSkipped = 0
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsUnchanged(self, sFile=None, bytesContent=b""):
+      """Returns ``True`` in case of ``sFile`` exists and has the content ``bytesContent``.
+      """
+      try:
+         if os.path.getsize(sFile) != len(bytesContent):
+            return False
+         with open(sFile, "rb") as hFile:
+            sHashFile = hashlib.sha256(hFile.read()).hexdigest()
+      except OSError:
+         return False
+      return ( sHashFile == hashlib.sha256(bytesContent).hexdigest() )
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Write(self, sFile=None, sContent=""):
+      """
+Writes ``sContent`` to ``sFile`` - in case of the content has changed. Line endings are written in the format of the current
+operating system (like the ``CFile`` class does). Binary content (type bytes) is written as it is.
+
+**Arguments:**
+
+* ``sFile``
+
+  / *Condition*: required / *Type*: str /
+
+  Path and name of the file.
+
+* ``sContent``
+
+  / *Condition*: required / *Type*: str or bytes /
+
+  The complete content of the file.
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "COutputWriter.Write"
+
+      if sFile is None:
+         bSuccess = None
+         sResult  = "sFile is None"
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      if type(sContent) == bytes:
+         bytesContent = sContent
+      else:
+         bytesContent = sContent.replace("\n", os.linesep).encode("utf-8")
+
+      if self.__IsUnchanged(sFile, bytesContent) is True:
+         self.nSkipped = self.nSkipped + 1
+         bSuccess = True
+         sResult  = f"File '{sFile}' unchanged"
+         return bSuccess, sResult
+
+      sTempFile = None
+      try:
+         sFolder = os.path.dirname(os.path.abspath(sFile))
+         hTempFile, sTempFile = tempfile.mkstemp(dir=sFolder, prefix=".", suffix=".tmp")
+         with os.fdopen(hTempFile, "wb") as hFile:
+            hFile.write(bytesContent)
+         os.replace(sTempFile, sFile)
+      except Exception as ex:
+         if ( (sTempFile is not None) and (os.path.isfile(sTempFile) is True) ):
+            os.remove(sTempFile)
+         bSuccess = None
+         sResult  = f"Not possible to write to file '{sFile}'.\nReason: " + str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      self.nWritten = self.nWritten + 1
+      bSuccess = True
+      sResult  = f"File '{sFile}' written"
+      return bSuccess, sResult
+
+   # eof def Write(self, sFile=None, sContent=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class COutputWriter():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,240 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CPDFAssembler.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the assembling of the PDF files of several shards to one PDF file.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, tempfile
+
+from PythonExtensionsCollection.String.CString import CString
+
+try:
+   import pypdf
+   from pypdf import PdfReader, PdfWriter
+   from pypdf.generic import Destination, Fit, NameObject, TextStringObject
+except ImportError:
+   pypdf = None # optional dependency; checked when the assembler is created
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPDFAssembler():
+   """
+The ``CPDFAssembler`` class assembles the PDF files of the shards of a documentation (see section ``SHARDING`` of
+``packagedoc_config.json``) to one PDF file. The pages are taken over together with their links; the bookmarks of all shards
+are merged.
+
+Links between the shards refer to named destinations (anchors) defined within other PDF files. The LaTeX compiler replaces
+such destinations by a fixed one within the referring PDF file. Therefore the owner of every anchor is taken out of the label index
+(``CLabelIndex``): only the destination of the owning shard is taken over. Anchors defined within several shards without owner
+(e.g. footnotes) are renamed per shard; the links within a shard keep pointing to the anchors of this shard.
+
+The assembling is based on the Python package ``pypdf``.
+   """
+
+   def __init__(self):
+      """
+Constructor of class ``CPDFAssembler``.
+      """
+
+      sMethod = "CPDFAssembler.__init__"
+
+      if pypdf is None:
+         bSuccess = None
+         sResult  = "The assembling of the shards (section 'SHARDING') requires the Python package 'pypdf'. Please install it (or remove the section)."
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __GetFit(self, oDestination=None):
+      """Returns the view (``Fit``) of a destination of a source PDF file.
+      """
+      sType = oDestination.typ
+      if sType == "/XYZ":
+         return Fit.xyz(oDestination.left, oDestination.top, oDestination.zoom)
+      if sType == "/FitH":
+         return Fit.fit_horizontally(oDestination.top)
+      if sType == "/FitV":
+         return Fit.fit_vertically(oDestination.left)
+      if sType == "/FitBH":
+         return Fit.fit_box_horizontally(oDestination.top)
+      if sType == "/FitBV":
+         return Fit.fit_box_vertically(oDestination.left)
+      if sType == "/FitR":
+         return Fit.fit_rectangle(oDestination.left, oDestination.bottom, oDestination.right, oDestination.top)
+      if sType == "/FitB":
+         return Fit.fit_box()
+      return Fit.fit()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __CopyOutline(self, oWriter=None, oReader=None, listOutline=[], nPageOffset=0, oParent=None):
+      """Copies the bookmarks of a source PDF file (recursively) to the assembled PDF file.
+      """
+      oLastItem = None
+      for oItem in listOutline:
+         if isinstance(oItem, list):
+            if oLastItem is not None:
+               self.__CopyOutline(oWriter, oReader, oItem, nPageOffset, oLastItem)
+            continue
+         nPage = oReader.get_destination_page_number(oItem)
+         if ( (nPage is None) or (nPage < 0) ):
+            continue
+         oLastItem = oWriter.add_outline_item(oItem.title, nPageOffset + nPage, parent=oParent, fit=self.__GetFit(oItem), is_open=False)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Assemble(self, listParts=[], dictAnchorOwners={}, sDestinationFile=None):
+      """
+Assembles the PDF files of the shards to one PDF file.
+
+**Arguments:**
+
+* ``listParts``
+
+  / *Condition*: required / *Type*: list /
+
+  List of tuples ``(name of shard, PDF file, own anchors)`` in the order of the resulting PDF file. In case of ``own anchors`` is ``False``,
+  the named destinations of this part are not taken over (e.g. the front matter referring to the chapters of all other parts).
+
+* ``dictAnchorOwners``
+
+  / *Condition*: required / *Type*: dict /
+
+  The shard every anchor belongs to (see ``CLabelIndex.dictAnchors``).
+
+* ``sDestinationFile``
+
+  / *Condition*: required / *Type*: str /
+
+  Path and name of the assembled PDF file.
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CPDFAssembler.Assemble"
+
+      sTmpFile = None
+      try:
+         listReaders = [(sShard, PdfReader(sPDFFile), bOwnAnchors) for sShard, sPDFFile, bOwnAnchors in listParts]
+
+         # -- anchors defined within several parts without owner are renamed per part
+         dictDefinitions = {}
+         for sShard, oReader, bOwnAnchors in listReaders:
+            if bOwnAnchors is True:
+               for sAnchor in oReader.named_destinations:
+                  dictDefinitions[sAnchor] = dictDefinitions.get(sAnchor, 0) + 1
+         setRenamed = set([sAnchor for sAnchor, nCount in dictDefinitions.items() if ( (nCount > 1) and (sAnchor not in dictAnchorOwners) )])
+
+         # -- pages (together with their links)
+         oWriter = PdfWriter()
+         listPageOffsets = []
+         for sShard, oReader, bOwnAnchors in listReaders:
+            listPageOffsets.append(len(oWriter.pages))
+            for oPage in oReader.pages:
+               oNewPage = oWriter.add_page(oPage)
+               if bOwnAnchors is False:
+                  continue
+               for oAnnotation in oNewPage.get("/Annots", []):
+                  dictAnnotation = oAnnotation.get_object()
+                  dictAction = dictAnnotation.get("/A")
+                  if dictAction is not None:
+                     dictAction = dictAction.get_object()
+                  for dictTarget, sKey in ((dictAction, "/D"), (dictAnnotation, "/Dest")):
+                     if ( (dictTarget is not None) and (isinstance(dictTarget.get(sKey), str) is True) and (dictTarget[sKey] in setRenamed) ):
+                        dictTarget[NameObject(sKey)] = TextStringObject(f"{sShard}/{dictTarget[sKey]}")
+         # eof for sShard, oReader, bOwnAnchors in listReaders:
+
+         # -- named destinations (destinations still missing when the file is written are added by pypdf out of the part containing the link)
+         setAnchorsAdded = set()
+         for (sShard, oReader, bOwnAnchors), nPageOffset in zip(listReaders, listPageOffsets):
+            if bOwnAnchors is False:
+               continue
+            for sAnchor, oDestination in oReader.named_destinations.items():
+               sOwner = dictAnchorOwners.get(sAnchor)
+               if ( (sOwner is not None) and (sOwner != sShard) ):
+                  continue # replacement of an anchor of another shard (link between shards)
+               sName = f"{sShard}/{sAnchor}" if sAnchor in setRenamed else sAnchor
+               if sName in setAnchorsAdded:
+                  continue
+               nPage = oReader.get_destination_page_number(oDestination)
+               if ( (nPage is None) or (nPage < 0) ):
+                  continue
+               oWriter.add_named_destination_object(Destination(TextStringObject(sName), oWriter.pages[nPageOffset + nPage].indirect_reference,
+                                                                self.__GetFit(oDestination)))
+               setAnchorsAdded.add(sName)
+
+         # -- bookmarks
+         for (sShard, oReader, bOwnAnchors), nPageOffset in zip(listReaders, listPageOffsets):
+            self.__CopyOutline(oWriter, oReader, oReader.outline, nPageOffset)
+
+         if listReaders[0][1].metadata is not None:
+            oWriter.add_metadata(dict(listReaders[0][1].metadata))
+         oWriter.page_mode = "/UseOutlines"
+
+         # the assembled file is written under a temporary name first (a PDF viewer may keep the previous file opened)
+         hTmpFile, sTmpFile = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(sDestinationFile)), suffix=".pdf.tmp")
+         with os.fdopen(hTmpFile, "wb") as hOutputFile:
+            oWriter.write(hOutputFile)
+         os.replace(sTmpFile, sDestinationFile)
+      except Exception as ex:
+         if ( (sTmpFile is not None) and (os.path.isfile(sTmpFile) is True) ):
+            os.remove(sTmpFile)
+         bSuccess = None
+         sResult  = str(ex)
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"{len(listParts)} PDF files assembled to '{sDestinationFile}' ({len(oWriter.pages)} pages, {len(setAnchorsAdded)} anchors, {len(setRenamed)} anchors renamed)"
+      return bSuccess, sResult
+
+   # eof def Assemble(self, listParts=[], dictAnchorOwners={}, sDestinationFile=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPDFAssembler():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -31,13 +31,17 @@ and command line values.
 
 # --------------------------------------------------------------------------------------------------------------
 
-import os, sys, time, platform, json, argparse
+import os, sys, time, calendar, platform, json, argparse
 import colorama as col
 
 from PythonExtensionsCollection.String.CString import CString
 from PythonExtensionsCollection.File.CFile import CFile
 from PythonExtensionsCollection.Utils.CUtils import *
 
+from GenPackageDoc.CConversionEngine import CONVERSIONENGINES
+from GenPackageDoc.CProcessRunner import DEFAULTLIMITS
+from GenPackageDoc.CPlaceholderResolver import CPlaceholderResolver
+
 col.init(autoreset=True)
 COLBR = col.Style.BRIGHT + col.Fore.RED
 COLBG = col.Style.BRIGHT + col.Fore.GREEN
@@ -57,7 +61,7 @@ def printerror(sMsg):
 
 class CPackageDocConfig():
 
-   def __init__(self, oRepositoryConfig=None):
+   def __init__(self, oRepositoryConfig=None, listCmdLineArgs=None):
       """
 Constructor of class ``CPackageDocConfig``.
 
@@ -74,10 +78,18 @@ Responsible for:
 
   **GenPackageDoc** configuration containing static and dynamic configuration values (this includes the
   Repository configuration).
+
+* ``listCmdLineArgs``
+
+  / *Condition*: optional / *Type*: list / *Default*: None /
+
+  Command line arguments. Default: the command line of the current process (a build daemon passes the command line of the client).
       """
 
       sMethod = "CPackageDocConfig.__init__"
 
+      self.__listCmdLineArgs = listCmdLineArgs
+
       self.__dictPackageDocConfig = None  # self.__dictConfig
 
       if oRepositoryConfig is None:
@@ -135,13 +147,19 @@ Responsible for:
                                             "PARAMS",
                                             "DOCUMENT",
                                             "PICTURES",
+                                            "PICTUREPROCESSING",
                                             "DIAGRAMS",
                                             "OUTPUT",
                                             "PDFDEST",
                                             "CONFIGDEST",
                                             "TEX",
                                             "JAVA",
-                                            "PLANT_UML")
+                                            "PLANT_UML",
+                                            "PLANT_UML_SERVICE",
+                                            "CACHE",
+                                            "CONVERSION",
+                                            "LIMITS",
+                                            "SHARDING")
 
       for sKey in dictJsonValues.keys():
          if sKey not in tupleKeysAllowedInPackageDocConfig:
@@ -157,8 +175,9 @@ Responsible for:
       for key, value in dictRepositoryConfig.items():
          self.__dictPackageDocConfig[key] = value
 
-      # add current timestamp
-      self.__dictPackageDocConfig['NOW'] = time.strftime('%d.%m.%Y - %H:%M:%S')
+      # add current timestamp (final value computed after the CONTROL section is known)
+      self.__dictPackageDocConfig['NOW']              = time.strftime('%d.%m.%Y - %H:%M:%S')
+      self.__dictPackageDocConfig['nSourceDateEpoch'] = None
 
       # -- get keys and values from static documentation build configuration (json file),
       #    distingushing between required and optional parameters and checking the
@@ -177,11 +196,21 @@ Responsible for:
       # 21.11.2022 Feature 'INCLUDEPRIVATE' switched off. TODO: needs several bugfixes
       self.__dictPackageDocConfig['CONTROL']['INCLUDEPRIVATE'] = False
       # ==============================================================================================================
-      bSuccess, sResult = self.__CheckElements(('INCLUDEPRIVATE','INCLUDEUNDOCUMENTED','STRICT'), self.__dictPackageDocConfig['CONTROL'].keys(), "subkey")
+      # optional; in case of the environment variable SOURCE_DATE_EPOCH is set, the reproducible mode is switched on automatically
+      if not 'REPRODUCIBLE' in self.__dictPackageDocConfig['CONTROL']:
+         self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] = False
+      if os.environ.get('SOURCE_DATE_EPOCH') is not None:
+         self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] = True
+      bSuccess, sResult = self.__CheckElements(('INCLUDEPRIVATE','INCLUDEUNDOCUMENTED','STRICT','REPRODUCIBLE'), self.__dictPackageDocConfig['CONTROL'].keys(), "subkey")
       if bSuccess is not True:
          sResult = sResult + f"\nWhile reading from '{sDocumentationProjectConfigFile}'"
          raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
 
+      # timestamp of the build (in reproducible mode pinned to SOURCE_DATE_EPOCH or to the package date)
+      bSuccess, sResult = self.__SetTimestamp()
+      if bSuccess is not True:
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
       # required
       if 'TOC' in dictJsonValues:
          self.__dictPackageDocConfig['TOC'] = dictJsonValues['TOC']
@@ -218,6 +247,30 @@ Responsible for:
       else:
          self.__dictPackageDocConfig['PICTURES'] = None
 
+      # optional: the pictures are downscaled and recompressed before they are embedded in the PDF file
+      if 'PICTUREPROCESSING' in dictJsonValues:
+         self.__dictPackageDocConfig['PICTUREPROCESSING'] = dictJsonValues['PICTUREPROCESSING']
+      else:
+         self.__dictPackageDocConfig['PICTUREPROCESSING'] = None
+      if self.__dictPackageDocConfig['PICTUREPROCESSING'] is not None:
+         if not 'DPI' in self.__dictPackageDocConfig['PICTUREPROCESSING']:
+            self.__dictPackageDocConfig['PICTUREPROCESSING']['DPI'] = 150
+         if not 'PAGEWIDTH' in self.__dictPackageDocConfig['PICTUREPROCESSING']:
+            self.__dictPackageDocConfig['PICTUREPROCESSING']['PAGEWIDTH'] = 7.06 # text width of the PDF file in inch (510pt)
+         if not 'QUALITY' in self.__dictPackageDocConfig['PICTUREPROCESSING']:
+            self.__dictPackageDocConfig['PICTUREPROCESSING']['QUALITY'] = None # lossless
+         for sSubKey in ('DPI', 'PAGEWIDTH'):
+            oValue = self.__dictPackageDocConfig['PICTUREPROCESSING'][sSubKey]
+            if ( (type(oValue) not in (int, float)) or (oValue <= 0) ):
+               bSuccess = None
+               sResult  = f"Invalid value '{oValue}' of subkey '{sSubKey}' in section 'PICTUREPROCESSING' within '{sDocumentationProjectConfigFile}'. Expected is a positive number."
+               raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+         oValue = self.__dictPackageDocConfig['PICTUREPROCESSING']['QUALITY']
+         if ( (oValue is not None) and ( (type(oValue) != int) or (oValue < 1) or (oValue > 95) ) ):
+            bSuccess = None
+            sResult  = f"Invalid value '{oValue}' of subkey 'QUALITY' in section 'PICTUREPROCESSING' within '{sDocumentationProjectConfigFile}'. Expected is null (lossless) or an integer number between 1 and 95."
+            raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
       # optional
       if 'DIAGRAMS' in dictJsonValues:
          self.__dictPackageDocConfig['DIAGRAMS'] = dictJsonValues['DIAGRAMS']
@@ -251,6 +304,27 @@ Responsible for:
          bSuccess = None
          sResult  = f"Missing key 'TEX' within '{sDocumentationProjectConfigFile}'"
          raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+      # optional: maximum number of LaTeX compiler passes
+      if not 'MAXPASSES' in self.__dictPackageDocConfig['TEX']:
+         self.__dictPackageDocConfig['TEX']['MAXPASSES'] = 5
+      if ( (type(self.__dictPackageDocConfig['TEX']['MAXPASSES']) != int) or (self.__dictPackageDocConfig['TEX']['MAXPASSES'] < 1) ):
+         bSuccess = None
+         sResult  = f"Invalid value '{self.__dictPackageDocConfig['TEX']['MAXPASSES']}' of subkey 'MAXPASSES' in section 'TEX' within '{sDocumentationProjectConfigFile}'. Expected is a positive integer number."
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      # optional: the chapters are compiled in groups (shards) as independent documents, that are assembled to the final PDF file
+      if 'SHARDING' in dictJsonValues:
+         self.__dictPackageDocConfig['SHARDING'] = dictJsonValues['SHARDING']
+      else:
+         self.__dictPackageDocConfig['SHARDING'] = None
+      if self.__dictPackageDocConfig['SHARDING'] is not None:
+         if not 'MAXCHAPTERS' in self.__dictPackageDocConfig['SHARDING']:
+            self.__dictPackageDocConfig['SHARDING']['MAXCHAPTERS'] = 50
+         oValue = self.__dictPackageDocConfig['SHARDING']['MAXCHAPTERS']
+         if ( (type(oValue) != int) or (oValue < 1) ):
+            bSuccess = None
+            sResult  = f"Invalid value '{oValue}' of subkey 'MAXCHAPTERS' in section 'SHARDING' within '{sDocumentationProjectConfigFile}'. Expected is a positive integer number."
+            raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
 
       # optional (but PLANT_UML requires JAVA; in case of PLANT_UML is requested, JAVA needs to be defined)
       if 'JAVA' in dictJsonValues:
@@ -264,6 +338,71 @@ Responsible for:
       else:
          self.__dictPackageDocConfig['PLANT_UML'] = None
 
+      # optional: diagrams are rendered by a long running PlantUML service (instead of starting Java for every build)
+      if 'PLANT_UML_SERVICE' in dictJsonValues:
+         self.__dictPackageDocConfig['PLANT_UML_SERVICE'] = dictJsonValues['PLANT_UML_SERVICE']
+      else:
+         self.__dictPackageDocConfig['PLANT_UML_SERVICE'] = None
+      if self.__dictPackageDocConfig['PLANT_UML_SERVICE'] is not None:
+         if not 'PORT' in self.__dictPackageDocConfig['PLANT_UML_SERVICE']:
+            self.__dictPackageDocConfig['PLANT_UML_SERVICE']['PORT'] = 0 # any free port
+         if not 'CONNECTIONS' in self.__dictPackageDocConfig['PLANT_UML_SERVICE']:
+            self.__dictPackageDocConfig['PLANT_UML_SERVICE']['CONNECTIONS'] = 4
+         for sSubKey in ('PORT', 'CONNECTIONS'):
+            if type(self.__dictPackageDocConfig['PLANT_UML_SERVICE'][sSubKey]) != int:
+               bSuccess = None
+               sResult  = f"Invalid value '{self.__dictPackageDocConfig['PLANT_UML_SERVICE'][sSubKey]}' of subkey '{sSubKey}' in section 'PLANT_UML_SERVICE' within '{sDocumentationProjectConfigFile}'. Expected is an integer number."
+               raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      # optional
+      if 'CACHE' in dictJsonValues:
+         self.__dictPackageDocConfig['CACHE'] = dictJsonValues['CACHE']
+      else:
+         self.__dictPackageDocConfig['CACHE'] = None
+      if self.__dictPackageDocConfig['CACHE'] is not None:
+         if not 'FOLDER' in self.__dictPackageDocConfig['CACHE']:
+            bSuccess = None
+            sResult  = f"Missing subkey 'FOLDER' in section 'CACHE' within '{sDocumentationProjectConfigFile}'"
+            raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+         if not 'MAXSIZE' in self.__dictPackageDocConfig['CACHE']:
+            self.__dictPackageDocConfig['CACHE']['MAXSIZE'] = 256 # MB
+
+      # optional
+      if 'CONVERSION' in dictJsonValues:
+         self.__dictPackageDocConfig['CONVERSION'] = dictJsonValues['CONVERSION']
+      else:
+         self.__dictPackageDocConfig['CONVERSION'] = None
+      if self.__dictPackageDocConfig['CONVERSION'] is None:
+         self.__dictPackageDocConfig['CONVERSION'] = {}
+      if not 'ENGINE' in self.__dictPackageDocConfig['CONVERSION']:
+         self.__dictPackageDocConfig['CONVERSION']['ENGINE'] = "pandoc"
+      if self.__dictPackageDocConfig['CONVERSION']['ENGINE'] not in CONVERSIONENGINES:
+         bSuccess = None
+         sResult  = f"Invalid conversion engine '{self.__dictPackageDocConfig['CONVERSION']['ENGINE']}' in section 'CONVERSION' within '{sDocumentationProjectConfigFile}'. Expected is one of {list(CONVERSIONENGINES.keys())}"
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      # optional: limits of the external tools (timeout, memory, CPU time); missing values are taken from the defaults
+      dictLimits = None
+      if 'LIMITS' in dictJsonValues:
+         dictLimits = dictJsonValues['LIMITS']
+      if dictLimits is None:
+         dictLimits = {}
+      for sTool in dictLimits:
+         if sTool not in DEFAULTLIMITS:
+            bSuccess = None
+            sResult  = f"Invalid tool '{sTool}' in section 'LIMITS' within '{sDocumentationProjectConfigFile}'. Expected is one of {list(DEFAULTLIMITS.keys())}"
+            raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+      self.__dictPackageDocConfig['LIMITS'] = {}
+      for sTool, dictDefaultLimits in DEFAULTLIMITS.items():
+         self.__dictPackageDocConfig['LIMITS'][sTool] = dict(dictDefaultLimits)
+         if dictLimits.get(sTool) is not None:
+            self.__dictPackageDocConfig['LIMITS'][sTool].update(dictLimits[sTool])
+         for sSubKey, oValue in self.__dictPackageDocConfig['LIMITS'][sTool].items():
+            if ( (sSubKey not in dictDefaultLimits) or ( (oValue is not None) and ( (type(oValue) != int) or (oValue <= 0) ) ) ):
+               bSuccess = None
+               sResult  = f"Invalid subkey or value '{sSubKey}' : '{oValue}' of tool '{sTool}' in section 'LIMITS' within '{sDocumentationProjectConfigFile}'. Expected are {list(dictDefaultLimits.keys())} with a positive integer number or null."
+               raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
       # Now we have all configuration values available in self.__dictPackageDocConfig. Next steps are:
       # - resolve placeholders (possible placeholders are the keys from repository configuration)
       # - normalize paths
@@ -277,33 +416,24 @@ Responsible for:
             sResult  = f"Document part '{sDocumentPartUsed}' not defined within 'TOC' section of '{sDocumentationProjectConfigFile}'"
             raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
 
+      # - resolver for placeholders (possible placeholders are the keys from repository configuration; PARAMS and DOCUMENT also accept NOW)
+      oRepositoryResolver = CPlaceholderResolver(dictRepositoryConfig)
+      oParamsResolver     = CPlaceholderResolver({**dictRepositoryConfig, 'NOW' : self.__dictPackageDocConfig['NOW']})
+
       # - placeholder in TOC section
       listDocumentParts = self.__dictPackageDocConfig['TOC']['DOCUMENTPARTS']
       for sDocumentPart in listDocumentParts:
          sDocumentPartPath = self.__dictPackageDocConfig['TOC'][sDocumentPart]
-         for repo_key, repo_value in dictRepositoryConfig.items():
-            if type(repo_value) == str:
-               sDocumentPartPath = sDocumentPartPath.replace(f"###{repo_key}###", repo_value)
-         self.__dictPackageDocConfig['TOC'][sDocumentPart] = sDocumentPartPath
+         self.__dictPackageDocConfig['TOC'][sDocumentPart] = oRepositoryResolver.Resolve(sDocumentPartPath)
 
       # - placeholder in PARAMS section
       if self.__dictPackageDocConfig['PARAMS'] is not None:
          for doc_key, doc_value in self.__dictPackageDocConfig['PARAMS'].items():
-            sResolvedValue = str(doc_value)
-            sResolvedValue = sResolvedValue.replace("###NOW###", self.__dictPackageDocConfig['NOW'])
-            for repo_key, repo_value in dictRepositoryConfig.items():
-               if type(repo_value) == str:
-                  sResolvedValue = sResolvedValue.replace(f"###{repo_key}###", repo_value)
-            self.__dictPackageDocConfig['PARAMS'][doc_key] = sResolvedValue
+            self.__dictPackageDocConfig['PARAMS'][doc_key] = oParamsResolver.Resolve(str(doc_value))
 
       # - placeholder in DOCUMENT section
       for doc_key, doc_value in self.__dictPackageDocConfig['DOCUMENT'].items():
-         sResolvedValue = str(doc_value) # TODO: other types required?
-         sResolvedValue = sResolvedValue.replace("###NOW###", self.__dictPackageDocConfig['NOW'])
-         for repo_key, repo_value in dictRepositoryConfig.items():
-            if type(repo_value) == str:
-               sResolvedValue = sResolvedValue.replace(f"###{repo_key}###", repo_value)
-         self.__dictPackageDocConfig['DOCUMENT'][doc_key] = sResolvedValue
+         self.__dictPackageDocConfig['DOCUMENT'][doc_key] = oParamsResolver.Resolve(str(doc_value)) # TODO: other types required?
 
       # the absolute path that is reference for all relative paths
       sReferencePathAbs = self.__dictPackageDocConfig['PACKAGEDOC'] # set initially in repository config and already normalized
@@ -320,13 +450,16 @@ Responsible for:
          sPackageDocValue = self.__dictPackageDocConfig[sConfigKey]
          if sPackageDocValue is not None:
             # resolve placeholder in further config keys (possible placeholder are the keys from repository configuration)
-            for repo_key, repo_value in dictRepositoryConfig.items():
-               if type(repo_value) == str:
-                  sPackageDocValue = sPackageDocValue.replace(f"###{repo_key}###", repo_value)
+            sPackageDocValue = oRepositoryResolver.Resolve(sPackageDocValue)
 
             # normalize path and write value back to dict
             self.__dictPackageDocConfig[sConfigKey] = CString.NormalizePath(sPath=sPackageDocValue, sReferencePathAbs=sReferencePathAbs)
 
+      # -- resolve placeholder and normalize path of cache folder
+      if self.__dictPackageDocConfig['CACHE'] is not None:
+         sCacheFolder = oRepositoryResolver.Resolve(self.__dictPackageDocConfig['CACHE']['FOLDER'])
+         self.__dictPackageDocConfig['CACHE']['FOLDER'] = CString.NormalizePath(sPath=sCacheFolder, sReferencePathAbs=sReferencePathAbs)
+
       # -- prepare path to LaTeX interpreter (mandatory)
       sLaTeXInterpreter = None
       sKey = sPlatformSystem.upper()
@@ -519,6 +652,59 @@ Returns the complete configuration dictionary.
    # eof def GetConfig(self):
 
 
+   def __SetTimestamp(self):
+      """
+Computes the timestamp of the build (``NOW``).
+
+In reproducible mode (``CONTROL/REPRODUCIBLE``) the timestamp does not depend on the time of the build. It is taken from the
+environment variable ``SOURCE_DATE_EPOCH`` (seconds since 01.01.1970, UTC) or - if not set - from the package date (``PACKAGEDATE``,
+format ``dd.mm.yyyy``). The corresponding epoch is stored in ``nSourceDateEpoch`` (and passed to the LaTeX compiler).
+
+Placeholders already resolved with the previous timestamp are updated.
+      """
+
+      sMethod = "CPackageDocConfig.__SetTimestamp"
+
+      sNowBefore = self.__dictPackageDocConfig['NOW']
+      nSourceDateEpoch = None
+
+      if self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] is True:
+         sSourceDateEpoch = os.environ.get('SOURCE_DATE_EPOCH')
+         if sSourceDateEpoch is not None:
+            try:
+               nSourceDateEpoch = int(sSourceDateEpoch)
+            except ValueError:
+               bSuccess = False
+               sResult  = f"Invalid value '{sSourceDateEpoch}' of environment variable SOURCE_DATE_EPOCH. Expected is an integer number."
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         else:
+            sPackageDate = str(self.__dictPackageDocConfig.get('PACKAGEDATE'))
+            try:
+               nSourceDateEpoch = calendar.timegm(time.strptime(sPackageDate, '%d.%m.%Y'))
+            except ValueError:
+               bSuccess = False
+               sResult  = f"Reproducible mode requires either the environment variable SOURCE_DATE_EPOCH or a package date in format 'dd.mm.yyyy' (but package date is '{sPackageDate}')"
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         self.__dictPackageDocConfig['NOW'] = time.strftime('%d.%m.%Y - %H:%M:%S', time.gmtime(nSourceDateEpoch))
+
+      self.__dictPackageDocConfig['nSourceDateEpoch'] = nSourceDateEpoch
+
+      sNow = self.__dictPackageDocConfig['NOW']
+      if sNow != sNowBefore:
+         for sSection in ('PARAMS', 'DOCUMENT', 'dictRuntimeVariables'):
+            dictSection = self.__dictPackageDocConfig.get(sSection)
+            if dictSection is not None:
+               for key, value in dictSection.items():
+                  if type(value) == str:
+                     dictSection[key] = value.replace(sNowBefore, sNow)
+
+      bSuccess = True
+      sResult  = f"Timestamp set to '{sNow}'"
+      return bSuccess, sResult
+
+   # eof def __SetTimestamp(self):
+
+
    def __GetCmdLineArgs(self):
       """
 Get values fom command linwe and add them to **GenPackageDoc** configuration. Already existing configuration values will be overwritten.
@@ -539,8 +725,22 @@ Get values fom command linwe and add them to **GenPackageDoc** configuration. Al
       oCmdLineParser.add_argument('--configdest', type=str, help='Path and name of folder in which the configuration files will be copied to.')
       oCmdLineParser.add_argument('--strict', help='If True, a missing LaTeX compiler aborts the process, otherwise the process continues.')
       oCmdLineParser.add_argument('--simulateonly', action='store_true', help='If True, the LaTeX compiler is switched off; a syntax check only remains in this case. Default: False')
-
-      oCmdLineArgs = oCmdLineParser.parse_args()
+      oCmdLineParser.add_argument('--incremental', action='store_true', help='If True, the output folder is not deleted and only changed chapters are regenerated. Default: False')
+      oCmdLineParser.add_argument('--jobs', type=int, default=1, help='Number of Python modules that are processed in parallel (0: number of CPUs). Default: 1')
+      oCmdLineParser.add_argument('--engine', type=str, choices=list(CONVERSIONENGINES.keys()), help='Engine used to convert rst code to tex code.')
+      oCmdLineParser.add_argument('--linkassets', action='store_true', help='If True, pictures, diagrams and styles are linked into the output folder instead of copied. Default: False')
+      oCmdLineParser.add_argument('--only', type=str, help='Comma separated list of document parts or modules (glob patterns) that are regenerated and typeset; all other chapters are taken over from previous build (implies --incremental).')
+      oCmdLineParser.add_argument('--watch', action='store_true', help='If True, the documentation is rebuilt (incremental) whenever a source file changes (until the process is stopped by Ctrl+C). Default: False')
+      oCmdLineParser.add_argument('--cachefolder', type=str, help='Path and name of the cache folder (overwrites the folder of section CACHE; switches on the cache in case of the section is missing).')
+      oCmdLineParser.add_argument('--reproducible', action='store_true', help='If True, the generated files do not depend on the time of the build (timestamp taken from SOURCE_DATE_EPOCH or package date). Default: False')
+
+      # -- build daemon and batch mode (evaluated by genpackagedoc.py before the configuration is set up; listed here to be part of the help)
+      oCmdLineParser.add_argument('--daemon', type=str, help='Runs GenPackageDoc as build daemon, listening at the given loopback port or Unix socket path.')
+      oCmdLineParser.add_argument('--workers', type=int, default=2, help='Number of worker processes of the build daemon (builds executed in parallel). Default: 2')
+      oCmdLineParser.add_argument('--usedaemon', type=str, help='Sends the build to the build daemon listening at the given loopback port or Unix socket path.')
+      oCmdLineParser.add_argument('--batch', type=str, nargs='+', help='Builds the documentation of several repositories (repository folders or batch manifest files) in one process.')
+
+      oCmdLineArgs = oCmdLineParser.parse_args(self.__listCmdLineArgs)
 
       OUTPUT = None
       if oCmdLineArgs.output != None:
@@ -578,6 +778,20 @@ Get values fom command linwe and add them to **GenPackageDoc** configuration. Al
             self.__dictPackageDocConfig['CONFIGDEST'] = CONFIGDEST
             print(COLNY + f"<'CONFIGDEST' redirected to '{CONFIGDEST}'>\n")
 
+      CACHEFOLDER = None
+      if oCmdLineArgs.cachefolder != None:
+         CACHEFOLDER = oCmdLineArgs.cachefolder
+         if CACHEFOLDER == "":
+            bSuccess = False
+            sResult  = "Empty command line argument: -cachefolder."
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         else:
+            CACHEFOLDER = CString.NormalizePath(sPath=CACHEFOLDER, sReferencePathAbs=sReferencePathAbs)
+            if self.__dictPackageDocConfig['CACHE'] is None:
+               self.__dictPackageDocConfig['CACHE'] = {'MAXSIZE' : 256} # MB
+            self.__dictPackageDocConfig['CACHE']['FOLDER'] = CACHEFOLDER
+            print(COLNY + f"<'CACHE' redirected to '{CACHEFOLDER}'>\n")
+
       STRICT = None
       if oCmdLineArgs.strict != None:
          STRICT = oCmdLineArgs.strict
@@ -595,6 +809,62 @@ Get values fom command linwe and add them to **GenPackageDoc** configuration. Al
       if bSimulateOnly is True:
          print(COLNY + "<running in simulation mode>\n")
 
+      # partial build: only the selected document parts or modules are regenerated and typeset (requires the outputs of the previous build)
+      listOnly = None
+      if oCmdLineArgs.only is not None:
+         listOnly = [sPattern.strip().replace("\\", "/") for sPattern in oCmdLineArgs.only.split(",") if sPattern.strip() != ""]
+         if len(listOnly) == 0:
+            bSuccess = False
+            sResult  = f"Invalid command line argument: -only='{oCmdLineArgs.only}'. Expected is a comma separated list of document parts or modules."
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         print(COLNY + f"<partial build: {', '.join(listOnly)}>\n")
+      self.__dictPackageDocConfig['listOnly'] = listOnly
+
+      bWatch = False
+      if oCmdLineArgs.watch is not None:
+         bWatch = oCmdLineArgs.watch
+      self.__dictPackageDocConfig['bWatch'] = bWatch
+      if bWatch is True:
+         print(COLNY + "<running in watch mode>\n")
+
+      bIncremental = False
+      if oCmdLineArgs.incremental is not None:
+         bIncremental = oCmdLineArgs.incremental
+      if ( (listOnly is not None) or (bWatch is True) ):
+         bIncremental = True
+      self.__dictPackageDocConfig['bIncremental'] = bIncremental
+      if bIncremental is True:
+         print(COLNY + "<running in incremental mode>\n")
+
+      bLinkAssets = False
+      if oCmdLineArgs.linkassets is not None:
+         bLinkAssets = oCmdLineArgs.linkassets
+      self.__dictPackageDocConfig['bLinkAssets'] = bLinkAssets
+      if bLinkAssets is True:
+         print(COLNY + "<linking assets into output folder>\n")
+
+      nJobs = oCmdLineArgs.jobs
+      if nJobs < 0:
+         bSuccess = False
+         sResult  = f"Invalid command line argument: -jobs={nJobs}. Expected is a positive number or 0."
+         return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      if nJobs == 0:
+         nJobs = os.cpu_count() or 1
+      self.__dictPackageDocConfig['nJobs'] = nJobs
+      if nJobs > 1:
+         print(COLNY + f"<running with {nJobs} jobs>\n")
+
+      if oCmdLineArgs.engine is not None:
+         self.__dictPackageDocConfig['CONVERSION']['ENGINE'] = oCmdLineArgs.engine
+         print(COLNY + f"<'ENGINE' set to '{oCmdLineArgs.engine}'>\n")
+
+      if ( (oCmdLineArgs.reproducible is True) and (self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] is not True) ):
+         self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] = True
+         bSuccess, sResult = self.__SetTimestamp()
+         if bSuccess is not True:
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      if self.__dictPackageDocConfig['CONTROL']['REPRODUCIBLE'] is True:
+         print(COLNY + f"<running in reproducible mode (timestamp: {self.__dictPackageDocConfig['NOW']})>\n")
 
       bSuccess = True
       sResult  = "Done"
@@ -42,7 +42,7 @@ All source patterns are accessible by corresponding ``Get`` methods. Some source
 that will be replaced by input parameter of the ``Get`` method.
    """
 
-   def GetHeader(self, sTitle="", sVersion="", sAuthor="", sDate=""):
+   def GetHeader(self, sTitle="", sVersion="", sAuthor="", sDate="", listIncludeOnly=None):
       """
 Defines the header of the main tex file.
 
@@ -72,6 +72,13 @@ Defines the header of the main tex file.
 
   The date of the output document (date of the described package)
 
+* ``listIncludeOnly``
+
+  / *Condition*: optional / *Type*: list / *Default*: None /
+
+  The names of the chapters that are typeset (partial build, see ``GetInclude``). All other chapters are taken over from the
+  auxiliary files of the previous build. Without this list all chapters are typeset.
+
 **Returns:**
 
 * ``sHeader``
@@ -82,14 +89,17 @@ Defines the header of the main tex file.
       """
 
       sHeader = r"""
-\documentclass[a4paper,10pt]{report}
-
 % --------------------------------------------------------------------------------------------------------------
 % preamble
 % --------------------------------------------------------------------------------------------------------------
 
+\ifdefined\GenPackageDocPreamble\else% static preamble not already loaded from precompiled format
+\documentclass[a4paper,10pt]{report}
 \input{./styles/preamble}
+\fi
 
+\usepackage{styles/autodefined}% caution: automatically generated at runtime; this file is not part of the GenPackageDoc installation
+###INCLUDEONLY###
 % --------------------------------------------------------------------------------------------------------------
 % title
 % --------------------------------------------------------------------------------------------------------------
@@ -127,9 +137,38 @@ Defines the header of the main tex file.
       sReturn = sReturn.replace('###VERSION###', sVersion)
       sReturn = sReturn.replace('###AUTHOR###',  sAuthor)
       sReturn = sReturn.replace('###DATE###',    sDate)
+      sIncludeOnly = "\n"
+      if listIncludeOnly is not None:
+         sIncludeOnly = "\n\\includeonly{" + ",".join(listIncludeOnly) + "}% partial build\n\n"
+      sReturn = sReturn.replace('###INCLUDEONLY###\n', sIncludeOnly)
       return sReturn
 
-   # eof def GetHeader(self, sTitle="", sVersion="", sAuthor="", sDate=""):
+   # eof def GetHeader(self, sTitle="", sVersion="", sAuthor="", sDate="", listIncludeOnly=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+   def GetFormatSource(self):
+      """
+Defines the source of the precompiled LaTeX format containing the static part of the preamble of the main tex file.
+
+**Returns:**
+
+* ``sFormatSource``
+
+  / *Type*: str /
+
+  LaTeX code to be dumped into a LaTeX format (``-ini`` mode of the LaTeX compiler).
+      """
+
+      sFormatSource = r"""
+\documentclass[a4paper,10pt]{report}
+\input{./styles/preamble}
+\def\GenPackageDocPreamble{}
+\dump
+      """
+      return sFormatSource
+
+   # eof def GetFormatSource(self):
 
    # --------------------------------------------------------------------------------------------------------------
 
@@ -183,6 +222,146 @@ within a Python package.
 
    # --------------------------------------------------------------------------------------------------------------
 
+   def GetInclude(self, sDocumentName=""):
+      """
+Defines the import of a single chapter into the main tex file in case of a partial build. The chapter (see ``GetChapter``) is placed
+within an own tex file that is imported by ``\\include``. Chapters not listed in ``\\includeonly`` (see ``GetHeader``) are not typeset;
+their page numbers and labels are taken out of their auxiliary files.
+
+**Arguments:**
+
+* ``sDocumentName``
+
+  / *Condition*: required / *Type*: str /
+
+  The name of the tex file containing the chapter (without extension).
+
+**Returns:**
+
+* ``sInclude``
+
+  / *Type*: str /
+
+  LaTeX code containing the include of a single chapter.
+      """
+
+      sInclude = r"\include{###DOCUMENTNAME###}"
+      sReturn = sInclude.replace('###DOCUMENTNAME###', sDocumentName)
+      return sReturn
+   # eof def GetInclude(self, sDocumentName=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+   def GetShardHeader(self, sLabelsFileName="", nChapterOffset=0):
+      """
+Defines the header of the tex file of a shard (a part of the documentation compiled as independent document, see section ``SHARDING``
+of ``packagedoc_config.json``). Title page and table of contents are not part of the shard.
+
+**Arguments:**
+
+* ``sLabelsFileName``
+
+  / *Condition*: required / *Type*: str /
+
+  The name of the tex file containing the first page number of the shard and the labels of all other shards (see ``GetShardLabels``).
+
+* ``nChapterOffset``
+
+  / *Condition*: required / *Type*: int /
+
+  The number of chapters within all previous shards.
+
+**Returns:**
+
+* ``sShardHeader``
+
+  / *Type*: str /
+
+  LaTeX code containing the header of the tex file of a shard.
+      """
+
+      sShardHeader = r"""
+% --------------------------------------------------------------------------------------------------------------
+% preamble
+% --------------------------------------------------------------------------------------------------------------
+
+\ifdefined\GenPackageDocPreamble\else% static preamble not already loaded from precompiled format
+\documentclass[a4paper,10pt]{report}
+\input{./styles/preamble}
+\fi
+
+\usepackage{styles/autodefined}% caution: automatically generated at runtime; this file is not part of the GenPackageDoc installation
+
+% --------------------------------------------------------------------------------------------------------------
+% shard
+% --------------------------------------------------------------------------------------------------------------
+
+\input{./###LABELSFILENAME###}% caution: automatically generated at runtime (first page number and labels of all other shards)
+
+% number of the page following the last page of this shard (required to compute the page numbers of the following shards)
+\makeatletter
+\AtEndDocument{\clearpage\immediate\write\@auxout{\string\gdef\string\GenPackageDocNextPage{\the\value{page}}}}
+\makeatother
+
+% --------------------------------------------------------------------------------------------------------------
+% document
+% --------------------------------------------------------------------------------------------------------------
+
+\begin{document}
+
+\pagenumbering{arabic}
+\setcounter{page}{\GenPackageDocFirstPage}
+\setcounter{chapter}{###CHAPTEROFFSET###}
+
+      """
+      sReturn = sShardHeader.replace('###LABELSFILENAME###', sLabelsFileName)
+      sReturn = sReturn.replace('###CHAPTEROFFSET###', str(nChapterOffset))
+      return sReturn
+
+   # eof def GetShardHeader(self, sLabelsFileName="", nChapterOffset=0):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+   def GetShardLabels(self, nFirstPage=1, sLabelDefinitions=""):
+      """
+Defines the content of the labels file of a shard (imported by the header of the shard, see ``GetShardHeader``).
+
+**Arguments:**
+
+* ``nFirstPage``
+
+  / *Condition*: required / *Type*: int /
+
+  The number of the first page of the shard.
+
+* ``sLabelDefinitions``
+
+  / *Condition*: required / *Type*: str /
+
+  The definitions of the labels of all other shards (see ``CLabelIndex.GetLabelDefinitions``).
+
+**Returns:**
+
+* ``sShardLabels``
+
+  / *Type*: str /
+
+  LaTeX code containing the first page number of the shard and the labels of all other shards.
+      """
+
+      sShardLabels = r"""% first page number of this shard
+\def\GenPackageDocFirstPage{###FIRSTPAGE###}
+% labels of all other shards
+###LABELDEFINITIONS###
+"""
+      sReturn = sShardLabels.replace('###FIRSTPAGE###', str(nFirstPage))
+      sReturn = sReturn.replace('###LABELDEFINITIONS###', sLabelDefinitions)
+      return sReturn
+
+   # eof def GetShardLabels(self, nFirstPage=1, sLabelDefinitions=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+
    def GetFooter(self):
       """
 Defines the footer of the main tex file.
@@ -0,0 +1,262 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CPictureProcessor.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the preprocessing of pictures (downscaling and recompression) before they are embedded in the PDF file.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, io, hashlib
+import colorama as col
+
+from concurrent.futures import ProcessPoolExecutor
+
+from PythonExtensionsCollection.String.CString import CString
+
+try:
+   import PIL
+   from PIL import Image
+except ImportError:
+   PIL = None # optional dependency; checked when the processor is created
+
+col.init(autoreset=True)
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+
+# version of the picture preprocessing; to be increased in case of the processing changes (invalidates the cached pictures)
+PROCESSORVERSION = "1"
+
+# picture formats that are processed (key: file extension in lower case, value: Pillow format)
+DICTPICTUREFORMATS = {'.png'  : "PNG",
+                      '.jpg'  : "JPEG",
+                      '.jpeg' : "JPEG"}
+
+# resolution LaTeX assumes for pictures without resolution information
+DEFAULTDPI = 72
+
+# --------------------------------------------------------------------------------------------------------------
+
+def PreprocessPicture(bytesPicture=b"", sFormat="PNG", dictSettings={}):
+   """
+Downscales a single picture to the resolution ``DPI`` (related to the width of the picture within the PDF file: the natural width
+of the picture, limited by ``PAGEWIDTH``) and recompresses it (PNG: lossless, JPEG: with quality ``QUALITY``, in case of defined).
+The resolution information is adapted to keep the size of the picture within the PDF file unchanged. Returns the processed picture
+together with an error message (``None`` in case of success). In case of the processing does not reduce the size, the original picture
+is returned.
+
+This function is executed within worker processes.
+   """
+
+   try:
+      oImage = Image.open(io.BytesIO(bytesPicture))
+      oImage.load()
+      tupleDPI = oImage.info.get('dpi', (DEFAULTDPI, DEFAULTDPI))
+      fDPIX, fDPIY = float(tupleDPI[0] or DEFAULTDPI), float(tupleDPI[1] or DEFAULTDPI)
+      fWidth    = min(oImage.width / fDPIX, dictSettings['PAGEWIDTH']) # width within the PDF file in inch
+      nMaxWidth = max(1, int(dictSettings['DPI'] * fWidth))
+      bResized = False
+      if oImage.width > nMaxWidth:
+         fScale = nMaxWidth / oImage.width
+         oImage = oImage.resize((nMaxWidth, max(1, round(oImage.height * fScale))), Image.LANCZOS)
+         fDPIX, fDPIY = fDPIX * fScale, fDPIY * fScale
+         bResized = True
+      oOutput = io.BytesIO()
+      if sFormat == "PNG":
+         oImage.save(oOutput, "PNG", optimize=True, dpi=(fDPIX, fDPIY))
+      else:
+         if ( (bResized is False) and (dictSettings['QUALITY'] is None) ):
+            return bytesPicture, None # a JPEG picture cannot be recompressed lossless
+         if oImage.mode not in ("RGB", "L", "CMYK"):
+            oImage = oImage.convert("RGB")
+         nQuality = dictSettings['QUALITY'] if dictSettings['QUALITY'] is not None else 95
+         oImage.save(oOutput, "JPEG", quality=nQuality, optimize=True, dpi=(round(fDPIX), round(fDPIY)))
+      bytesProcessed = oOutput.getvalue()
+   except Exception as ex:
+      return bytesPicture, str(ex)
+   if len(bytesProcessed) >= len(bytesPicture):
+      return bytesPicture, None
+   return bytesProcessed, None
+
+# eof def PreprocessPicture(bytesPicture=b"", sFormat="PNG", dictSettings={}):
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPictureProcessor():
+   """
+The ``CPictureProcessor`` class reduces the size of pictures before they are embedded in the PDF file: pictures that are wider than
+needed for the configured resolution and page width are downscaled, all pictures are recompressed. This reduces the size of the PDF file
+and the time the LaTeX compiler needs to embed the pictures.
+
+The processing is based on the Python package ``Pillow``. The results are cached (key: content of the picture and settings).
+Pictures that are not found in the cache are processed in parallel.
+   """
+
+   def __init__(self, dictSettings=None, oCache=None, nJobs=1):
+      """
+Constructor of class ``CPictureProcessor``.
+
+**Arguments:**
+
+* ``dictSettings``
+
+  / *Condition*: required / *Type*: dict /
+
+  The settings of the processing (``DPI``, ``PAGEWIDTH``, ``QUALITY``; see section ``PICTUREPROCESSING`` of ``packagedoc_config.json``).
+
+* ``oCache``
+
+  / *Condition*: optional / *Type*: CConversionCache / *Default*: None /
+
+  Cache for the processed pictures (binary entries).
+
+* ``nJobs``
+
+  / *Condition*: optional / *Type*: int / *Default*: 1 /
+
+  Number of pictures that are processed in parallel.
+      """
+
+      sMethod = "CPictureProcessor.__init__"
+
+      if PIL is None:
+         bSuccess = None
+         sResult  = "The picture preprocessing (section 'PICTUREPROCESSING') requires the Python package 'Pillow'. Please install it (or remove the section)."
+         raise Exception(CString.FormatResult(sMethod, bSuccess, sResult))
+
+      self.__dictSettings = dictSettings
+      self.__oCache       = oCache
+      self.__nJobs        = max(1, int(nJobs))
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Process(self, listPictures=[], oOutputWriter=None):
+      """
+Processes the given pictures.
+
+**Arguments:**
+
+* ``listPictures``
+
+  / *Condition*: required / *Type*: list /
+
+  List of tuples ``(source file, destination file)``. The destination files are written by ``oOutputWriter``
+  (the source files are not changed). Pictures of other formats than PNG and JPEG are ignored.
+
+* ``oOutputWriter``
+
+  / *Condition*: required / *Type*: COutputWriter /
+
+  The writer of the destination files.
+
+**Returns:**
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CPictureProcessor.Process"
+
+      dictSettingsKey = dict(self.__dictSettings)
+      dictSettingsKey['processor'] = PROCESSORVERSION
+      dictSettingsKey['pillow']    = PIL.__version__
+
+      listToProcess = [] # (destination file, format, source picture, cache key)
+      listResults   = [] # (destination file, processed picture)
+      nSizeBefore   = 0
+      for sSourceFile, sDestinationFile in listPictures:
+         sFormat = DICTPICTUREFORMATS.get(os.path.splitext(sSourceFile)[1].lower())
+         if sFormat is None:
+            continue
+         try:
+            with open(sSourceFile, "rb") as hPictureFile:
+               bytesPicture = hPictureFile.read()
+         except Exception as ex:
+            bSuccess = None
+            sResult  = str(ex)
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         nSizeBefore = nSizeBefore + len(bytesPicture)
+         sKey = None
+         if self.__oCache is not None:
+            sKey = self.__oCache.GetKey(hashlib.sha256(bytesPicture).hexdigest(), dict(dictSettingsKey, format=sFormat))
+            bytesProcessed = self.__oCache.Get(sKey)
+            if bytesProcessed is not None:
+               listResults.append((sDestinationFile, bytesProcessed))
+               continue
+         listToProcess.append((sDestinationFile, sFormat, bytesPicture, sKey))
+      # eof for sSourceFile, sDestinationFile in listPictures:
+
+      # -- process all pictures not found in cache
+      listArguments = [(bytesPicture, sFormat, self.__dictSettings) for sDestinationFile, sFormat, bytesPicture, sKey in listToProcess]
+      if ( (self.__nJobs > 1) and (len(listToProcess) > 1) ):
+         with ProcessPoolExecutor(max_workers=min(self.__nJobs, len(listToProcess))) as oExecutor:
+            listProcessed = list(oExecutor.map(PreprocessPicture, *zip(*listArguments)))
+      else:
+         listProcessed = [PreprocessPicture(*tupleArguments) for tupleArguments in listArguments]
+
+      for (sDestinationFile, sFormat, bytesPicture, sKey), (bytesProcessed, sError) in zip(listToProcess, listProcessed):
+         if sError is not None:
+            print(COLBY + f"Picture '{sDestinationFile}' not processed ({sError})")
+            listResults.append((sDestinationFile, bytesPicture))
+            continue
+         if sKey is not None:
+            bSuccess, sResult = self.__oCache.Put(sKey, bytesProcessed)
+            if bSuccess is not True:
+               return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+         listResults.append((sDestinationFile, bytesProcessed))
+
+      # -- write the processed pictures
+      nSizeAfter = 0
+      for sDestinationFile, bytesProcessed in listResults:
+         nSizeAfter = nSizeAfter + len(bytesProcessed)
+         bSuccess, sResult = oOutputWriter.Write(sDestinationFile, bytesProcessed)
+         if bSuccess is not True:
+            return bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"{len(listResults)} pictures preprocessed ({len(listToProcess)} processed, {len(listResults) - len(listToProcess)} taken from cache); " \
+                 f"size: {nSizeBefore // 1024} KB -> {nSizeAfter // 1024} KB"
+      return bSuccess, sResult
+
+   # eof def Process(self, listPictures=[], oOutputWriter=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPictureProcessor():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,146 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CPlaceholderResolver.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the resolver of placeholders (``###NAME###``) used in configuration values, docstrings and separate rst files.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import re
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPlaceholderResolver():
+   """
+The ``CPlaceholderResolver`` class replaces placeholders (``###NAME###``) by the values of the corresponding variables.
+
+All placeholders are found by a single regular expression and looked up in the variables dictionary. Therefore the effort
+depends on the size of the text only (and not on the number of variables). Only variables with string values are resolved;
+placeholders of unknown variables are kept unchanged. The values themselves are not resolved again.
+   """
+
+   def __init__(self, dictVariables={}):
+      """
+Constructor of class ``CPlaceholderResolver``.
+
+**Arguments:**
+
+* ``dictVariables``
+
+  / *Condition*: required / *Type*: dict /
+
+  The variables (key: name of the variable like used within the placeholder).
+      """
+
+      self.__dictVariables = {}
+      for sName, value in dictVariables.items():
+         if type(value) == str:
+            self.__dictVariables[sName] = value
+      self.__oRegExPlaceholder = re.compile(r"###([^#\s]+)###")
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Resolve(self, sText="", setUsed=None):
+      """
+Resolves all placeholders within ``sText``.
+
+**Arguments:**
+
+* ``sText``
+
+  / *Condition*: required / *Type*: str /
+
+  The text containing placeholders.
+
+* ``setUsed``
+
+  / *Condition*: optional / *Type*: set / *Default*: None /
+
+  If not ``None``, the names of all variables resolved within ``sText`` are added to this set.
+
+**Returns:**
+
+* ``sResolved``
+
+  / *Type*: str /
+
+  The text with all placeholders of known variables replaced by their values.
+      """
+
+      def ResolvePlaceholder(oMatch):
+         sName = oMatch.group(1)
+         if sName not in self.__dictVariables:
+            return oMatch.group(0)
+         if setUsed is not None:
+            setUsed.add(sName)
+         return self.__dictVariables[sName]
+
+      return self.__oRegExPlaceholder.sub(ResolvePlaceholder, sText)
+
+   # eof def Resolve(self, sText="", setUsed=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetUsedVariables(self, sText=""):
+      """
+Computes the variables used within ``sText`` (without resolving the placeholders).
+
+**Arguments:**
+
+* ``sText``
+
+  / *Condition*: required / *Type*: str /
+
+  The text containing placeholders.
+
+**Returns:**
+
+* ``dictUsed``
+
+  / *Type*: dict /
+
+  Names and values of all known variables used within ``sText`` (sorted by name).
+      """
+
+      dictUsed = {}
+      for sName in sorted(set(self.__oRegExPlaceholder.findall(sText))):
+         if sName in self.__dictVariables:
+            dictUsed[sName] = self.__dictVariables[sName]
+      return dictUsed
+
+   # eof def GetUsedVariables(self, sText=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPlaceholderResolver():
+
+# --------------------------------------------------------------------------------------------------------------
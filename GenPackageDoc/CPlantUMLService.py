@@ -0,0 +1,343 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CPlantUMLService.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the client of a long running PlantUML render service (PlantUML 'picoweb' server).
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, time, zlib, socket, subprocess, atexit, queue, http.client
+import colorama as col
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PythonExtensionsCollection.String.CString import CString
+
+col.init(autoreset=True)
+COLBR = col.Style.BRIGHT + col.Fore.RED
+COLBG = col.Style.BRIGHT + col.Fore.GREEN
+COLBY = col.Style.BRIGHT + col.Fore.YELLOW
+
+# alphabet of the PlantUML text encoding (used within the URL of a render request)
+PLANTUMLALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
+
+# diagram used for the health check of the service
+HEALTHCHECKDIAGRAM = "@startuml\nBob -> Alice\n@enduml\n"
+
+# --------------------------------------------------------------------------------------------------------------
+
+def EncodePlantUML(sSource=""):
+   """
+Encodes a diagram source in the PlantUML text encoding (deflate compression, followed by a base64 like encoding with the
+PlantUML alphabet).
+   """
+   bytesCompressed = zlib.compress(sSource.encode("utf-8"), 9)[2:-4] # raw deflate (without zlib header and checksum)
+   listChars = []
+   for nIndex in range(0, len(bytesCompressed), 3):
+      bytesGroup = bytesCompressed[nIndex:nIndex+3] + b"\0\0"
+      b1, b2, b3 = bytesGroup[0], bytesGroup[1], bytesGroup[2]
+      listChars.append(PLANTUMLALPHABET[b1 >> 2])
+      listChars.append(PLANTUMLALPHABET[((b1 & 0x3) << 4) | (b2 >> 4)])
+      listChars.append(PLANTUMLALPHABET[((b2 & 0xF) << 2) | (b3 >> 6)])
+      listChars.append(PLANTUMLALPHABET[b3 & 0x3F])
+   return "".join(listChars)
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CPlantUMLService():
+   """
+The ``CPlantUMLService`` class renders diagrams by requests to a long running PlantUML process (``-picoweb`` mode) listening on
+a loopback port. In case of a service is already listening on the configured port (e.g. started by a previous build or by the user),
+this service is used. Otherwise the service is started with the first render request and stopped by ``Close()``
+(or at the end of the process).
+
+The diagrams are rendered in parallel, using a small pool of persistent connections. The availability of the service is
+checked by rendering a small diagram (health check). In case of the service is not available, the caller has to render
+the diagrams in another way (``java -jar``).
+   """
+
+   def __init__(self, sJava=None, sPlantUML=None, nPort=0, nConnections=4, nTimeout=60):
+      """
+Constructor of class ``CPlantUMLService``.
+
+**Arguments:**
+
+* ``sJava``
+
+  / *Condition*: required / *Type*: str /
+
+  Path and name of the Java executable (required to start the service).
+
+* ``sPlantUML``
+
+  / *Condition*: required / *Type*: str /
+
+  Path and name of the PlantUML jar file (required to start the service).
+
+* ``nPort``
+
+  / *Condition*: optional / *Type*: int / *Default*: 0 /
+
+  Loopback port of the service. ``0`` means: any free port (the service cannot be shared with other builds then).
+
+* ``nConnections``
+
+  / *Condition*: optional / *Type*: int / *Default*: 4 /
+
+  Maximum number of parallel connections to the service.
+
+* ``nTimeout``
+
+  / *Condition*: optional / *Type*: int / *Default*: 60 /
+
+  Timeout in seconds for a single request (and for the start of the service).
+      """
+
+      self.__sJava        = sJava
+      self.__sPlantUML    = sPlantUML
+      self.__nPort        = int(nPort)
+      self.__nConnections = max(1, int(nConnections))
+      self.__nTimeout     = int(nTimeout)
+      self.__oProcess     = None
+      self.__oConnections = queue.Queue() # pool of idle connections
+      self.__bAvailable   = None # None: availability not yet checked
+
+   def __del__(self):
+      self.Close()
+
+   def __getstate__(self):
+      # the service process and the connections belong to the process that started the service
+      dictState = self.__dict__.copy()
+      dictState['_CPlantUMLService__oProcess']     = None
+      dictState['_CPlantUMLService__oConnections'] = queue.Queue()
+      return dictState
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __Request(self, sSource=""):
+      """Sends a single render request to the service (using a connection of the pool). Returns the rendered picture (or ``None``),
+together with an error message (``None`` in case of success) and a flag indicating if the service has answered at all.
+      """
+
+      sPath = f"/plantuml/png/{EncodePlantUML(sSource)}"
+      for nAttempt in (1, 2): # the service may have closed a kept alive connection
+         try:
+            oConnection = self.__oConnections.get_nowait()
+         except queue.Empty:
+            oConnection = http.client.HTTPConnection("127.0.0.1", self.__nPort, timeout=self.__nTimeout)
+         try:
+            oConnection.request("GET", sPath)
+            oResponse = oConnection.getresponse()
+            bytesPicture = oResponse.read()
+         except Exception:
+            oConnection.close()
+            continue
+         self.__oConnections.put(oConnection)
+         sError = oResponse.getheader("X-PlantUML-Diagram-Error")
+         if ( (oResponse.status != 200) or (sError is not None) ):
+            if sError is None:
+               sError = f"HTTP status {oResponse.status}"
+            return None, sError, True
+         return bytesPicture, None, True
+      return None, "PlantUML service not reachable", False
+
+   # eof def __Request(self, sSource=""):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __IsHealthy(self):
+      """Health check: returns ``True`` in case of the service renders a small diagram.
+      """
+      if self.__nPort == 0:
+         return False
+      bytesPicture, sError, bAnswered = self.__Request(HEALTHCHECKDIAGRAM)
+      return ( bytesPicture is not None )
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Start(self):
+      """
+Connects to the service, or starts the service in case of no service is listening on the configured port.
+
+**Returns:**
+
+* ``bAvailable``
+
+  / *Type*: bool /
+
+  ``True`` in case of the service is available.
+      """
+
+      if self.__bAvailable is not None:
+         return self.__bAvailable
+
+      self.__bAvailable = False
+
+      # -- connect to an already running service
+      if self.__IsHealthy() is True:
+         print(f"Using PlantUML service at port {self.__nPort}")
+         print()
+         self.__bAvailable = True
+         return self.__bAvailable
+
+      # -- start an own service
+      if ( (self.__sJava is None) or (os.path.isfile(self.__sJava) is False) or
+           (self.__sPlantUML is None) or (os.path.isfile(self.__sPlantUML) is False) ):
+         print(COLBY + "PlantUML service not available (Java or PlantUML not found)")
+         print()
+         return self.__bAvailable
+
+      nPort = self.__nPort
+      if nPort == 0:
+         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as oSocket:
+            oSocket.bind(("127.0.0.1", 0))
+            nPort = oSocket.getsockname()[1]
+
+      listCmdLineParts = [self.__sJava, "-jar", self.__sPlantUML, f"-picoweb:{nPort}:127.0.0.1"]
+      print("Now starting PlantUML service:\n" + " ".join(listCmdLineParts))
+      print()
+      try:
+         self.__oProcess = subprocess.Popen(listCmdLineParts, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+      except Exception as ex:
+         print(COLBY + f"PlantUML service not available ({ex})")
+         print()
+         self.__oProcess = None
+         return self.__bAvailable
+      atexit.register(self.Close)
+      self.__nPort = nPort
+
+      # health check (the start of the Java VM takes a while)
+      fTimeout = time.time() + self.__nTimeout
+      while time.time() < fTimeout:
+         if self.__oProcess.poll() is not None:
+            break
+         if self.__IsHealthy() is True:
+            self.__bAvailable = True
+            break
+         time.sleep(0.2)
+
+      if self.__bAvailable is not True:
+         print(COLBY + "PlantUML service not available (no response)")
+         print()
+         self.Close()
+
+      return self.__bAvailable
+
+   # eof def Start(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def RenderList(self, listSources=[]):
+      """
+Renders a list of diagram sources (in parallel, limited by the number of connections).
+
+**Arguments:**
+
+* ``listSources``
+
+  / *Condition*: required / *Type*: list /
+
+  The diagram sources (PlantUML code).
+
+**Returns:**
+
+* ``listResults``
+
+  / *Type*: list /
+
+  One tuple ``(bytesPicture, sError)`` for every diagram source (in the order of ``listSources``). ``bytesPicture`` is ``None``
+  in case of the diagram has not been rendered; ``sError`` is ``None`` in case of success. Diagrams with an ``sError``
+  of ``None`` and no picture could not be sent to the service (to be rendered in another way).
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not.
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CPlantUMLService.RenderList"
+
+      if self.Start() is not True:
+         bSuccess = False
+         sResult  = "PlantUML service not available"
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      def RenderSource(sSource):
+         bytesPicture, sError, bAnswered = self.__Request(sSource)
+         if bAnswered is False:
+            sError = None # not rendered, but also not failed
+         return (bytesPicture, sError)
+
+      with ThreadPoolExecutor(max_workers=self.__nConnections) as oExecutor:
+         listResults = list(oExecutor.map(RenderSource, listSources))
+
+      bSuccess = True
+      sResult  = f"{len(listResults)} diagrams sent to PlantUML service"
+      return listResults, bSuccess, sResult
+
+   # eof def RenderList(self, listSources=[]):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Close(self):
+      """
+Closes all connections and stops the service (in case of it has been started by this object).
+      """
+
+      while True:
+         try:
+            self.__oConnections.get_nowait().close()
+         except queue.Empty:
+            break
+      if self.__oProcess is not None:
+         self.__oProcess.terminate()
+         try:
+            self.__oProcess.wait(timeout=5)
+         except Exception:
+            self.__oProcess.kill()
+         self.__oProcess = None
+         self.__bAvailable = None
+
+   # eof def Close(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CPlantUMLService():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,299 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CProcessRunner.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+Python module containing the execution of external tools (Pandoc, PlantUML, LaTeX compiler) with timeouts and resource limits.
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+
+import os, time, signal, subprocess, functools
+
+from PythonExtensionsCollection.String.CString import CString
+
+try:
+   import resource
+except ImportError:
+   resource = None # not available on Windows; resource limits are not supported there
+
+# Default limits of the external tools (see section 'LIMITS' of packagedoc_config.json):
+# TIMEOUT: wall clock time in seconds; MEMORY: address space in MB; CPU: CPU time in seconds (None: no limit)
+DEFAULTLIMITS = {'PANDOC'   : {'TIMEOUT' : 120, 'MEMORY' : None, 'CPU' : None},
+                 'PLANTUML' : {'TIMEOUT' : 600, 'MEMORY' : None, 'CPU' : None},
+                 'LATEX'    : {'TIMEOUT' : 600, 'MEMORY' : None, 'CPU' : None}}
+
+# --------------------------------------------------------------------------------------------------------------
+
+def _SetResourceLimits(nMemory=None, nCPU=None):
+   """
+Sets the resource limits of a child process (executed within the child process before the tool is started; POSIX only).
+   """
+   if nMemory is not None:
+      nBytes = int(nMemory) * 1024 * 1024
+      resource.setrlimit(resource.RLIMIT_AS, (nBytes, nBytes))
+   if nCPU is not None:
+      resource.setrlimit(resource.RLIMIT_CPU, (int(nCPU), int(nCPU) + 1))
+
+# --------------------------------------------------------------------------------------------------------------
+
+class CProcessRunner():
+   """
+The ``CProcessRunner`` class executes external tools with a timeout and with optional resource limits (address space, CPU time).
+The limits are defined per tool (``PANDOC``, ``PLANTUML``, ``LATEX``).
+
+Every tool is started within an own process group. In case of a limit is exceeded, the complete process tree is killed
+(also processes started by the tool itself). The duration of every execution is recorded (``listTimings``).
+   """
+
+   def __init__(self, dictLimits=None):
+      """
+Constructor of class ``CProcessRunner``.
+
+**Arguments:**
+
+* ``dictLimits``
+
+  / *Condition*: optional / *Type*: dict / *Default*: None /
+
+  The limits per tool (see ``DEFAULTLIMITS``). Tools without limits defined here, get the default limits.
+      """
+
+      self.__dictLimits = {}
+      for sTool, dictDefaultLimits in DEFAULTLIMITS.items():
+         self.__dictLimits[sTool] = dict(dictDefaultLimits)
+         if ( (dictLimits is not None) and (dictLimits.get(sTool) is not None) ):
+            self.__dictLimits[sTool].update(dictLimits[sTool])
+      self.listTimings = []
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def __KillProcessTree(self, oProcess=None):
+      """Kills the process together with all processes started by it.
+      """
+      try:
+         if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(oProcess.pid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+         else:
+            os.killpg(oProcess.pid, signal.SIGKILL) # the process is the leader of an own process group
+      except Exception:
+         pass # already terminated
+      try:
+         oProcess.kill()
+      except Exception:
+         pass
+      oProcess.wait()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetTimeout(self, sTool=None):
+      """
+Returns the timeout (in seconds) of the tool ``sTool``.
+      """
+      return self.__dictLimits[sTool]['TIMEOUT']
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Run(self, sTool=None, listCmdLineParts=[], bytesInput=None, hOutputFile=None, sCwd=None, dictEnvironment=None, fnMonitor=None):
+      """
+Executes an external tool within the limits defined for this tool.
+
+**Arguments:**
+
+* ``sTool``
+
+  / *Condition*: required / *Type*: str /
+
+  The tool (``PANDOC``, ``PLANTUML`` or ``LATEX``); defines the limits.
+
+* ``listCmdLineParts``
+
+  / *Condition*: required / *Type*: list /
+
+  The command line.
+
+* ``bytesInput``
+
+  / *Condition*: optional / *Type*: bytes / *Default*: None /
+
+  Input of the tool (standard input). Without input the standard input is closed (the tool cannot wait for user input).
+  Not possible together with ``fnMonitor``.
+
+* ``hOutputFile``
+
+  / *Condition*: optional / *Type*: file / *Default*: None /
+
+  File receiving standard output and standard error of the tool. Without file both are captured.
+
+* ``sCwd``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Working directory of the tool.
+
+* ``dictEnvironment``
+
+  / *Condition*: optional / *Type*: dict / *Default*: None /
+
+  Environment of the tool.
+
+* ``fnMonitor``
+
+  / *Condition*: optional / *Type*: function / *Default*: None /
+
+  Function called periodically while the tool is running. In case of the function returns ``True``, the tool is stopped.
+  Requires ``hOutputFile`` (the output of the tool is not captured in this case).
+
+**Returns:**
+
+* ``oProcess``
+
+  / *Type*: subprocess.CompletedProcess /
+
+  Return code and captured output of the tool (``None`` in case of the tool could not be started).
+
+* ``bSuccess``
+
+  / *Type*: bool /
+
+  Indicates if the computation of the method ``sMethod`` was successful or not. ``False`` in case of a limit is exceeded
+  (the return code of the tool itself has to be evaluated by the caller).
+
+* ``sResult``
+
+  / *Type*: str /
+
+  The result of the computation of the method ``sMethod``.
+      """
+
+      sMethod = "CProcessRunner.Run"
+
+      dictLimits = self.__dictLimits[sTool]
+      nTimeout   = dictLimits['TIMEOUT']
+
+      dictOptions = {}
+      if os.name == "nt":
+         dictOptions['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+      else:
+         dictOptions['start_new_session'] = True
+         if ( (resource is not None) and ( (dictLimits['MEMORY'] is not None) or (dictLimits['CPU'] is not None) ) ):
+            dictOptions['preexec_fn'] = functools.partial(_SetResourceLimits, dictLimits['MEMORY'], dictLimits['CPU'])
+      if hOutputFile is None:
+         dictOptions['stdout'] = subprocess.PIPE
+         dictOptions['stderr'] = subprocess.PIPE
+      else:
+         dictOptions['stdout'] = hOutputFile
+         dictOptions['stderr'] = subprocess.STDOUT
+
+      sStatus = "done"
+      bytesOutput, bytesError = None, None
+      fStart = time.time()
+      try:
+         oProcess = subprocess.Popen(listCmdLineParts, stdin=subprocess.PIPE if bytesInput is not None else subprocess.DEVNULL,
+                                     cwd=sCwd, env=dictEnvironment, **dictOptions)
+      except Exception as ex:
+         self.listTimings.append({'TOOL' : sTool, 'COMMAND' : listCmdLineParts[0], 'DURATION' : time.time() - fStart, 'RETURNCODE' : None, 'STATUS' : "not started"})
+         bSuccess = None
+         sResult  = str(ex)
+         return None, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      try:
+         if fnMonitor is None:
+            bytesOutput, bytesError = oProcess.communicate(bytesInput, timeout=nTimeout)
+         else:
+            while oProcess.poll() is None:
+               if ( (nTimeout is not None) and (time.time() - fStart > nTimeout) ):
+                  raise subprocess.TimeoutExpired(listCmdLineParts, nTimeout)
+               if fnMonitor() is True:
+                  self.__KillProcessTree(oProcess)
+                  sStatus = "stopped"
+                  break
+               time.sleep(0.1)
+      except subprocess.TimeoutExpired:
+         self.__KillProcessTree(oProcess)
+         if fnMonitor is None:
+            bytesOutput, bytesError = oProcess.communicate()
+         sStatus = "timeout"
+      finally:
+         if oProcess.poll() is None:
+            self.__KillProcessTree(oProcess) # e.g. interrupted by the user
+      fDuration = time.time() - fStart
+
+      nReturn = oProcess.returncode
+      if ( (sStatus == "done") and (dictLimits['CPU'] is not None) and (nReturn in (-getattr(signal, "SIGXCPU", 0), -signal.SIGKILL)) ):
+         sStatus = "cpu limit"
+
+      self.listTimings.append({'TOOL' : sTool, 'COMMAND' : listCmdLineParts[0], 'DURATION' : fDuration, 'RETURNCODE' : nReturn, 'STATUS' : sStatus})
+
+      oCompletedProcess = subprocess.CompletedProcess(listCmdLineParts, nReturn, bytesOutput, bytesError)
+      if sStatus == "timeout":
+         bSuccess = False
+         sResult  = f"{sTool}: process tree killed after timeout of {nTimeout} s ('{' '.join(listCmdLineParts)}')"
+         return oCompletedProcess, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+      if sStatus == "cpu limit":
+         bSuccess = False
+         sResult  = f"{sTool}: process tree killed after CPU time limit of {dictLimits['CPU']} s ('{' '.join(listCmdLineParts)}')"
+         return oCompletedProcess, bSuccess, CString.FormatResult(sMethod, bSuccess, sResult)
+
+      bSuccess = True
+      sResult  = f"{sTool} returned {nReturn} after {fDuration:.2f} s"
+      return oCompletedProcess, bSuccess, sResult
+
+   # eof def Run(self, sTool=None, listCmdLineParts=[], bytesInput=None, hOutputFile=None, sCwd=None, dictEnvironment=None, fnMonitor=None):
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetTimingSummary(self):
+      """
+Returns a summary of the recorded timings (one line per tool: number of executions, total and maximum duration, number of limit breaches).
+      """
+      listLines = []
+      for sTool in DEFAULTLIMITS:
+         listTimings = [dictTiming for dictTiming in self.listTimings if dictTiming['TOOL'] == sTool]
+         if len(listTimings) == 0:
+            continue
+         fTotal    = sum([dictTiming['DURATION'] for dictTiming in listTimings])
+         fMax      = max([dictTiming['DURATION'] for dictTiming in listTimings])
+         nBreaches = len([dictTiming for dictTiming in listTimings if dictTiming['STATUS'] in ("timeout", "cpu limit")])
+         sLine = f"{sTool:<8} : {len(listTimings)} call(s), {fTotal:.2f} s total, {fMax:.2f} s max"
+         if nBreaches > 0:
+            sLine = f"{sLine}, {nBreaches} limit(s) exceeded"
+         listLines.append(sLine)
+      return listLines
+
+   # eof def GetTimingSummary(self):
+
+   # --------------------------------------------------------------------------------------------------------------
+
+# eof class CProcessRunner():
+
+# --------------------------------------------------------------------------------------------------------------
@@ -26,17 +26,13 @@
 #
 # --------------------------------------------------------------------------------------------------------------
 
-import os, sys
+import os, sys, argparse
 
 import colorama as col
 
 # prefer the repository local version of all additional libraries (instead of the installed version under site-packages)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "./additions")))
 
-from config.CRepositoryConfig import CRepositoryConfig # providing repository and environment specific information
-from GenPackageDoc.CPackageDocConfig import CPackageDocConfig
-from GenPackageDoc.CDocBuilder import CDocBuilder
-
 col.init(autoreset=True)
 
 COLBR = col.Style.BRIGHT + col.Fore.RED
@@ -54,8 +50,83 @@ def printerror(sMsg):
 def printexception(sMsg):
     sys.stderr.write(COLBR + f"Exception: {sMsg}!\n")
 
+def exitwithresult(bSuccess, sResult):
+    if bSuccess is None:
+        print()
+        printexception(sResult)
+        print()
+        sys.exit(ERROR)
+    elif bSuccess is False:
+        print()
+        printerror(sResult)
+        print()
+        sys.exit(ERROR)
+    else:
+        print(COLBY + sResult)
+        print()
+        print(COLBG + "genpackagedoc done")
+        print()
+        sys.exit(SUCCESS)
+
 # --------------------------------------------------------------------------------------------------------------
 
+# -- the command line parameters of build daemon and batch mode are evaluated first (all other parameters belong to the build)
+oDaemonArgsParser = argparse.ArgumentParser(add_help=False)
+oDaemonArgsParser.add_argument('--daemon', type=str)
+oDaemonArgsParser.add_argument('--workers', type=int, default=2)
+oDaemonArgsParser.add_argument('--usedaemon', type=str)
+oDaemonArgsParser.add_argument('--batch', type=str, nargs='+')
+oDaemonArgs, listCmdLineArgs = oDaemonArgsParser.parse_known_args()
+if len([oArg for oArg in (oDaemonArgs.daemon, oDaemonArgs.usedaemon, oDaemonArgs.batch) if oArg is not None]) > 1:
+    print()
+    printerror("The command line parameters --daemon, --usedaemon and --batch cannot be combined")
+    print()
+    sys.exit(ERROR)
+
+# -- sending the build to a running build daemon (the documentation builder is not imported in this case)
+if oDaemonArgs.usedaemon is not None:
+    from GenPackageDoc.CDaemonClient import CDaemonClient
+    oDaemonClient = CDaemonClient(oDaemonArgs.usedaemon)
+    dictResult, bSuccess, sResult = oDaemonClient.Build(os.path.dirname(os.path.abspath(sys.argv[0])), listCmdLineArgs)
+    if dictResult is not None:
+        print(dictResult['STDOUT'], end='')
+        sys.stderr.write(dictResult['STDERR'])
+        exitwithresult(dictResult['SUCCESS'], dictResult['RESULT'])
+    # daemon not available: the documentation is built by this process
+    print(COLBY + f"{sResult}; building locally")
+    print()
+
+from config.CRepositoryConfig import CRepositoryConfig # providing repository and environment specific information
+from GenPackageDoc.CPackageDocConfig import CPackageDocConfig
+from GenPackageDoc.CDocBuilder import CDocBuilder
+from GenPackageDoc.CDocWatcher import CDocWatcher
+from GenPackageDoc.CBuildDaemon import CBuildDaemon
+from GenPackageDoc.CBatchBuilder import CBatchBuilder
+
+# -- running as build daemon (the repository configuration is set up per build request)
+if oDaemonArgs.daemon is not None:
+    try:
+        oBuildDaemon = CBuildDaemon(CRepositoryConfig, oDaemonArgs.daemon, oDaemonArgs.workers)
+    except Exception as ex:
+        print()
+        printexception(str(ex))
+        print()
+        sys.exit(ERROR)
+    bSuccess, sResult = oBuildDaemon.Run()
+    exitwithresult(bSuccess, sResult)
+
+# -- building the documentation of several repositories (the repository configurations are set up per repository)
+if oDaemonArgs.batch is not None:
+    try:
+        oBatchBuilder = CBatchBuilder(CRepositoryConfig, oDaemonArgs.batch, listCmdLineArgs, oDaemonArgs.workers)
+    except Exception as ex:
+        print()
+        printexception(str(ex))
+        print()
+        sys.exit(ERROR)
+    bSuccess, sResult = oBatchBuilder.Build()
+    exitwithresult(bSuccess, sResult)
+
 # -- setting up the repository configuration (relative to the path of this script)
 oRepositoryConfig = None
 try:
@@ -69,7 +140,7 @@ except Exception as ex:
 # -- setting up the GenPackageDoc configuration
 oPackageDocConfig = None
 try:
-    oPackageDocConfig = CPackageDocConfig(oRepositoryConfig)
+    oPackageDocConfig = CPackageDocConfig(oRepositoryConfig, listCmdLineArgs)
 except Exception as ex:
     print()
     printexception(str(ex))
@@ -85,23 +156,13 @@ except Exception as ex:
     print()
     sys.exit(ERROR)
 
-bSuccess, sResult = oDocBuilder.Build()
-if bSuccess is None:
-    print()
-    printexception(sResult)
-    print()
-    sys.exit(ERROR)
-elif bSuccess is False:
-    print()
-    printerror(sResult)
-    print()
-    sys.exit(ERROR)
+if oPackageDocConfig.Get('bWatch') is True:
+    # the documentation is rebuilt whenever a source file changes (until the process is stopped)
+    oDocWatcher = CDocWatcher(oRepositoryConfig, oPackageDocConfig, oDocBuilder)
+    bSuccess, sResult = oDocWatcher.Run()
 else:
-   print(COLBY + sResult)
-   print()
-   print(COLBG + "genpackagedoc done")
-   print()
-   sys.exit(SUCCESS)
+    bSuccess, sResult = oDocBuilder.Build()
+exitwithresult(bSuccess, sResult)
 
 # --------------------------------------------------------------------------------------------------------------
 
@@ -35,7 +35,6 @@
 
 import os, sys, platform, shlex, subprocess, json
 import colorama as col
-import pypandoc
 
 from PythonExtensionsCollection.String.CString import CString
 
@@ -108,14 +107,6 @@ class CRepositoryConfig():
 
         sInstalledPackageFolder = None
 
-        try:
-            # try to access pandoc; if not installed we detect this already here as early as possible
-            pypandoc.get_pandoc_path()
-        except Exception as ex:
-            bSuccess = False
-            sResult  = str(ex)
-            return bSuccess, sResult
-
         if sPlatformSystem == "Windows":
             sInstalledPackageFolder = f"{sPythonPath}/Lib/site-packages/" + self.__dictRepositoryConfig['PACKAGENAME']
         elif sPlatformSystem == "Linux":
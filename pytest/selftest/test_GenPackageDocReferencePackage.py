@@ -22,13 +22,28 @@
 # --------------------------------------------------------------------------------------------------------------
 
 # -- import standard Python modules
-import os, sys, time, platform, pytest, shlex, subprocess
+import os, sys, time, platform, pytest, shlex, subprocess, re, tempfile
 
 # -- import own Python modules
 from PythonExtensionsCollection.String.CString import CString
 
 # --------------------------------------------------------------------------------------------------------------
 
+def NormalizeTeX(sTEX=""):
+   """Removes all differences between tex files that are accepted between the conversion engines
+(time stamps, picture options, syntax highlighting tokens, list spacing, line breaks).
+   """
+   sTEX = "\n".join([sLine for sLine in sTEX.splitlines() if not sLine.startswith("% Generated at")])
+   sTEX = re.sub(r"Created at [0-9.: -]+", "", sTEX)
+   sTEX = re.sub(r"\\includegraphics\[[^\]]*\]", r"\\includegraphics", sTEX)
+   sTEX = re.sub(r"\\pandocbounded\{(\\includegraphics\{[^{}]*\})\}", r"\1", sTEX)
+   sTEX = re.sub(r"\\[A-Za-z]+Tok\{((?:[^{}]|\{[^{}]*\})*)\}", r"\1", sTEX)
+   sTEX = sTEX.replace("\\tightlist", "")
+   sTEX = re.sub(r"\s+", " ", sTEX).strip()
+   return sTEX
+
+# --------------------------------------------------------------------------------------------------------------
+
 class Test_GenPackageDocReferencePackage:
    """Tests of component GenPackageDoc (ReferencePackage)."""
 
@@ -52,6 +67,86 @@ class Test_GenPackageDocReferencePackage:
       nReturn = subprocess.call(listCmdLineParts)
       assert nReturn == 0
 
+   # --------------------------------------------------------------------------------------------------------------
+
+   @pytest.mark.parametrize(
+      "Description", ["Compare the tex files generated by the conversion engines 'pandoc' and 'docutils'",]
+   )
+   def test_GenPackageDocReferencePackage_2(self, Description):
+      """pytest 'GenPackageDoc'"""
+
+      pytest.importorskip("docutils")
+
+      sPython         = CString.NormalizePath(sys.executable)
+      sSelftestFolder = os.path.dirname(os.path.realpath(__file__))
+      sGenPackageDoc  = CString.NormalizePath(f"{sSelftestFolder}/reference-package-test/genpackagedoc.py")
+
+      with tempfile.TemporaryDirectory() as sTempFolder:
+         dictOutputFolders = {}
+         for sEngine in ("pandoc", "docutils"):
+            sOutputFolder = CString.NormalizePath(f"{sTempFolder}/{sEngine}")
+            listCmdLineParts = []
+            listCmdLineParts.append(f"\"{sPython}\"")
+            listCmdLineParts.append(f"\"{sGenPackageDoc}\"")
+            listCmdLineParts.append("--simulateonly")
+            listCmdLineParts.append(f"--engine {sEngine}")
+            listCmdLineParts.append(f"--output \"{sOutputFolder}\"")
+            sCmdLine = " ".join(listCmdLineParts)
+            listCmdLineParts = shlex.split(sCmdLine)
+            nReturn = subprocess.call(listCmdLineParts)
+            assert nReturn == 0
+            dictOutputFolders[sEngine] = sOutputFolder
+
+         listTeXFiles = sorted([sFile for sFile in os.listdir(dictOutputFolders['pandoc']) if sFile.endswith(".tex")])
+         assert len(listTeXFiles) > 0
+         for sTeXFile in listTeXFiles:
+            with open(f"{dictOutputFolders['pandoc']}/{sTeXFile}", encoding="utf-8") as hTeXFile:
+               sPandocTEX = NormalizeTeX(hTeXFile.read())
+            with open(f"{dictOutputFolders['docutils']}/{sTeXFile}", encoding="utf-8") as hTeXFile:
+               sDocutilsTEX = NormalizeTeX(hTeXFile.read())
+            assert sDocutilsTEX == sPandocTEX, f"tex files differ: {sTeXFile}"
+
+   # --------------------------------------------------------------------------------------------------------------
+
+   @pytest.mark.parametrize(
+      "Description", ["Call GenPackageDoc two times in reproducible mode and compare the generated files",]
+   )
+   def test_GenPackageDocReferencePackage_3(self, Description):
+      """pytest 'GenPackageDoc'"""
+
+      sPython         = CString.NormalizePath(sys.executable)
+      sSelftestFolder = os.path.dirname(os.path.realpath(__file__))
+      sGenPackageDoc  = CString.NormalizePath(f"{sSelftestFolder}/reference-package-test/genpackagedoc.py")
+
+      with tempfile.TemporaryDirectory() as sTempFolder:
+         listOutputFolders = []
+         for nBuild in range(2):
+            sOutputFolder = CString.NormalizePath(f"{sTempFolder}/build_{nBuild}")
+            listCmdLineParts = []
+            listCmdLineParts.append(f"\"{sPython}\"")
+            listCmdLineParts.append(f"\"{sGenPackageDoc}\"")
+            listCmdLineParts.append("--simulateonly")
+            listCmdLineParts.append("--reproducible")
+            listCmdLineParts.append(f"--output \"{sOutputFolder}\"")
+            sCmdLine = " ".join(listCmdLineParts)
+            listCmdLineParts = shlex.split(sCmdLine)
+            if nBuild > 0:
+               time.sleep(1) # the timestamps would differ in normal mode
+            nReturn = subprocess.call(listCmdLineParts)
+            assert nReturn == 0
+            listOutputFolders.append(sOutputFolder)
+
+         # (the configuration dumps contain the path to the output folder and therefore are not compared)
+         listFiles = sorted([sFile for sFile in os.listdir(listOutputFolders[0]) if os.path.splitext(sFile)[1] in (".tex", ".sty")])
+         listFiles.extend([f"styles/{sFile}" for sFile in sorted(os.listdir(f"{listOutputFolders[0]}/styles"))])
+         assert len(listFiles) > 0
+         for sFile in listFiles:
+            with open(f"{listOutputFolders[0]}/{sFile}", "rb") as hFile:
+               bytesFirst = hFile.read()
+            with open(f"{listOutputFolders[1]}/{sFile}", "rb") as hFile:
+               bytesSecond = hFile.read()
+            assert bytesFirst == bytesSecond, f"files differ: {sFile}"
+
 # eof class Test_GenPackageDocReferencePackage:
 
 # --------------------------------------------------------------------------------------------------------------